@@ -0,0 +1,73 @@
+"""
+내용 주소(SHA-256) 자산 저장소.
+- 같은 내용의 파일은 blobs/<h[0:2]>/<h[2:4]>/<sha256>.<ext> 하나만 저장 (해시 앞자리로 디렉터리 분산), asset_blobs.sha256 UNIQUE
+- assets 행은 업로드마다 따로 (원본명·MIME 유지), file_path는 공유 blob 경로, content_hash로 blob 참조
+- blob 경로에는 /temp/가 없으므로 글·프로젝트·경력 저장 시 temp 자산 이동 대상이 아님 (경로 불변)
+- 함수는 모두 동기 (업로드 라우터가 스레드풀에서 호출)
+"""
+import re
+from pathlib import Path
+
+from sqlalchemy import text
+
+from apps.api.core.config import UPLOAD_DIR
+from apps.api.core.upload_stream import StreamedUpload, discard, move_into_place
+
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def is_sha256(value: str | None) -> bool:
+    return bool(value) and _SHA256_RE.match(value) is not None
+
+
+def blob_rel_path(sha256: str, ext: str) -> str:
+    return f"blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}.{ext}"
+
+
+def find_blob(db, sha256: str) -> tuple[str, int] | None:
+    """sha256 → (file_path, size_bytes). 행이 있어도 파일이 없으면 None (재업로드로 복구)."""
+    row = db.execute(
+        text("SELECT file_path, size_bytes FROM asset_blobs WHERE sha256 = :h"),
+        {"h": sha256},
+    ).fetchone()
+    if not row or not (Path(UPLOAD_DIR) / row[0]).is_file():
+        return None
+    return row[0], int(row[1])
+
+
+def store_blob(db, upload: StreamedUpload, ext: str) -> str:
+    """수신한 임시 파일을 blob으로 저장하고 file_path 반환. 같은 내용이 이미 있으면 임시 파일을 버리고 기존 경로 사용.
+    blob 행은 파일을 제자리에 둔 뒤 기록 (행이 보이면 파일도 있음)."""
+    row = db.execute(
+        text("SELECT file_path FROM asset_blobs WHERE sha256 = :h"),
+        {"h": upload.sha256},
+    ).fetchone()
+    if row:
+        rel_path = row[0]
+        if (Path(UPLOAD_DIR) / rel_path).is_file():
+            discard(upload)
+        else:
+            # 행만 남고 파일이 사라진 경우: 같은 경로에 복구
+            move_into_place(upload, Path(UPLOAD_DIR) / rel_path)
+        return rel_path
+
+    rel_path = blob_rel_path(upload.sha256, ext)
+    # 같은 내용이므로 동시 업로드가 같은 경로를 덮어써도 무해
+    move_into_place(upload, Path(UPLOAD_DIR) / rel_path)
+    inserted = db.execute(
+        text("""
+            INSERT IGNORE INTO asset_blobs (sha256, file_path, size_bytes)
+            VALUES (:h, :file_path, :size_bytes)
+        """),
+        {"h": upload.sha256, "file_path": rel_path, "size_bytes": upload.size},
+    ).rowcount
+    if not inserted:
+        # 동시 업로드가 다른 확장자로 먼저 등록: 그쪽 경로 사용
+        existing = db.execute(
+            text("SELECT file_path FROM asset_blobs WHERE sha256 = :h"),
+            {"h": upload.sha256},
+        ).scalar()
+        if existing and existing != rel_path:
+            (Path(UPLOAD_DIR) / rel_path).unlink(missing_ok=True)
+            rel_path = existing
+    return rel_path
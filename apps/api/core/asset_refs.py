@@ -0,0 +1,61 @@
+"""
+게시글 본문 ↔ 자산 참조 색인 (post_asset_refs).
+- 저장되는 content_html에서 /static/uploads/ 경로를 한 번 추출해 assets.file_path 인덱스로 id 조회
+- 글별 참조 집합은 차이만 반영 (DELETE ... IN, 다중 행 INSERT)
+- temp 자산 이동·"이 자산을 쓰는 글" 조회가 전체 assets LIKE 스캔 없이 참조 집합만 대상으로 동작
+"""
+import re
+from urllib.parse import unquote
+
+from sqlalchemy import bindparam, text
+
+# src/href 등에 상대·절대 URL로 들어간 업로드 경로 (쿼리스트링·프래그먼트 제외)
+_UPLOAD_URL_RE = re.compile(r"""/static/uploads/([^"'\s<>()?#]+)""")
+
+
+def extract_upload_paths(content_html: str | None) -> set[str]:
+    """본문에서 참조하는 업로드 상대 경로(assets.file_path 형식) 집합."""
+    if not content_html:
+        return set()
+    paths = set()
+    for m in _UPLOAD_URL_RE.finditer(content_html.replace("\\", "/")):
+        path = unquote(m.group(1)).strip("/")
+        if path:
+            paths.add(path)
+    return paths
+
+
+def resolve_assets(db, paths: set[str]) -> list[tuple[int, str]]:
+    """경로 집합 → [(asset_id, file_path)] (idx_assets_file_path IN 조회 1회)."""
+    if not paths:
+        return []
+    rows = db.execute(
+        text("SELECT id, file_path FROM assets WHERE file_path IN :paths").bindparams(
+            bindparam("paths", expanding=True)
+        ),
+        {"paths": sorted(paths)},
+    ).fetchall()
+    return [(r[0], r[1]) for r in rows]
+
+
+def sync_post_asset_refs(db, post_id: int, asset_ids: set[int]) -> None:
+    """글의 본문 참조 자산 집합을 asset_ids로 맞춤 (차이만 반영). 커밋은 호출 측."""
+    current = {
+        r[0] for r in db.execute(
+            text("SELECT asset_id FROM post_asset_refs WHERE post_id = :pid"), {"pid": post_id}
+        ).fetchall()
+    }
+    removed = current - asset_ids
+    added = asset_ids - current
+    if removed:
+        db.execute(
+            text("DELETE FROM post_asset_refs WHERE post_id = :pid AND asset_id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"pid": post_id, "ids": sorted(removed)},
+        )
+    if added:
+        db.execute(
+            text("INSERT INTO post_asset_refs (post_id, asset_id) VALUES (:pid, :aid)"),
+            [{"pid": post_id, "aid": aid} for aid in sorted(added)],
+        )
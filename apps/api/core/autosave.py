@@ -0,0 +1,172 @@
+"""
+글 자동 저장 버퍼 (PATCH /api/posts/{id}/autosave).
+- 편집 중인 글의 본문(클라이언트 기준 텍스트)과 해시를 메모리에 보관, 요청은 이 본문에 대한 splice 패치만 전송
+- 연속 요청은 합쳐서 마지막 요청 후 AUTOSAVE_DEBOUNCE_SECONDS(최대 AUTOSAVE_MAX_DELAY_SECONDS) 뒤 1회 DB 반영
+- DB 반영은 posts 라우터가 등록한 writer가 수행 (본문 컬럼만). 반영 조건은 마지막으로 알고 있는 posts.content_hash —
+  그 사이 전체 저장(PUT)이 있었으면 자동 저장분은 버리고 세션 종료 (전체 저장 우선)
+- 반영 후에도 AUTOSAVE_SESSION_TTL_SECONDS 동안 본문을 유지해 다음 패치의 기준으로 사용
+- 서버 종료 시(main.lifespan) 남은 변경 flush
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from apps.api.core.config import (
+    AUTOSAVE_DEBOUNCE_SECONDS,
+    AUTOSAVE_MAX_DELAY_SECONDS,
+    AUTOSAVE_SESSION_TTL_SECONDS,
+)
+from apps.api.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# flush 스레드 최대 대기(초)
+_TICK_SECONDS = 1.0
+
+
+@dataclass
+class AutosaveSession:
+    content_html: str | None
+    content_json: str | None
+    content_hash: str
+    # DB posts.content_hash (반영 조건). 자동 저장 반영 후에는 반영한 값
+    stored_hash: str | None
+    # 미반영 변경이 처음 생긴 시각 (monotonic, None=반영 완료)
+    dirty_since: float | None = None
+    touched: float = 0.0
+
+
+class AutosaveBuffer:
+    def __init__(
+        self,
+        debounce: float = AUTOSAVE_DEBOUNCE_SECONDS,
+        max_delay: float = AUTOSAVE_MAX_DELAY_SECONDS,
+        ttl: float = AUTOSAVE_SESSION_TTL_SECONDS,
+    ):
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._post_locks: dict[int, threading.Lock] = {}
+        self._sessions: dict[int, AutosaveSession] = {}
+        self._writer = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def set_writer(self, fn) -> None:
+        """fn(db, post_id, session) -> bool — 본문 반영(커밋 포함). False면 충돌(전체 저장이 먼저 반영됨)."""
+        self._writer = fn
+
+    @contextmanager
+    def editing(self, post_id: int):
+        """글 단위 잠금 (패치 적용·반영·초기화 직렬화). 잠금 안에서 현재 세션(없으면 None)을 돌려줌."""
+        with self._lock:
+            lock = self._post_locks.setdefault(post_id, threading.Lock())
+        with lock:
+            with self._lock:
+                session = self._sessions.get(post_id)
+            yield session
+
+    def stage(self, post_id: int, content_html: str | None, content_json: str | None,
+              content_hash: str, stored_hash: str | None) -> None:
+        """패치 적용 결과 보관 (editing 잠금 안에서 호출). 반영은 flush 스레드가 지연 수행."""
+        now = time.monotonic()
+        with self._lock:
+            prev = self._sessions.get(post_id)
+            dirty_since = None
+            if content_hash != stored_hash:
+                dirty_since = prev.dirty_since if prev and prev.dirty_since is not None else now
+            self._sessions[post_id] = AutosaveSession(
+                content_html=content_html,
+                content_json=content_json,
+                content_hash=content_hash,
+                stored_hash=stored_hash,
+                dirty_since=dirty_since,
+                touched=now,
+            )
+
+    def reset(self, post_id: int, content_html: str | None, content_json: str | None, content_hash: str) -> None:
+        """전체 저장(PUT) 반영 후 호출: 미반영 자동 저장분을 버리고 저장된 본문을 다음 패치 기준으로."""
+        with self.editing(post_id):
+            with self._lock:
+                self._sessions[post_id] = AutosaveSession(
+                    content_html=content_html,
+                    content_json=content_json,
+                    content_hash=content_hash,
+                    stored_hash=content_hash,
+                    touched=time.monotonic(),
+                )
+
+    def discard(self, post_id: int) -> None:
+        """글 삭제·리비전 복원 등 본문이 외부에서 바뀐 경우 세션 제거."""
+        with self.editing(post_id):
+            with self._lock:
+                self._sessions.pop(post_id, None)
+
+    def _due(self, force: bool) -> list[int]:
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for post_id, s in list(self._sessions.items()):
+                if s.dirty_since is None:
+                    if now - s.touched >= self.ttl:
+                        del self._sessions[post_id]
+                    continue
+                if force or now - s.touched >= self.debounce or now - s.dirty_since >= self.max_delay:
+                    due.append(post_id)
+        return due
+
+    def _flush_one(self, post_id: int) -> None:
+        with self.editing(post_id) as session:
+            if session is None or session.dirty_since is None or self._writer is None:
+                return
+            db = SessionLocal()
+            try:
+                written = self._writer(db, post_id, session)
+            except Exception as e:
+                db.rollback()
+                # 세션은 dirty 유지 → 다음 주기에 재시도
+                logger.warning("자동 저장 반영 실패 (재시도 예정) post_id=%s: %s", post_id, e)
+                return
+            finally:
+                db.close()
+            with self._lock:
+                if written:
+                    session.stored_hash = session.content_hash
+                    session.dirty_since = None
+                    session.touched = time.monotonic()
+                else:
+                    logger.info("자동 저장 폐기 (전체 저장이 먼저 반영됨) post_id=%s", post_id)
+                    self._sessions.pop(post_id, None)
+
+    def flush(self, force: bool = False) -> None:
+        """반영 시점이 된(force면 전부) 자동 저장분을 DB에 반영."""
+        for post_id in self._due(force):
+            self._flush_one(post_id)
+
+    def _run(self) -> None:
+        while not self._stop.wait(_TICK_SECONDS):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.exception("자동 저장 flush 스레드 오류: %s", e)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="autosave-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """flush 스레드 종료 후 남은 자동 저장분 최종 반영."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush(force=True)
+
+
+autosave_buffer = AutosaveBuffer()
@@ -0,0 +1,123 @@
+"""
+공개 조회 API 응답 캐시 (프로세스 내 LRU + TTL).
+- 키: 라우트 이름 + 쿼리 파라미터, 값: 핸들러가 반환하는 dict/list
+- 태그 단위 무효화: 쓰기 핸들러가 커밋 후 invalidate("posts") 등 호출
+- 없는 id에 대한 404도 짧은 TTL로 음성 캐시
+- 무효화와 동시에 진행 중이던 로드 결과는 저장하지 않음 (태그 버전 비교)
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from starlette.exceptions import HTTPException
+
+from apps.api.core.config import (
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_NEGATIVE_TTL_SECONDS,
+    RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+@dataclass
+class _Entry:
+    value: object
+    expires_at: float
+    tags: tuple[str, ...]
+    not_found: str | None = None  # 음성 캐시: 404 detail
+
+
+def cache_key(name: str, **params) -> tuple:
+    """라우트 이름 + 파라미터(정렬)로 캐시 키 생성."""
+    return (name, tuple(sorted(params.items())))
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        ttl: float = RESPONSE_CACHE_TTL_SECONDS,
+        negative_ttl: float = RESPONSE_CACHE_NEGATIVE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._tag_keys: dict[str, set] = {}
+        self._tag_versions: dict[str, int] = {}
+        self._stats = {"hits": 0, "misses": 0, "negative_hits": 0, "evictions": 0, "invalidations": 0}
+
+    def _drop_locked(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    def get_or_set(self, key: tuple, tags: tuple[str, ...], loader, ttl: float | None = None):
+        """캐시 히트면 저장값 반환(음성 캐시면 404 재발생), 미스면 loader() 결과를 저장 후 반환."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                if entry.not_found is not None:
+                    self._stats["negative_hits"] += 1
+                    raise HTTPException(status_code=404, detail=entry.not_found)
+                self._stats["hits"] += 1
+                return entry.value
+            if entry is not None:
+                self._drop_locked(key)
+            self._stats["misses"] += 1
+            versions = tuple(self._tag_versions.get(t, 0) for t in tags)
+        try:
+            value = loader()
+        except HTTPException as e:
+            if e.status_code == 404:
+                self._store(key, tags, versions, _Entry(None, time.monotonic() + self.negative_ttl, tags, e.detail))
+            raise
+        self._store(key, tags, versions, _Entry(value, time.monotonic() + (ttl or self.ttl), tags))
+        return value
+
+    def _store(self, key: tuple, tags: tuple[str, ...], versions: tuple[int, ...], entry: _Entry) -> None:
+        with self._lock:
+            if versions != tuple(self._tag_versions.get(t, 0) for t in tags):
+                return  # 로드 중 무효화됨: 오래된 값 저장 안 함
+            self._drop_locked(key)
+            self._entries[key] = entry
+            for tag in tags:
+                self._tag_keys.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop_locked(oldest)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, *tags: str) -> None:
+        """태그가 붙은 캐시 항목 전부 제거."""
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+                for key in list(self._tag_keys.get(tag, ())):
+                    self._drop_locked(key)
+                self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for tag in list(self._tag_keys):
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            self._entries.clear()
+            self._tag_keys.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["negative_hits"] + self._stats["misses"]
+            hit_ratio = (self._stats["hits"] + self._stats["negative_hits"]) / lookups if lookups else 0.0
+            return {**self._stats, "entries": len(self._entries), "hit_ratio": round(hit_ratio, 4)}
+
+
+response_cache = ResponseCache()
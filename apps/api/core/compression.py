@@ -0,0 +1,191 @@
+"""
+응답 압축 (Accept-Encoding 협상: br > gzip).
+- CompressionMiddleware: JSON·텍스트 등 압축 가능한 응답을 협상된 인코딩으로 압축. 스트리밍 응답은 청크 단위로 스트림 압축
+- 이미 Content-Encoding이 있는 응답(미리 압축해 둔 글 본문 등)은 그대로 통과
+- 압축한 응답(과 협상된 요청의 304)의 strong ETag는 weak(W/)로 바꿈: 같은 strong ETag가 인코딩별로 다른 바이트를
+  가리키지 않도록. If-None-Match는 weak 비교(http_cache)라 재검증은 그대로 동작
+- encode_stored(): 저장 시 1회 압축용 (요청마다 압축할 때보다 높은 수준)
+- brotli 패키지가 없으면 gzip만 사용
+"""
+import gzip
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만
+    brotli = None
+
+# 이보다 작은 응답은 압축하지 않음 (헤더·CPU 대비 이득 없음)
+MIN_COMPRESS_SIZE = 1024
+# 요청마다 압축: 속도 우선 / 저장 시 1회 압축: 압축률 우선 (brotli 11은 MB 단위 본문에서 저장이 수 초 지연)
+_DYNAMIC_GZIP_LEVEL = 6
+_DYNAMIC_BR_QUALITY = 4
+_STORED_GZIP_LEVEL = 9
+_STORED_BR_QUALITY = 9
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "application/rss+xml",
+    "application/atom+xml",
+    "image/svg+xml",
+)
+# 선호 순서
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str | None, available: tuple[str, ...] = SUPPORTED_ENCODINGS) -> str | None:
+    """Accept-Encoding(q값 포함) → available 중 사용할 인코딩 ("br" | "gzip"), 없으면 None (무압축)."""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+    best, best_weight = None, 0.0
+    for encoding in available:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def encode(data: bytes, encoding: str) -> bytes:
+    """요청 시 압축 (속도 우선 수준)."""
+    if encoding == "br":
+        return brotli.compress(data, quality=_DYNAMIC_BR_QUALITY)
+    return gzip.compress(data, compresslevel=_DYNAMIC_GZIP_LEVEL, mtime=0)
+
+
+def encode_stored(data: bytes) -> dict[str, bytes | None]:
+    """저장 시 1회 압축 → {"gzip": bytes, "br": bytes | None}."""
+    return {
+        "gzip": gzip.compress(data, compresslevel=_STORED_GZIP_LEVEL, mtime=0),
+        "br": brotli.compress(data, quality=_STORED_BR_QUALITY) if brotli is not None else None,
+    }
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = "W/" + etag
+
+
+def is_compressible(content_type: str | None) -> bool:
+    return bool(content_type) and content_type.lower().startswith(_COMPRESSIBLE_TYPES)
+
+
+class _StreamEncoder:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=_DYNAMIC_BR_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(_DYNAMIC_GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상 응답 압축 (ASGI)."""
+
+    def __init__(self, app, minimum_size: int = MIN_COMPRESS_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, app, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = None
+        self.start_message = None
+        self.passthrough = False
+        self.encoder: _StreamEncoder | None = None
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self._send)
+
+    async def _send(self, message):
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if message["status"] == 304:
+                # 클라이언트가 가진 표현은 압축본일 수 있으므로 압축 응답과 같은 weak ETag로 맞춤
+                _weaken_etag(MutableHeaders(raw=message["headers"]))
+                await self.send(message)
+                return
+            self.start_message = message
+            self.passthrough = "content-encoding" in headers or not is_compressible(headers.get("content-type"))
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                await self.send(start)
+                await self.send(message)
+                return
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            _weaken_etag(headers)
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body:
+                # 단일 본문: 한 번에 압축
+                compressed = encode(body, self.encoding)
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            # 스트리밍 본문: 길이를 알 수 없으므로 Content-Length 제거 후 청크 단위 압축
+            del headers["Content-Length"]
+            self.encoder = _StreamEncoder(self.encoding)
+            await self.send(start)
+            await self.send({"type": "http.response.body", "body": self.encoder.compress(body), "more_body": True})
+            return
+        if self.encoder is None:
+            await self.send(message)
+            return
+        body = self.encoder.compress(message.get("body", b""))
+        if message.get("more_body", False):
+            if body:
+                await self.send({"type": "http.response.body", "body": body, "more_body": True})
+            return
+        await self.send({"type": "http.response.body", "body": body + self.encoder.finish()})
@@ -63,3 +63,45 @@ def get_today_iso() -> str:
     """현재 날짜를 TIMEZONE_OFFSET_HOURS 기준 ISO 문자열로 반환."""
     tz = timezone(timedelta(hours=TIMEZONE_OFFSET_HOURS))
     return datetime.now(tz).date().isoformat()
+
+# 조회수 write-behind 집계 (posts.view_count, daily_stats): 주기(초) 또는 누적 건수 도달 시 일괄 반영
+VIEW_FLUSH_INTERVAL_SECONDS = float(os.getenv("VIEW_FLUSH_INTERVAL_SECONDS", "10"))
+VIEW_FLUSH_MAX_PENDING = int(os.getenv("VIEW_FLUSH_MAX_PENDING", "500"))
+
+# 공개 조회 API 응답 캐시 (프로세스 내 LRU/TTL, 쓰기 API에서 태그 단위 무효화)
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "60"))
+RESPONSE_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_NEGATIVE_TTL_SECONDS", "30"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+
+# 글 자동 저장 (PATCH /api/posts/{id}/autosave): 마지막 요청 후 대기(초) 또는 첫 요청 후 최대 지연(초)에 DB 반영,
+# 반영 후에도 편집 기준 본문을 유지하는 시간(초)
+AUTOSAVE_DEBOUNCE_SECONDS = float(os.getenv("AUTOSAVE_DEBOUNCE_SECONDS", "3"))
+AUTOSAVE_MAX_DELAY_SECONDS = float(os.getenv("AUTOSAVE_MAX_DELAY_SECONDS", "15"))
+AUTOSAVE_SESSION_TTL_SECONDS = float(os.getenv("AUTOSAVE_SESSION_TTL_SECONDS", "1800"))
+
+# sitemap.xml · RSS/Atom 피드 (사이트 루트): 글 URL 기준 주소, 피드 제목·설명, 피드 글 수, sitemap 샤드당 글 수 (프로토콜 상한 50000)
+SITE_URL = os.getenv("SITE_URL", f"https://{NAKED_HOST}").rstrip("/")
+SITE_TITLE = os.getenv("SITE_TITLE", "정의랩")
+SITE_DESCRIPTION = os.getenv("SITE_DESCRIPTION", "정의랩 블로그")
+FEED_ITEM_COUNT = int(os.getenv("FEED_ITEM_COUNT", "20"))
+SITEMAP_SHARD_SIZE = min(int(os.getenv("SITEMAP_SHARD_SIZE", "10000")), 50000)
+
+# 업로드 이미지 파생본 (Pillow 필요, 없으면 생성 생략): 생성 폭(px), 포맷(avif는 Pillow AVIF 지원 시에만), 프로세스 풀 크기
+IMAGE_VARIANT_WIDTHS = tuple(sorted({int(w) for w in os.getenv("IMAGE_VARIANT_WIDTHS", "320,640,960,1280,1920").split(",") if w.strip()}))
+IMAGE_VARIANT_FORMATS = tuple(f.strip().lower() for f in os.getenv("IMAGE_VARIANT_FORMATS", "avif,webp,jpeg").split(",") if f.strip())
+IMAGE_WORKERS = max(1, int(os.getenv("IMAGE_WORKERS", "2")))
+# srcset sizes 기준 본문 폭, 목록 썸네일·로고에 쓸 파생본 최소 폭 (px, 고해상도 화면 감안)
+IMAGE_CONTENT_WIDTH = int(os.getenv("IMAGE_CONTENT_WIDTH", "740"))
+IMAGE_THUMBNAIL_WIDTH = int(os.getenv("IMAGE_THUMBNAIL_WIDTH", "640"))
+IMAGE_LOGO_WIDTH = int(os.getenv("IMAGE_LOGO_WIDTH", "320"))
+
+# 이미지 렌디션 (GET /api/assets/{id}/image): 허용 w·h(px) 목록(캐시 무력화 방지), 디스크 캐시 위치·상한(바이트), 변환 프로세스 수
+IMAGE_RENDER_SIZES = frozenset(int(s) for s in os.getenv("IMAGE_RENDER_SIZES", "64,96,128,160,200,240,320,400,480,640,800,960,1280,1600,1920").split(",") if s.strip())
+IMAGE_RENDER_CACHE_DIR = Path(os.getenv("IMAGE_RENDER_CACHE_DIR", "") or (UPLOAD_DIR / ".renders")).resolve()
+IMAGE_RENDER_CACHE_MAX_BYTES = int(os.getenv("IMAGE_RENDER_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+IMAGE_RENDER_WORKERS = max(1, int(os.getenv("IMAGE_RENDER_WORKERS", "2")))
+
+# 파일 전송 nginx 위임 (X-Accel-Redirect): API는 DB 조회·권한 확인 후 헤더만 반환, nginx가 internal location에서 sendfile로 전송.
+# nginx와 업로드 디렉터리(볼륨)를 공유할 때만 켬. 위치는 nginx/templates/default.conf.template의 internal location과 일치해야 함
+X_ACCEL_REDIRECT = os.getenv("X_ACCEL_REDIRECT", "false").lower() in ("true", "1")
+X_ACCEL_UPLOADS_LOCATION = "/" + os.getenv("X_ACCEL_UPLOADS_LOCATION", "/_accel/uploads/").strip("/") + "/"
@@ -0,0 +1,114 @@
+"""
+글 저장 시 content_html 파생값 계산 (요약·분량·읽기 시간·목차).
+- 목록 카드·읽기 시간 배지·목차를 요청마다(또는 브라우저에서) 다시 파싱하지 않도록 저장 시 1회 계산해 컬럼에 보관
+- h2~h6 중 id 없는 제목에는 텍스트 기반 앵커 id를 넣은 HTML을 돌려줌 (같은 텍스트면 항상 같은 id)
+"""
+import hashlib
+import html
+import json
+import math
+import re
+from dataclasses import dataclass
+
+from apps.api.core.search import html_to_text
+
+EXCERPT_MAX_CHARS = 160
+# 읽기 속도: 한글 분당 500자, 그 외 분당 200단어
+_HANGUL_CHARS_PER_MINUTE = 500
+_WORDS_PER_MINUTE = 200
+
+_HEADING_RE = re.compile(r"<h([2-6])(\s[^>]*)?>(.*?)</h\1\s*>", re.IGNORECASE | re.DOTALL)
+_ID_ATTR_RE = re.compile(r"""\sid\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+_HANGUL_RE = re.compile(r"[가-힣]")
+_ANCHOR_STRIP_RE = re.compile(r"[^\w가-힣\- ]+")
+
+
+@dataclass
+class DerivedContent:
+    excerpt: str
+    word_count: int
+    char_count: int
+    reading_minutes: int
+    toc: list[dict]
+
+    @property
+    def toc_json(self) -> str:
+        return json.dumps(self.toc, ensure_ascii=False)
+
+    def columns(self) -> dict:
+        """posts 파생 컬럼 바인드 값."""
+        return {
+            "excerpt": self.excerpt,
+            "word_count": self.word_count,
+            "char_count": self.char_count,
+            "reading_minutes": self.reading_minutes,
+            "toc_json": self.toc_json,
+        }
+
+
+def content_hash(content_html: str | None, content_json: str | None) -> str:
+    """저장 요청 본문 해시 (posts.content_hash). 같은 본문 재저장 시 content 컬럼 재작성·파생·temp 처리 생략에 사용."""
+    h = hashlib.sha256()
+    h.update((content_html or "").encode("utf-8"))
+    h.update(b"\0")
+    h.update((content_json or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+def _anchor(text: str) -> str:
+    slug = _ANCHOR_STRIP_RE.sub("", text.lower()).strip()
+    return re.sub(r"[\s\-]+", "-", slug).strip("-") or "section"
+
+
+def _excerpt(plain: str) -> str:
+    if len(plain) <= EXCERPT_MAX_CHARS:
+        return plain
+    cut = plain[:EXCERPT_MAX_CHARS]
+    space = cut.rfind(" ")
+    if space > EXCERPT_MAX_CHARS // 2:
+        cut = cut[:space]
+    return cut.rstrip() + "…"
+
+
+def _reading_minutes(plain: str) -> int:
+    if not plain:
+        return 0
+    hangul = len(_HANGUL_RE.findall(plain))
+    other_words = sum(1 for w in plain.split() if not _HANGUL_RE.search(w))
+    minutes = hangul / _HANGUL_CHARS_PER_MINUTE + other_words / _WORDS_PER_MINUTE
+    return max(1, math.ceil(minutes))
+
+
+def derive_content(content_html: str | None) -> tuple[str | None, DerivedContent]:
+    """(제목 앵커 id를 넣은 content_html, 파생값). content_html이 비어 있으면 그대로."""
+    toc = []
+    used: dict[str, int] = {}
+
+    def _add_id(m: re.Match) -> str:
+        level, attrs, inner = int(m.group(1)), m.group(2) or "", m.group(3)
+        text = html_to_text(inner)
+        existing = _ID_ATTR_RE.search(attrs)
+        if existing:
+            anchor = next(g for g in existing.groups() if g is not None)
+        else:
+            anchor = _anchor(text)
+        n = used.get(anchor, 0)
+        used[anchor] = n + 1
+        if n and not existing:
+            anchor = f"{anchor}-{n + 1}"
+            used[anchor] = used.get(anchor, 0) + 1
+        if text:
+            toc.append({"level": level, "id": anchor, "text": text})
+        if existing:
+            return m.group(0)
+        return f'<h{level}{attrs} id="{html.escape(anchor, quote=True)}">{inner}</h{level}>'
+
+    new_html = _HEADING_RE.sub(_add_id, content_html) if content_html else content_html
+    plain = html_to_text(new_html)
+    return new_html, DerivedContent(
+        excerpt=_excerpt(plain),
+        word_count=len(plain.split()),
+        char_count=sum(1 for ch in plain if not ch.isspace()),
+        reading_minutes=_reading_minutes(plain),
+        toc=toc,
+    )
@@ -42,9 +42,33 @@ CREATE TABLE IF NOT EXISTS assets (
   mime_type VARCHAR(50) NOT NULL COMMENT '파일 타입 (image/png 등)',
   file_path VARCHAR(255) NOT NULL COMMENT '서버 저장 경로',
   size_bytes BIGINT NOT NULL COMMENT '파일 크기 (Byte)',
-  uploaded_at DATETIME DEFAULT CURRENT_TIMESTAMP
+  content_hash CHAR(64) NULL COMMENT '파일 SHA-256 (asset_blobs.sha256, 이전 업로드는 NULL)',
+  image_width INT NULL COMMENT '이미지 원본 폭(px) (파생본 생성 시 기록)',
+  image_height INT NULL COMMENT '이미지 원본 높이(px) (파생본 생성 시 기록)',
+  uploaded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  INDEX idx_assets_file_path (file_path),
+  INDEX idx_assets_content_hash (content_hash)
 ) COMMENT='파일 메타데이터';
 
+CREATE TABLE IF NOT EXISTS asset_blobs (
+  sha256 CHAR(64) NOT NULL COMMENT '파일 내용 SHA-256',
+  file_path VARCHAR(255) NOT NULL COMMENT '저장 경로 blobs/<h[0:2]>/<h[2:4]>/<sha256>.<ext>',
+  size_bytes BIGINT NOT NULL COMMENT '파일 크기 (Byte)',
+  created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  UNIQUE KEY uk_asset_blobs_sha256 (sha256)
+) COMMENT='내용 주소 파일 저장소 (같은 내용은 파일 1개, assets 행은 원본명별로 따로)';
+
+CREATE TABLE IF NOT EXISTS asset_variants (
+  content_hash CHAR(64) NOT NULL COMMENT '원본 파일 SHA-256 (assets.content_hash)',
+  format VARCHAR(10) NOT NULL COMMENT 'avif, webp, jpeg, png',
+  width INT NOT NULL COMMENT '파생본 폭(px)',
+  height INT NOT NULL COMMENT '파생본 높이(px)',
+  file_path VARCHAR(255) NOT NULL COMMENT '저장 경로 variants/<h[0:2]>/<h[2:4]>/<sha256>/<w>.<ext>',
+  size_bytes BIGINT NOT NULL COMMENT '파일 크기 (Byte)',
+  created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (content_hash, format, width)
+) COMMENT='업로드 이미지 파생본 (폭별 리사이즈·포맷 변환, 같은 내용 자산이 공유)';
+
 CREATE TABLE IF NOT EXISTS categories (
   id BIGINT AUTO_INCREMENT PRIMARY KEY,
   parent_id BIGINT NULL COMMENT '상위 카테고리 ID (NULL=대카테고리)',
@@ -81,6 +105,14 @@ CREATE TABLE IF NOT EXISTS posts (
   created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
   updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   view_count INT DEFAULT 0 COMMENT '조회수',
+  is_live TINYINT(1) NOT NULL DEFAULT 0 COMMENT '공개 여부 (PUBLISHED + 발행 시각 도래, 예약 발행 스케줄러가 갱신)',
+  excerpt VARCHAR(300) NULL COMMENT '본문 요약 (저장 시 파생)',
+  word_count INT NULL COMMENT '단어 수 (저장 시 파생)',
+  char_count INT NULL COMMENT '공백 제외 글자 수 (저장 시 파생)',
+  reading_minutes SMALLINT NULL COMMENT '예상 읽기 시간(분) (저장 시 파생)',
+  toc_json TEXT NULL COMMENT '목차 h2~h6 [{level, id, text}] (저장 시 파생)',
+  content_hash CHAR(64) NULL COMMENT '저장 요청 본문(content_html+content_json) SHA-256, 변경 없는 저장 감지용',
+  INDEX idx_posts_is_live_id (is_live, id),
   FOREIGN KEY (category_id) REFERENCES categories(id) ON DELETE SET NULL,
   FOREIGN KEY (prefix_id) REFERENCES post_prefixes(id) ON DELETE SET NULL,
   FOREIGN KEY (thumbnail_asset_id) REFERENCES assets(id) ON DELETE SET NULL
@@ -103,6 +135,40 @@ CREATE TABLE IF NOT EXISTS post_attachments (
   FOREIGN KEY (asset_id) REFERENCES assets(id) ON DELETE CASCADE
 ) COMMENT='게시글 첨부파일 (다중)';
 
+CREATE TABLE IF NOT EXISTS post_asset_refs (
+  post_id BIGINT NOT NULL,
+  asset_id BIGINT NOT NULL,
+  PRIMARY KEY (post_id, asset_id),
+  INDEX idx_post_asset_refs_asset (asset_id),
+  FOREIGN KEY (post_id) REFERENCES posts(id) ON DELETE CASCADE,
+  FOREIGN KEY (asset_id) REFERENCES assets(id) ON DELETE CASCADE
+) COMMENT='게시글 본문(content_html)이 참조하는 자산';
+
+CREATE TABLE IF NOT EXISTS post_revisions (
+  id BIGINT AUTO_INCREMENT PRIMARY KEY,
+  post_id BIGINT NOT NULL,
+  rev_no INT NOT NULL COMMENT '글별 리비전 번호 (1부터)',
+  kind ENUM('FULL', 'DELTA') NOT NULL COMMENT 'FULL=전체 스냅샷, DELTA=기준 스냅샷 대비 편집 연산',
+  base_rev_no INT NULL COMMENT 'DELTA의 기준 FULL 리비전 번호',
+  payload LONGBLOB NOT NULL COMMENT 'zlib 압축 JSON',
+  content_hash CHAR(64) NULL COMMENT '저장 요청 본문 SHA-256 (posts.content_hash와 같은 기준)',
+  title VARCHAR(200) NOT NULL COMMENT '저장 시점 제목',
+  content_bytes INT NOT NULL DEFAULT 0 COMMENT '복원 본문 크기(바이트)',
+  created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  UNIQUE KEY uq_post_revisions_post_rev (post_id, rev_no),
+  FOREIGN KEY (post_id) REFERENCES posts(id) ON DELETE CASCADE
+) COMMENT='게시글 리비전 이력 (주기적 스냅샷 + 압축 델타)';
+
+CREATE TABLE IF NOT EXISTS post_content_encoded (
+  post_id BIGINT PRIMARY KEY,
+  content_hash CHAR(64) NOT NULL COMMENT '압축 시점 posts.content_hash (다르면 사용하지 않음)',
+  html_gzip LONGBLOB NOT NULL COMMENT 'content_html gzip',
+  html_br LONGBLOB NULL COMMENT 'content_html brotli (brotli 미설치 시 NULL)',
+  html_bytes INT NOT NULL DEFAULT 0 COMMENT '원본 content_html 크기(바이트)',
+  updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  FOREIGN KEY (post_id) REFERENCES posts(id) ON DELETE CASCADE
+) COMMENT='게시글 본문 사전 압축본 (저장 시 생성, 본문 API가 그대로 전송)';
+
 CREATE TABLE IF NOT EXISTS careers (
   id BIGINT AUTO_INCREMENT PRIMARY KEY,
   logo_asset_id BIGINT NULL COMMENT '회사 로고 ID',
@@ -113,6 +179,7 @@ CREATE TABLE IF NOT EXISTS careers (
   description TEXT NULL COMMENT '성과 상세 내용',
   sort_order INT DEFAULT 0 COMMENT '정렬 순서',
   created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   FOREIGN KEY (logo_asset_id) REFERENCES assets(id) ON DELETE SET NULL
 ) COMMENT='경력 포트폴리오';
 
@@ -131,6 +198,7 @@ CREATE TABLE IF NOT EXISTS projects (
   is_pinned TINYINT(1) NOT NULL DEFAULT 0 COMMENT '상단 고정(핀)',
   logo_asset_id BIGINT NULL COMMENT '로고 이미지 ID (핀 영역 표시)',
   created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   FOREIGN KEY (thumbnail_asset_id) REFERENCES assets(id) ON DELETE SET NULL,
   FOREIGN KEY (intro_image_asset_id) REFERENCES assets(id) ON DELETE SET NULL,
   FOREIGN KEY (logo_asset_id) REFERENCES assets(id) ON DELETE SET NULL
@@ -278,6 +346,142 @@ def _ensure_posts_prefix_id():
         conn.close()
 
 
+def _ensure_posts_list_indexes():
+    """목록 커서 페이지네이션용: posts.view_count NULL 백필, (view_count, id) 인덱스 없으면 추가."""
+    conn = _get_conn(use_db=True)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("UPDATE posts SET view_count = 0, updated_at = updated_at WHERE view_count IS NULL")
+            conn.commit()
+            cur.execute(
+                "SELECT 1 FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'posts' AND INDEX_NAME = 'idx_posts_view_count_id'",
+                (MYSQL_DATABASE,),
+            )
+            if cur.fetchone() is None:
+                cur.execute("ALTER TABLE posts ADD INDEX idx_posts_view_count_id (view_count, id)")
+                conn.commit()
+                logger.info("posts.idx_posts_view_count_id 인덱스 추가됨")
+    finally:
+        conn.close()
+
+
+def _ensure_posts_is_live():
+    """posts.is_live 컬럼·(is_live, id) 인덱스가 없으면 추가하고 현재 시각 기준으로 백필."""
+    conn = _get_conn(use_db=True)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT 1 FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'posts' AND COLUMN_NAME = 'is_live'",
+                (MYSQL_DATABASE,),
+            )
+            if cur.fetchone() is None:
+                cur.execute(
+                    "ALTER TABLE posts ADD COLUMN is_live TINYINT(1) NOT NULL DEFAULT 0 "
+                    "COMMENT '공개 여부 (PUBLISHED + 발행 시각 도래, 예약 발행 스케줄러가 갱신)'"
+                )
+                cur.execute(
+                    "UPDATE posts SET is_live = 1, updated_at = updated_at "
+                    "WHERE status = 'PUBLISHED' AND published_at IS NOT NULL AND published_at <= UTC_TIMESTAMP()"
+                )
+                conn.commit()
+                logger.info("posts.is_live 컬럼 추가·백필됨")
+            cur.execute(
+                "SELECT 1 FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'posts' AND INDEX_NAME = 'idx_posts_is_live_id'",
+                (MYSQL_DATABASE,),
+            )
+            if cur.fetchone() is None:
+                cur.execute("ALTER TABLE posts ADD INDEX idx_posts_is_live_id (is_live, id)")
+                conn.commit()
+                logger.info("posts.idx_posts_is_live_id 인덱스 추가됨")
+    finally:
+        conn.close()
+
+
+_POSTS_DERIVED_COLUMNS = (
+    ("excerpt", "VARCHAR(300) NULL COMMENT '본문 요약 (저장 시 파생)'"),
+    ("word_count", "INT NULL COMMENT '단어 수 (저장 시 파생)'"),
+    ("char_count", "INT NULL COMMENT '공백 제외 글자 수 (저장 시 파생)'"),
+    ("reading_minutes", "SMALLINT NULL COMMENT '예상 읽기 시간(분) (저장 시 파생)'"),
+    ("toc_json", "TEXT NULL COMMENT '목차 h2~h6 [{level, id, text}] (저장 시 파생)'"),
+    ("content_hash", "CHAR(64) NULL COMMENT '저장 요청 본문(content_html+content_json) SHA-256, 변경 없는 저장 감지용'"),
+)
+
+
+def _ensure_posts_derived_columns():
+    """posts 본문 파생 컬럼(요약·분량·읽기 시간·목차, 본문 해시)이 없으면 추가. 기존 글은 scripts/backfill_post_derived.py로 채움."""
+    conn = _get_conn(use_db=True)
+    try:
+        with conn.cursor() as cur:
+            for column, ddl in _POSTS_DERIVED_COLUMNS:
+                cur.execute(
+                    "SELECT 1 FROM information_schema.COLUMNS "
+                    "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'posts' AND COLUMN_NAME = %s",
+                    (MYSQL_DATABASE, column),
+                )
+                if cur.fetchone() is None:
+                    cur.execute(f"ALTER TABLE posts ADD COLUMN {column} {ddl}")
+                    conn.commit()
+                    logger.info("posts.%s 컬럼 추가됨", column)
+    finally:
+        conn.close()
+
+
+def _ensure_assets_file_path_index():
+    """본문 참조 경로 → 자산 조회(post_asset_refs 갱신)용 assets.file_path 인덱스가 없으면 추가."""
+    conn = _get_conn(use_db=True)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT 1 FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'assets' AND INDEX_NAME = 'idx_assets_file_path'",
+                (MYSQL_DATABASE,),
+            )
+            if cur.fetchone() is None:
+                cur.execute("ALTER TABLE assets ADD INDEX idx_assets_file_path (file_path)")
+                conn.commit()
+                logger.info("assets.idx_assets_file_path 인덱스 추가됨")
+    finally:
+        conn.close()
+
+
+_ASSETS_ADDED_COLUMNS = (
+    ("content_hash", "CHAR(64) NULL COMMENT '파일 SHA-256 (asset_blobs.sha256, 이전 업로드는 NULL)' AFTER size_bytes"),
+    ("image_width", "INT NULL COMMENT '이미지 원본 폭(px) (파생본 생성 시 기록)' AFTER content_hash"),
+    ("image_height", "INT NULL COMMENT '이미지 원본 높이(px) (파생본 생성 시 기록)' AFTER image_width"),
+)
+
+
+def _ensure_assets_columns():
+    """assets 내용 해시·이미지 크기 컬럼과 content_hash 인덱스가 없으면 추가 (이전 자산은 NULL 유지)."""
+    conn = _get_conn(use_db=True)
+    try:
+        with conn.cursor() as cur:
+            for column, ddl in _ASSETS_ADDED_COLUMNS:
+                cur.execute(
+                    "SELECT 1 FROM information_schema.COLUMNS "
+                    "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'assets' AND COLUMN_NAME = %s",
+                    (MYSQL_DATABASE, column),
+                )
+                if cur.fetchone() is None:
+                    cur.execute(f"ALTER TABLE assets ADD COLUMN {column} {ddl}")
+                    conn.commit()
+                    logger.info("assets.%s 컬럼 추가됨", column)
+            cur.execute(
+                "SELECT 1 FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'assets' AND INDEX_NAME = 'idx_assets_content_hash'",
+                (MYSQL_DATABASE,),
+            )
+            if cur.fetchone() is None:
+                cur.execute("ALTER TABLE assets ADD INDEX idx_assets_content_hash (content_hash)")
+                conn.commit()
+                logger.info("assets.idx_assets_content_hash 인덱스 추가됨")
+    finally:
+        conn.close()
+
+
 def _ensure_career_extension_tables():
     """경력 확장 테이블(career_links, career_highlights, career_tags) 없으면 생성."""
     conn = _get_conn(use_db=True)
@@ -385,6 +589,28 @@ def _ensure_project_modal_columns():
         conn.close()
 
 
+def _ensure_updated_at_columns():
+    """projects/careers에 updated_at 컬럼이 없으면 추가 (목록 ETag validator용)."""
+    conn = _get_conn(use_db=True)
+    try:
+        with conn.cursor() as cur:
+            for table in ("projects", "careers"):
+                cur.execute(
+                    "SELECT 1 FROM information_schema.COLUMNS "
+                    "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = 'updated_at'",
+                    (MYSQL_DATABASE, table),
+                )
+                if cur.fetchone() is None:
+                    cur.execute(
+                        f"ALTER TABLE {table} ADD COLUMN updated_at DATETIME "
+                        "DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP AFTER created_at"
+                    )
+                    conn.commit()
+                    logger.info("%s.updated_at 컬럼 추가됨", table)
+    finally:
+        conn.close()
+
+
 def _migrate_site_settings_value_to_text():
     """site_settings.value를 VARCHAR(255)에서 TEXT로 변경 (긴 URL 저장 대응)."""
     conn = _get_conn(use_db=True)
@@ -434,8 +660,14 @@ def init_on_startup():
         _ensure_tables()
         _ensure_posts_view_count()
         _ensure_posts_prefix_id()
+        _ensure_posts_list_indexes()
+        _ensure_posts_is_live()
+        _ensure_posts_derived_columns()
+        _ensure_assets_file_path_index()
+        _ensure_assets_columns()
         _ensure_career_extension_tables()
         _ensure_project_modal_columns()
+        _ensure_updated_at_columns()
         _ensure_site_settings()
         _migrate_site_settings_value_to_text()
         _ensure_admin()
@@ -0,0 +1,253 @@
+"""
+sitemap.xml · RSS/Atom 피드 문서 (사이트 루트 /sitemap.xml, /feed.xml, /atom.xml).
+- 공개(is_live) 글 목록을 메모리에 보관하고, 글 저장·삭제·공개 전환(예약 발행 포함) 시 해당 글만 갱신
+- 문서(XML)는 요청 시 생성해 캐시, 영향받는 문서만 무효화 (크롤러 요청마다 DB·전체 글 스캔 없음)
+- 글 수가 SITEMAP_SHARD_SIZE를 넘으면 /sitemap.xml은 sitemap index, 글은 id 순 /sitemap-<n>.xml 샤드로 분할
+"""
+import hashlib
+import heapq
+import logging
+import threading
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from sqlalchemy import bindparam, text
+
+from apps.api.core.config import FEED_ITEM_COUNT, SITE_DESCRIPTION, SITE_TITLE, SITE_URL, SITEMAP_SHARD_SIZE
+from apps.api.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# sitemap에 함께 싣는 고정 페이지 (클라이언트 라우트)
+_STATIC_PATHS = ("/", "/projects", "/portfolio")
+
+
+@dataclass(frozen=True)
+class FeedEntry:
+    post_id: int
+    title: str
+    excerpt: str
+    published_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class FeedDocument:
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+
+def _w3c(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _rfc822(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+
+
+def _post_url(post_id: int) -> str:
+    return f"{SITE_URL}/posts/{post_id}"
+
+
+def _document(xml: str) -> FeedDocument:
+    # Last-Modified는 생성 시각: 글 제거 시에도 뒤로 가지 않음 (문서 내 lastmod는 글 수정 시각)
+    body = xml.encode("utf-8")
+    generated_at = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    return FeedDocument(body, '"' + hashlib.sha1(body).hexdigest() + '"', generated_at)
+
+
+class FeedDocuments:
+    def __init__(self, shard_size: int = SITEMAP_SHARD_SIZE, feed_size: int = FEED_ITEM_COUNT):
+        self.shard_size = shard_size
+        self.feed_size = feed_size
+        self._lock = threading.Lock()
+        self._entries: dict[int, FeedEntry] = {}
+        self._ids: list[int] = []
+        self._docs: dict[str, FeedDocument] = {}
+        # 변경마다 증가: 생성 중 변경이 있었으면 생성 결과를 캐시하지 않음
+        self._epoch = 0
+
+    _SELECT = """
+        SELECT id, title, excerpt, published_at, updated_at, is_live FROM posts
+    """
+
+    @staticmethod
+    def _entry(row) -> FeedEntry | None:
+        if not row[5] or row[3] is None:
+            return None
+        return FeedEntry(row[0], row[1] or "", row[2] or "", row[3], row[4] or row[3])
+
+    def rebuild(self) -> None:
+        db = SessionLocal()
+        try:
+            rows = db.execute(text(self._SELECT + " WHERE is_live = 1")).fetchall()
+        finally:
+            db.close()
+        entries = {e.post_id: e for e in (self._entry(r) for r in rows) if e is not None}
+        with self._lock:
+            self._entries = entries
+            self._ids = sorted(entries)
+            self._docs = {}
+            self._epoch += 1
+        logger.info("sitemap·피드 구성 완료: 공개 글 %d건", len(entries))
+
+    def refresh(self, post_ids: list[int], db=None) -> None:
+        """글 저장·삭제·공개 전환 후 호출: 해당 글의 현재 상태를 읽어 반영하고 영향받는 문서만 무효화."""
+        if not post_ids:
+            return
+        own = db is None
+        if own:
+            db = SessionLocal()
+        try:
+            rows = db.execute(
+                text(self._SELECT + " WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)),
+                {"ids": list(post_ids)},
+            ).fetchall()
+        finally:
+            if own:
+                db.close()
+        current = {r[0]: self._entry(r) for r in rows}
+        with self._lock:
+            for post_id in post_ids:
+                self._apply_locked(post_id, current.get(post_id))
+
+    def _apply_locked(self, post_id: int, entry: FeedEntry | None) -> None:
+        old = self._entries.get(post_id)
+        if old == entry:
+            return
+        self._epoch += 1
+        self._docs.pop("feed", None)
+        self._docs.pop("atom", None)
+        self._docs.pop("sitemap", None)
+        pos = bisect_left(self._ids, post_id)
+        if (old is None) != (entry is None):
+            # 공개 글 추가·제거: 이 위치 이후 샤드 구성이 모두 밀림
+            if entry is None:
+                del self._entries[post_id]
+                del self._ids[pos]
+            else:
+                self._entries[post_id] = entry
+                insort(self._ids, post_id)
+            first_shard = pos // self.shard_size + 1
+            for key in [k for k in self._docs if k.startswith("sitemap-") and int(k[8:]) >= first_shard]:
+                del self._docs[key]
+        else:
+            self._entries[post_id] = entry
+            self._docs.pop(f"sitemap-{pos // self.shard_size + 1}", None)
+
+    def get(self, name: str) -> FeedDocument | None:
+        """"sitemap" | "sitemap-<n>" | "feed" | "atom" → 캐시된 문서 (없으면 생성). 없는 샤드면 None."""
+        with self._lock:
+            doc = self._docs.get(name)
+            if doc is not None:
+                return doc
+            epoch = self._epoch
+            shard_count = max(1, -(-len(self._ids) // self.shard_size))
+            if name == "sitemap":
+                if shard_count == 1:
+                    snapshot = [self._entries[i] for i in self._ids]
+                else:
+                    snapshot = [
+                        max((self._entries[i].updated_at for i in self._ids[s * self.shard_size:(s + 1) * self.shard_size]))
+                        for s in range(shard_count)
+                    ]
+            elif name.startswith("sitemap-"):
+                try:
+                    shard = int(name[8:])
+                except ValueError:
+                    return None
+                if shard_count == 1 or not 1 <= shard <= shard_count:
+                    return None
+                snapshot = [self._entries[i] for i in self._ids[(shard - 1) * self.shard_size:shard * self.shard_size]]
+            elif name in ("feed", "atom"):
+                snapshot = heapq.nlargest(self.feed_size, self._entries.values(), key=lambda e: (e.published_at, e.post_id))
+            else:
+                return None
+        if name == "sitemap":
+            doc = _urlset(snapshot, include_static=True) if shard_count == 1 else _sitemap_index(snapshot)
+        elif name.startswith("sitemap-"):
+            doc = _urlset(snapshot, include_static=shard == 1)
+        elif name == "feed":
+            doc = _rss(snapshot)
+        else:
+            doc = _atom(snapshot)
+        with self._lock:
+            if self._epoch == epoch:
+                self._docs[name] = doc
+        return doc
+
+
+def _urlset(entries: list[FeedEntry], include_static: bool) -> FeedDocument:
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    if include_static:
+        for path in _STATIC_PATHS:
+            lines.append(f"<url><loc>{escape(SITE_URL + path)}</loc></url>")
+    for e in entries:
+        lines.append(f"<url><loc>{escape(_post_url(e.post_id))}</loc><lastmod>{_w3c(e.updated_at)}</lastmod></url>")
+    lines.append("</urlset>")
+    return _document("\n".join(lines) + "\n")
+
+
+def _sitemap_index(shard_lastmods: list[datetime]) -> FeedDocument:
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for n, lastmod in enumerate(shard_lastmods, start=1):
+        lines.append(f"<sitemap><loc>{escape(f'{SITE_URL}/sitemap-{n}.xml')}</loc><lastmod>{_w3c(lastmod)}</lastmod></sitemap>")
+    lines.append("</sitemapindex>")
+    return _document("\n".join(lines) + "\n")
+
+
+def _rss(entries: list[FeedEntry]) -> FeedDocument:
+    last = max((e.updated_at for e in entries), default=None)
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">',
+        "<channel>",
+        f"<title>{escape(SITE_TITLE)}</title>",
+        f"<link>{escape(SITE_URL + '/')}</link>",
+        f"<description>{escape(SITE_DESCRIPTION)}</description>",
+        f'<atom:link href="{escape(SITE_URL + "/feed.xml")}" rel="self" type="application/rss+xml"/>',
+    ]
+    if last is not None:
+        lines.append(f"<lastBuildDate>{_rfc822(last)}</lastBuildDate>")
+    for e in entries:
+        url = escape(_post_url(e.post_id))
+        lines.append(
+            f"<item><title>{escape(e.title)}</title><link>{url}</link>"
+            f'<guid isPermaLink="true">{url}</guid><pubDate>{_rfc822(e.published_at)}</pubDate>'
+            f"<description>{escape(e.excerpt)}</description></item>"
+        )
+    lines += ["</channel>", "</rss>"]
+    return _document("\n".join(lines) + "\n")
+
+
+def _atom(entries: list[FeedEntry]) -> FeedDocument:
+    last = max((e.updated_at for e in entries), default=None)
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<feed xmlns="http://www.w3.org/2005/Atom">',
+        f"<title>{escape(SITE_TITLE)}</title>",
+        f"<subtitle>{escape(SITE_DESCRIPTION)}</subtitle>",
+        f'<link href="{escape(SITE_URL + "/")}"/>',
+        f'<link href="{escape(SITE_URL + "/atom.xml")}" rel="self"/>',
+        f"<id>{escape(SITE_URL + '/')}</id>",
+        f"<updated>{_w3c(last or datetime(1970, 1, 1))}</updated>",
+    ]
+    for e in entries:
+        url = escape(_post_url(e.post_id))
+        lines.append(
+            f'<entry><title>{escape(e.title)}</title><link href="{url}"/><id>{url}</id>'
+            f"<published>{_w3c(e.published_at)}</published><updated>{_w3c(e.updated_at)}</updated>"
+            f"<summary>{escape(e.excerpt)}</summary></entry>"
+        )
+    lines.append("</feed>")
+    return _document("\n".join(lines) + "\n")
+
+
+feed_documents = FeedDocuments()
@@ -0,0 +1,52 @@
+"""
+업로드 파일 전송.
+- send_upload_file(): X_ACCEL_REDIRECT=true면 본문 없이 X-Accel-Redirect 헤더만 반환 → nginx가 internal location에서 sendfile로 전송
+  (Content-Type·Content-Disposition·Cache-Control은 nginx가 그대로 전달). 꺼져 있거나 UPLOAD_DIR 밖 파일이면 FileResponse
+- UploadStaticFiles: /static/uploads 마운트 (nginx가 직접 서빙하지 않는 개발 환경용).
+  내용 주소 경로(blobs/·variants/: 내용이 바뀌면 URL도 바뀜)는 immutable 캐시, 점으로 시작하는 경로(.incoming·.renders)는 404
+"""
+from pathlib import Path
+from urllib.parse import quote
+
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+
+from apps.api.core.config import UPLOAD_DIR, X_ACCEL_REDIRECT, X_ACCEL_UPLOADS_LOCATION
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 내용 해시가 경로에 들어간 디렉터리 (asset_blobs·image_variants)
+FINGERPRINTED_PREFIXES = ("blobs/", "variants/")
+
+
+def send_upload_file(
+    full_path: Path,
+    media_type: str,
+    headers: dict[str, str] | None = None,
+    filename: str | None = None,
+) -> Response:
+    """UPLOAD_DIR 아래 파일 응답. 존재 여부 확인은 호출 측에서."""
+    if X_ACCEL_REDIRECT:
+        try:
+            rel_path = Path(full_path).resolve().relative_to(UPLOAD_DIR).as_posix()
+        except ValueError:
+            rel_path = None
+        if rel_path is not None:
+            headers = dict(headers or {})
+            headers["X-Accel-Redirect"] = X_ACCEL_UPLOADS_LOCATION + quote(rel_path)
+            return Response(status_code=200, media_type=media_type, headers=headers)
+    return FileResponse(path=str(full_path), media_type=media_type, headers=headers, filename=filename)
+
+
+class UploadStaticFiles(StaticFiles):
+    async def get_response(self, path: str, scope) -> Response:
+        if any(part.startswith(".") for part in path.replace("\\", "/").split("/")):
+            # 수신 중 임시 파일·렌디션 캐시는 공개하지 않음
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if self.get_path(scope).replace("\\", "/").startswith(FINGERPRINTED_PREFIXES):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -0,0 +1,64 @@
+"""
+조건부 GET (ETag / Last-Modified) 공통 처리.
+- 핸들러는 저렴한 검증 쿼리로 validator를 만든 뒤 is_not_modified()면 304, 아니면 apply_validators()로 헤더 부착
+- If-None-Match가 있으면 그것만 비교 (RFC 9110), 없을 때만 If-Modified-Since 비교
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def make_etag(*parts) -> str:
+    """검증용 값들로 strong ETag 생성 (따옴표 포함)."""
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest() + '"'
+
+
+def _to_utc(dt: datetime) -> datetime:
+    """Naive datetime은 UTC로 간주."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def http_date(dt: datetime) -> str:
+    return format_datetime(_to_utc(dt), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [c.strip() for c in if_none_match.split(",")]
+        if "*" in candidates:
+            return True
+        # If-None-Match는 weak 비교: W/ 접두어 무시
+        return any((c[2:] if c.startswith("W/") else c) == etag for c in candidates)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since is None:
+            return False
+        return _to_utc(last_modified).replace(microsecond=0) <= _to_utc(since)
+    return False
+
+
+def _validator_headers(etag: str, last_modified: datetime | None) -> dict:
+    # no-cache: 브라우저가 캐시는 하되 매번 재검증(If-None-Match) 하도록
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def apply_validators(response: Response, etag: str, last_modified: datetime | None = None) -> None:
+    response.headers.update(_validator_headers(etag, last_modified))
+
+
+def not_modified_response(etag: str, last_modified: datetime | None = None) -> Response:
+    return Response(status_code=304, headers=_validator_headers(etag, last_modified))
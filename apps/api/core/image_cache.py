@@ -0,0 +1,176 @@
+"""
+이미지 렌디션 디스크 캐시 (GET /api/assets/{id}/image?w=&h=&fit=&format=).
+- 키: 원본 식별자(내용 해시 또는 경로+수정 시각) + w·h·fit·format → <IMAGE_RENDER_CACHE_DIR>/<k[0:2]>/<k>.<ext>
+- 크기 상한 LRU: 메모리 색인(OrderedDict, 접근 순)으로 총량을 관리하고 넘치면 오래 안 쓴 파일부터 삭제.
+  재시작 시 디렉터리를 훑어 수정 시각 순으로 색인 복원 (적중 시 수정 시각을 가끔 갱신해 순서 보존)
+- single-flight: 같은 키의 동시 요청은 진행 중인 변환 태스크 하나를 함께 기다림 (요청이 끊겨도 변환·캐시는 계속)
+- 변환은 전용 프로세스 풀(spawn)에서 — 이벤트 루프·업로드 파생본 생성과 분리
+"""
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from fastapi.concurrency import run_in_threadpool
+
+from apps.api.core import image_render
+from apps.api.core.config import IMAGE_RENDER_CACHE_DIR, IMAGE_RENDER_CACHE_MAX_BYTES, IMAGE_RENDER_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# 적중 시 수정 시각 갱신 최소 간격(초): 재시작 후 LRU 순서 복원용, 매 요청 syscall은 피함
+_TOUCH_INTERVAL = 3600
+
+
+class ImageRenderCache:
+    def __init__(
+        self,
+        root: Path = IMAGE_RENDER_CACHE_DIR,
+        max_bytes: int = IMAGE_RENDER_CACHE_MAX_BYTES,
+        workers: int = IMAGE_RENDER_WORKERS,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self._lock = threading.Lock()
+        # 파일 이름 → (크기, 마지막 mtime 갱신 시각)
+        self._index: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._total = 0
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._pool: ProcessPoolExecutor | None = None
+
+    def load(self) -> None:
+        """서버 시작 시: 캐시 디렉터리를 훑어 색인 복원 (수정 시각 오래된 순 = LRU 앞쪽), 상한 초과분 정리."""
+        entries = []
+        if self.root.is_dir():
+            for shard in self.root.iterdir():
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard):
+                    if entry.name.startswith("."):
+                        # 변환 중 중단된 임시 파일
+                        Path(entry.path).unlink(missing_ok=True)
+                        continue
+                    st = entry.stat()
+                    entries.append((st.st_mtime, entry.name, st.st_size))
+        entries.sort()
+        with self._lock:
+            self._index = OrderedDict((name, (size, mtime)) for mtime, name, size in entries)
+            self._total = sum(size for _, _, size in entries)
+        self._evict()
+        logger.info("이미지 렌디션 캐시: %d개, %.1fMB", len(entries), self._total / (1024 * 1024))
+
+    @staticmethod
+    def key(source_key: str, width: int | None, height: int | None, fit: str, fmt: str) -> str:
+        digest = hashlib.sha1(f"{source_key}|{width or ''}|{height or ''}|{fit}|{fmt}".encode()).hexdigest()
+        return f"{digest}.{image_render.FORMATS[fmt][1]}"
+
+    def _path(self, name: str) -> Path:
+        return self.root / name[:2] / name
+
+    def _lookup(self, name: str) -> Path | None:
+        """적중이면 LRU 맨 뒤로 옮기고 경로 반환 (동기, 스레드풀에서)."""
+        path = self._path(name)
+        with self._lock:
+            entry = self._index.get(name)
+            if entry is None:
+                return None
+            self._index.move_to_end(name)
+            touch = time.time() - entry[1] >= _TOUCH_INTERVAL
+            if touch:
+                self._index[name] = (entry[0], time.time())
+        if not path.is_file():
+            # 외부에서 지워짐 → 다시 생성
+            with self._lock:
+                if self._index.pop(name, None) is not None:
+                    self._total -= entry[0]
+            return None
+        if touch:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return path
+
+    def _add(self, name: str) -> None:
+        size = self._path(name).stat().st_size
+        with self._lock:
+            old = self._index.pop(name, None)
+            if old is not None:
+                self._total -= old[0]
+            self._index[name] = (size, time.time())
+            self._total += size
+        self._evict()
+
+    def _evict(self) -> None:
+        victims = []
+        with self._lock:
+            while self._total > self.max_bytes and len(self._index) > 1:
+                name, (size, _) = self._index.popitem(last=False)
+                self._total -= size
+                victims.append(name)
+        for name in victims:
+            self._path(name).unlink(missing_ok=True)
+        if victims:
+            logger.info("이미지 렌디션 캐시 %d개 정리 (현재 %.1fMB)", len(victims), self._total / (1024 * 1024))
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def get(self, src_path: str, source_key: str, width: int | None, height: int | None, fit: str, fmt: str) -> Path:
+        """렌디션 파일 경로 (없으면 변환 후 캐시). 같은 키의 동시 요청은 변환 1회를 공유."""
+        name = self.key(source_key, width, height, fit, fmt)
+        path = await run_in_threadpool(self._lookup, name)
+        if path is not None:
+            return path
+        task = self._inflight.get(name)
+        if task is None:
+            # 요청과 분리된 태스크: 먼저 온 요청이 끊겨도 변환·캐시는 끝까지 진행
+            task = asyncio.ensure_future(self._render(name, src_path, width, height, fit, fmt))
+            self._inflight[name] = task
+            task.add_done_callback(lambda t: self._render_done(name, t))
+        return await asyncio.shield(task)
+
+    def _render_done(self, name: str, task: asyncio.Task) -> None:
+        self._inflight.pop(name, None)
+        if not task.cancelled():
+            # 기다리던 요청이 모두 끊긴 경우에도 "exception was never retrieved" 경고가 남지 않게
+            task.exception()
+
+    async def _render(self, name: str, src_path: str, width: int | None, height: int | None, fit: str, fmt: str) -> Path:
+        path = self._path(name)
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(
+                self._executor(), image_render.render, src_path, str(path), width, height, fit, fmt
+            )
+        except BrokenProcessPool:
+            # 워커 비정상 종료(메모리 부족 등): 다음 요청 때 풀 재생성
+            self._reset_pool()
+            raise
+        await run_in_threadpool(self._add, name)
+        return path
+
+    def stop(self) -> None:
+        self._reset_pool()
+
+
+image_render_cache = ImageRenderCache()
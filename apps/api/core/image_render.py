@@ -0,0 +1,125 @@
+"""
+이미지 리사이즈·포맷 변환 (Pillow). 프로세스 풀 워커에서 호출하는 순수 함수만 둠 (DB·전역 상태 없음).
+- Pillow가 없으면 AVAILABLE=False → 호출 측이 파생본 생성을 건너뜀
+- AVIF는 Pillow AVIF 지원(내장 또는 pillow-avif-plugin)이 있을 때만
+- 결과 파일은 임시 이름으로 쓴 뒤 os.replace (동시 생성·중단 시 반쯤 쓴 파일이 보이지 않음)
+"""
+import os
+import uuid
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # 선택 의존성: 없으면 파생본 없이 원본만 사용
+    Image = None
+
+if Image is not None:
+    try:
+        import pillow_avif  # noqa: F401 (AVIF 저장 플러그인 등록)
+    except ImportError:
+        pass
+    Image.init()
+
+AVAILABLE = Image is not None
+
+# 포맷 → (Pillow 포맷명, 확장자, MIME)
+FORMATS = {
+    "avif": ("AVIF", "avif", "image/avif"),
+    "webp": ("WEBP", "webp", "image/webp"),
+    "jpeg": ("JPEG", "jpg", "image/jpeg"),
+    "png": ("PNG", "png", "image/png"),
+}
+_SAVE_OPTIONS = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 4},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+
+
+def can_encode(fmt: str) -> bool:
+    return AVAILABLE and fmt in FORMATS and FORMATS[fmt][0] in Image.SAVE
+
+
+def _has_alpha(im) -> bool:
+    return im.mode in ("RGBA", "LA", "PA") or (im.mode == "P" and "transparency" in im.info)
+
+
+def _open(src_path: str):
+    """원본 열기 (EXIF 회전 반영). 애니메이션이면 (None, size) — 첫 프레임만 줄이면 움직임이 사라지므로 변환하지 않음."""
+    with Image.open(src_path) as im:
+        if getattr(im, "is_animated", False):
+            return None, im.size
+        im = ImageOps.exif_transpose(im)
+        im.load()
+    if im.mode not in ("RGB", "RGBA"):
+        im = im.convert("RGBA" if _has_alpha(im) else "RGB")
+    return im, im.size
+
+
+def _save(im, dest: Path, fmt: str) -> int:
+    """포맷에 맞게 모드 변환 후 원자적 저장. 저장 크기(바이트) 반환."""
+    if fmt == "jpeg" and im.mode != "RGB":
+        if _has_alpha(im):
+            # 투명 영역은 흰 배경으로 (convert만 하면 검게 나옴)
+            background = Image.new("RGB", im.size, (255, 255, 255))
+            background.paste(im, mask=im.convert("RGBA").getchannel("A"))
+            im = background
+        else:
+            im = im.convert("RGB")
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        im.save(tmp, FORMATS[fmt][0], **_SAVE_OPTIONS[fmt])
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return dest.stat().st_size
+
+
+def render_variants(src_path: str, out_dir: str, widths: tuple[int, ...], formats: tuple[str, ...]) -> dict:
+    """원본보다 작은 각 폭 × 포맷 파생본 생성.
+    → {"width", "height", "variants": [{"format", "width", "height", "file_name", "size_bytes"}]}
+    큰 폭부터 직전 결과를 다시 줄여 원본 디코딩·리샘플을 1회로. 알파가 있으면 jpeg 대신 png."""
+    im, (width, height) = _open(src_path)
+    result = {"width": width, "height": height, "variants": []}
+    if im is None:
+        return result
+    alpha = _has_alpha(im)
+    out = Path(out_dir)
+    source = im
+    for w in sorted((w for w in widths if w < width), reverse=True):
+        h = max(1, round(height * w / width))
+        source = source.resize((w, h), Image.LANCZOS, reducing_gap=3.0)
+        for fmt in formats:
+            fmt = "png" if fmt == "jpeg" and alpha else fmt
+            if not can_encode(fmt):
+                continue
+            file_name = f"{w}.{FORMATS[fmt][1]}"
+            size = _save(source, out / file_name, fmt)
+            result["variants"].append(
+                {"format": fmt, "width": w, "height": h, "file_name": file_name, "size_bytes": size}
+            )
+    return result
+
+
+def render(src_path: str, dest_path: str, width: int | None, height: int | None, fit: str, fmt: str) -> tuple[int, int]:
+    """요청 크기 렌디션 1개 생성 (GET /api/assets/{id}/image). 원본보다 키우지 않음. → (폭, 높이)
+    fit="contain": 비율 유지, w×h 상자 안에 맞춤 / fit="cover": w×h를 채우고 가운데 기준으로 잘라냄 (w·h 모두 필요).
+    애니메이션은 첫 프레임."""
+    with Image.open(src_path) as im:
+        im = ImageOps.exif_transpose(im)
+        im.load()
+    if im.mode not in ("RGB", "RGBA"):
+        im = im.convert("RGBA" if _has_alpha(im) else "RGB")
+    src_w, src_h = im.size
+    if fit == "cover" and width and height:
+        scale = min(1.0, src_w / width, src_h / height)
+        target = (max(1, round(width * scale)), max(1, round(height * scale)))
+        im = ImageOps.fit(im, target, Image.LANCZOS)
+    else:
+        box = (min(width or src_w, src_w), min(height or src_h, src_h))
+        im = im.copy()
+        im.thumbnail(box, Image.LANCZOS, reducing_gap=3.0)
+    _save(im, Path(dest_path), fmt)
+    return im.size
@@ -0,0 +1,312 @@
+"""
+업로드 이미지 파생본 (폭별 리사이즈 + AVIF/WebP/JPEG).
+- 업로드 직후 schedule() → 프로세스 풀(spawn)에서 image_render.render_variants, 결과는 기록 스레드가 asset_variants·assets.image_width/height에 기록
+- 파생본은 내용 해시 기준 variants/<h[0:2]>/<h[2:4]>/<sha256>/<w>.<ext> (같은 내용 자산이 공유)
+- 글 저장 시 apply_responsive_images(): 본문 <img>를 <picture data-variants>(AVIF·WebP source) + srcset·sizes·width·height·loading="lazy"로 재작성.
+  이미 재작성된 본문도 다시 넣으면 같은 결과 (편집기 왕복 시 중복 래핑 없음)
+- 저장이 파생본 생성보다 먼저 끝난 글은 기록 후 posts 라우터가 등록한 refresher가 다시 재작성
+- 목록 썸네일·로고: variant_paths()로 표시 폭에 맞는 파생본 경로 선택
+- generation: 파생본이 기록될 때마다 증가, 목록·글 ETag에 포함 (본문·썸네일 URL이 바뀌므로)
+"""
+import html
+import logging
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlalchemy import bindparam, text
+
+from apps.api.core import image_render
+from apps.api.core.asset_refs import extract_upload_paths
+from apps.api.core.cache import response_cache
+from apps.api.core.config import (
+    IMAGE_CONTENT_WIDTH,
+    IMAGE_VARIANT_FORMATS,
+    IMAGE_VARIANT_WIDTHS,
+    IMAGE_WORKERS,
+    UPLOAD_DIR,
+)
+from apps.api.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "webp")
+# <picture> source 순서 (선호도), img srcset 폴백 포맷
+_SOURCE_FORMATS = ("avif", "webp")
+_FALLBACK_FORMATS = ("jpeg", "png")
+# 목록 썸네일 파생본 선호 순서 (JSON URL 하나만 주므로 대부분 브라우저가 읽는 포맷)
+_THUMBNAIL_FORMATS = ("webp", "jpeg", "png")
+
+_PICTURE_RE = re.compile(r"<picture\b[^>]*\bdata-variants\b[^>]*>.*?(<img\b[^>]*>).*?</picture\s*>", re.IGNORECASE | re.DOTALL)
+_IMG_RE = re.compile(r"<img\b[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(r"""([^\s"'<>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+# 재작성 시 다시 계산하는 속성 (width/height는 편집기에서 지정한 값이 있으면 유지)
+_MANAGED_ATTRS = {"srcset", "sizes", "loading", "decoding"}
+
+
+def variant_dir(content_hash: str) -> str:
+    return f"variants/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+
+
+@dataclass
+class ImageInfo:
+    width: int
+    height: int
+    # 포맷 → [(폭, 높이, file_path)] 폭 오름차순
+    variants: dict[str, list[tuple[int, int, str]]] = field(default_factory=dict)
+
+
+def load_image_infos(db, paths) -> dict[str, ImageInfo]:
+    """assets.file_path 집합 → {file_path: ImageInfo} (크기를 아는 이미지만, IN 조회 1회)."""
+    paths = sorted({p for p in paths if p})
+    if not paths:
+        return {}
+    rows = db.execute(
+        text("""
+            SELECT a.file_path, a.image_width, a.image_height, v.format, v.width, v.height, v.file_path
+            FROM assets a
+            LEFT JOIN asset_variants v ON v.content_hash = a.content_hash
+            WHERE a.file_path IN :paths AND a.image_width IS NOT NULL
+        """).bindparams(bindparam("paths", expanding=True)),
+        {"paths": paths},
+    ).fetchall()
+    infos: dict[str, ImageInfo] = {}
+    seen = set()
+    for path, width, height, fmt, v_width, v_height, v_path in rows:
+        info = infos.setdefault(path, ImageInfo(int(width), int(height or 0)))
+        # 같은 blob을 가리키는 assets 행이 여럿이면 같은 파생본이 반복됨
+        if fmt is not None and (path, v_path) not in seen:
+            seen.add((path, v_path))
+            info.variants.setdefault(fmt, []).append((int(v_width), int(v_height), v_path))
+    for info in infos.values():
+        for entries in info.variants.values():
+            entries.sort()
+    return infos
+
+
+def variant_paths(db, paths, min_width: int) -> dict[str, str]:
+    """원본 file_path → 표시 폭(min_width) 이상인 가장 작은 파생본 file_path. 알맞은 파생본이 없으면 매핑 없음(원본 사용)."""
+    chosen = {}
+    for path, info in load_image_infos(db, paths).items():
+        for fmt in _THUMBNAIL_FORMATS:
+            fit = next((v for v in info.variants.get(fmt, ()) if v[0] >= min_width), None)
+            if fit is not None:
+                chosen[path] = fit[2]
+                break
+    return chosen
+
+
+def _parse_attrs(tag: str) -> list[tuple[str, str | None]]:
+    inner = tag[4:-1].rstrip().rstrip("/")
+    attrs = []
+    for m in _ATTR_RE.finditer(inner):
+        value = next((g for g in m.group(2, 3, 4) if g is not None), None)
+        attrs.append((m.group(1), value))
+    return attrs
+
+
+def _format_attrs(attrs: list[tuple[str, str | None]]) -> str:
+    return "".join(f" {name}" if value is None else f' {name}="{value}"' for name, value in attrs)
+
+
+def _srcset(prefix: str, entries: list[tuple[int, int, str]]) -> str:
+    return ", ".join(f"{prefix}/static/uploads/{path} {w}w" for w, _, path in entries)
+
+
+def _rewrite_img(tag: str, infos: dict[str, ImageInfo]) -> str:
+    attrs = _parse_attrs(tag)
+    values = {name.lower(): value for name, value in attrs}
+    src = html.unescape(values.get("src") or "")
+    paths = extract_upload_paths(src)
+    info = infos.get(next(iter(paths))) if len(paths) == 1 else None
+    if info is None:
+        return tag
+    kept = [(n, v) for n, v in attrs if n.lower() not in _MANAGED_ATTRS]
+    width_attr = values.get("width") or ""
+    height_attr = values.get("height") or ""
+    display_width = int(width_attr) if width_attr.isdigit() and int(width_attr) > 0 else info.width
+    if not width_attr:
+        kept.append(("width", str(info.width)))
+    if not height_attr and info.height:
+        kept.append(("height", str(max(1, round(info.height * display_width / info.width)))))
+    slot = min(display_width, IMAGE_CONTENT_WIDTH)
+    sizes = f"(max-width: {slot}px) 100vw, {slot}px"
+    prefix = src[:src.index("/static/uploads/")]
+    fallback = next((info.variants[f] for f in _FALLBACK_FORMATS if f in info.variants), None)
+    if fallback:
+        # 폴백 srcset에는 원본도 포함 (가장 큰 파생본보다 넓게 표시될 때)
+        kept.append(("srcset", html.escape(f"{_srcset(prefix, fallback)}, {src} {info.width}w", quote=True)))
+        kept.append(("sizes", sizes))
+    kept += [("loading", "lazy"), ("decoding", "async")]
+    img = f"<img{_format_attrs(kept)}>"
+    sources = [
+        f'<source type="{image_render.FORMATS[f][2]}" srcset="{html.escape(_srcset(prefix, info.variants[f]), quote=True)}" sizes="{sizes}">'
+        for f in _SOURCE_FORMATS if f in info.variants
+    ]
+    if not sources:
+        return img
+    return f'<picture data-variants="1">{"".join(sources)}{img}</picture>'
+
+
+def apply_responsive_images(db, content_html: str | None) -> str | None:
+    """본문 <img>(업로드 이미지)를 파생본 srcset·<picture>로 재작성. 이전 재작성 결과는 먼저 풀어서 다시 계산."""
+    if not content_html or "<img" not in content_html.lower():
+        return content_html
+    unwrapped = _PICTURE_RE.sub(lambda m: m.group(1), content_html)
+    tags = _IMG_RE.findall(unwrapped)
+    paths = set()
+    for tag in tags:
+        src = next((v for n, v in _parse_attrs(tag) if n.lower() == "src"), None)
+        paths |= extract_upload_paths(html.unescape(src or ""))
+    infos = load_image_infos(db, paths)
+    if not infos:
+        return unwrapped
+    return _IMG_RE.sub(lambda m: _rewrite_img(m.group(0), infos), unwrapped)
+
+
+def record_variants(db, content_hash: str, result: dict) -> None:
+    """render_variants 결과 기록 (같은 내용 자산 전체의 크기 + 파생본 목록 교체). 커밋은 호출 측."""
+    db.execute(
+        text("UPDATE assets SET image_width = :w, image_height = :h WHERE content_hash = :hash"),
+        {"w": result["width"], "h": result["height"], "hash": content_hash},
+    )
+    db.execute(text("DELETE FROM asset_variants WHERE content_hash = :hash"), {"hash": content_hash})
+    if result["variants"]:
+        base = variant_dir(content_hash)
+        db.execute(
+            text("""
+                INSERT INTO asset_variants (content_hash, format, width, height, file_path, size_bytes)
+                VALUES (:hash, :format, :width, :height, :file_path, :size_bytes)
+            """),
+            [
+                {
+                    "hash": content_hash,
+                    "format": v["format"],
+                    "width": v["width"],
+                    "height": v["height"],
+                    "file_path": f"{base}/{v['file_name']}",
+                    "size_bytes": v["size_bytes"],
+                }
+                for v in result["variants"]
+            ],
+        )
+
+
+class ImageVariantPipeline:
+    def __init__(
+        self,
+        workers: int = IMAGE_WORKERS,
+        widths: tuple[int, ...] = IMAGE_VARIANT_WIDTHS,
+        formats: tuple[str, ...] = IMAGE_VARIANT_FORMATS,
+    ):
+        self.workers = workers
+        self.widths = widths
+        self.formats = formats
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._inflight: set[str] = set()
+        self._pool: ProcessPoolExecutor | None = None
+        self._recorder: ThreadPoolExecutor | None = None
+        self._refresher = None
+
+    def set_refresher(self, fn) -> None:
+        """fn(db, content_hash) — 파생본 기록 후 이 내용을 참조하는 글 본문 재작성 (커밋 포함)."""
+        self._refresher = fn
+
+    @property
+    def enabled(self) -> bool:
+        return image_render.AVAILABLE and bool(self.formats) and bool(self.widths)
+
+    def _executors(self) -> tuple[ProcessPoolExecutor, ThreadPoolExecutor]:
+        with self._lock:
+            if self._pool is None:
+                # spawn: 스레드가 도는 서버 프로세스를 fork하지 않음
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            if self._recorder is None:
+                self._recorder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-variants")
+            return self._pool, self._recorder
+
+    def schedule(self, content_hash: str, file_path: str) -> bool:
+        """파생본 생성 예약 (같은 내용이 이미 진행 중이면 무시). 이미지 확장자만."""
+        if not self.enabled or file_path.rsplit(".", 1)[-1].lower() not in IMAGE_EXTENSIONS:
+            return False
+        with self._lock:
+            if content_hash in self._inflight:
+                return False
+            self._inflight.add(content_hash)
+        pool, recorder = self._executors()
+        try:
+            future = pool.submit(
+                image_render.render_variants,
+                str(Path(UPLOAD_DIR) / file_path),
+                str(Path(UPLOAD_DIR) / variant_dir(content_hash)),
+                self.widths,
+                self.formats,
+            )
+        except (RuntimeError, BrokenProcessPool) as e:
+            self._finish(content_hash, broken=isinstance(e, BrokenProcessPool))
+            logger.warning("이미지 파생본 예약 실패 %s: %s", content_hash, e)
+            return False
+        future.add_done_callback(lambda f: self._submit_record(recorder, content_hash, f))
+        return True
+
+    def _submit_record(self, recorder: ThreadPoolExecutor, content_hash: str, future) -> None:
+        try:
+            recorder.submit(self._record, content_hash, future)
+        except RuntimeError:
+            # 종료 중
+            self._finish(content_hash)
+
+    def _finish(self, content_hash: str, broken: bool = False) -> None:
+        with self._lock:
+            self._inflight.discard(content_hash)
+            if broken and self._pool is not None:
+                # 워커 비정상 종료(메모리 부족 등): 다음 예약 때 풀 재생성
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _record(self, content_hash: str, future) -> None:
+        try:
+            result = future.result()
+        except BrokenProcessPool as e:
+            self._finish(content_hash, broken=True)
+            logger.warning("이미지 파생본 생성 실패 (워커 종료) %s: %s", content_hash, e)
+            return
+        except Exception as e:
+            self._finish(content_hash)
+            logger.warning("이미지 파생본 생성 실패 %s: %s", content_hash, e)
+            return
+        db = SessionLocal()
+        try:
+            record_variants(db, content_hash, result)
+            db.commit()
+            self.generation += 1
+            if self._refresher is not None:
+                self._refresher(db, content_hash)
+        except Exception as e:
+            db.rollback()
+            logger.warning("이미지 파생본 기록 실패 %s: %s", content_hash, e)
+        finally:
+            db.close()
+            self._finish(content_hash)
+        response_cache.invalidate("posts", "projects", "careers")
+        logger.info("이미지 파생본 %d개 생성: %s", len(result["variants"]), content_hash)
+
+    def stop(self) -> None:
+        """진행 중이 아닌 예약은 취소 (미생성분은 scripts/backfill_image_variants.py로 보충)."""
+        with self._lock:
+            pool, recorder = self._pool, self._recorder
+            self._pool = self._recorder = None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        if recorder is not None:
+            recorder.shutdown(wait=True, cancel_futures=True)
+
+
+image_variants = ImageVariantPipeline()
@@ -0,0 +1,86 @@
+"""
+발행 글 정렬 카탈로그 (이전/다음 글 조회용).
+- PUBLISHED + published_at 있는 글의 (published_at, id) 정렬 리스트와 id → 제목 맵
+- 서버 시작 시 구성, create/update/delete 시 글 단위 갱신
+- 예약 발행 글도 보관하고 조회 시각 기준으로 공개 여부 판단 → 발행 시각 도래 즉시 반영
+- 이웃 조회는 bisect (DB 조회 없음)
+"""
+import logging
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+from apps.api.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class PostCatalog:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys: list[tuple[datetime, int]] = []
+        self._entries: dict[int, tuple[datetime, str]] = {}
+
+    def rebuild(self) -> None:
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                text("""
+                    SELECT id, published_at, title FROM posts
+                    WHERE status = 'PUBLISHED' AND published_at IS NOT NULL
+                """)
+            ).fetchall()
+        finally:
+            db.close()
+        entries = {r[0]: (r[1], r[2] or "") for r in rows}
+        keys = sorted((pub, pid) for pid, (pub, _) in entries.items())
+        with self._lock:
+            self._entries = entries
+            self._keys = keys
+        logger.info("발행 글 카탈로그 구성 완료: %d건", len(keys))
+
+    def _remove_locked(self, post_id: int) -> None:
+        entry = self._entries.pop(post_id, None)
+        if entry is None:
+            return
+        key = (entry[0], post_id)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def upsert(self, post_id: int, status: str | None, published_at: datetime | None, title: str | None) -> None:
+        """글 상태 반영. PUBLISHED + published_at 있을 때만 카탈로그에 유지."""
+        with self._lock:
+            self._remove_locked(post_id)
+            if status == "PUBLISHED" and published_at is not None:
+                self._entries[post_id] = (published_at, title or "")
+                insort(self._keys, (published_at, post_id))
+
+    def remove(self, post_id: int) -> None:
+        with self._lock:
+            self._remove_locked(post_id)
+
+    def neighbors(self, post_id: int, now: datetime | None = None):
+        """공개된 글이면 (older, newer) 각 {"id", "title"} 또는 None. 공개 전/없는 글이면 None."""
+        now = now or _utcnow()
+        with self._lock:
+            entry = self._entries.get(post_id)
+            if entry is None or entry[0] > now:
+                return None
+            i = bisect_left(self._keys, (entry[0], post_id))
+            older = self._keys[i - 1] if i > 0 else None
+            # 정렬 리스트이므로 바로 다음 글이 예약(미래) 글이면 그 뒤도 모두 미래
+            newer = self._keys[i + 1] if i + 1 < len(self._keys) and self._keys[i + 1][0] <= now else None
+            return (
+                {"id": older[1], "title": self._entries[older[1]][1]} if older else None,
+                {"id": newer[1], "title": self._entries[newer[1]][1]} if newer else None,
+            )
+
+
+post_catalog = PostCatalog()
@@ -0,0 +1,153 @@
+"""
+게시글 목록 total용 인메모리 카운터.
+- 키: (상태, 카테고리, 태그, 말머리). 각 차원 None = 필터 없음
+- 카테고리는 목록 필터와 같이 대카테고리에도 하위(소) 카테고리 글을 합산
+- PUBLISHED 필터는 발행 시각이 도래한 글만 집계. 예약 글은 힙에 보관했다가 조회 시 도래분을 승격
+- 서버 시작 시 전체 구성, 글 create/update/delete 시 글 단위 갱신, 카테고리·말머리 변경 시 재구성
+"""
+import heapq
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import product
+
+from sqlalchemy import text
+
+from apps.api.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(frozen=True)
+class _PostState:
+    status: str | None
+    published_at: datetime | None
+    category_id: int | None
+    prefix_id: int | None
+    tag_ids: frozenset
+
+    def is_live(self, now: datetime) -> bool:
+        return self.status == "PUBLISHED" and self.published_at is not None and self.published_at <= now
+
+
+class PostCounters:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._posts: dict[int, _PostState] = {}
+        self._live: dict[int, bool] = {}
+        self._category_parent: dict[int, int | None] = {}
+        self._scheduled: list[tuple[datetime, int]] = []
+        self._rebuilding = False
+        self._changed_during_rebuild: dict[int, _PostState | None] = {}
+        self.ready = False
+
+    def _keys(self, state: _PostState, live: bool):
+        statuses = [None]
+        if state.status and state.status != "PUBLISHED":
+            statuses.append(state.status)
+        elif live:
+            statuses.append("PUBLISHED")
+        categories = [None]
+        if state.category_id is not None:
+            categories.append(state.category_id)
+            parent = self._category_parent.get(state.category_id)
+            if parent is not None:
+                categories.append(parent)
+        tags = [None, *state.tag_ids]
+        prefixes = [None] if state.prefix_id is None else [None, state.prefix_id]
+        return product(statuses, categories, tags, prefixes)
+
+    def _apply_locked(self, post_id: int, state: _PostState | None, now: datetime) -> None:
+        old = self._posts.pop(post_id, None)
+        if old is not None:
+            for key in self._keys(old, self._live.pop(post_id)):
+                self._counts[key] -= 1
+                if not self._counts[key]:
+                    del self._counts[key]
+        if state is None:
+            return
+        live = state.is_live(now)
+        self._posts[post_id] = state
+        self._live[post_id] = live
+        for key in self._keys(state, live):
+            self._counts[key] += 1
+        if state.status == "PUBLISHED" and state.published_at is not None and not live:
+            heapq.heappush(self._scheduled, (state.published_at, post_id))
+
+    def _promote_due_locked(self, now: datetime) -> None:
+        """발행 시각이 지난 예약 글을 PUBLISHED 집계로 이동. 이후 수정된 글의 낡은 항목은 건너뜀."""
+        while self._scheduled and self._scheduled[0][0] <= now:
+            published_at, post_id = heapq.heappop(self._scheduled)
+            state = self._posts.get(post_id)
+            if state is None or state.published_at != published_at or self._live.get(post_id):
+                continue
+            self._apply_locked(post_id, state, now)
+
+    def rebuild(self) -> None:
+        """DB 전체 글·태그·카테고리 계층으로 카운터 재구성. 구성 중 들어온 글 변경은 구성 후 재적용."""
+        with self._lock:
+            self._rebuilding = True
+            self._changed_during_rebuild = {}
+        db = SessionLocal()
+        try:
+            category_rows = db.execute(text("SELECT id, parent_id FROM categories")).fetchall()
+            post_rows = db.execute(
+                text("SELECT id, status, published_at, category_id, prefix_id FROM posts")
+            ).fetchall()
+            tag_rows = db.execute(text("SELECT post_id, tag_id FROM post_tags")).fetchall()
+        except Exception:
+            with self._lock:
+                self._rebuilding = False
+            raise
+        finally:
+            db.close()
+        tags_by_post: dict[int, set] = {}
+        for post_id, tag_id in tag_rows:
+            tags_by_post.setdefault(post_id, set()).add(tag_id)
+        now = _utcnow()
+        with self._lock:
+            self._counts = Counter()
+            self._posts = {}
+            self._live = {}
+            self._scheduled = []
+            self._category_parent = {r[0]: r[1] for r in category_rows}
+            for r in post_rows:
+                state = _PostState(r[1], r[2], r[3], r[4], frozenset(tags_by_post.get(r[0], ())))
+                self._apply_locked(r[0], state, now)
+            for post_id, state in self._changed_during_rebuild.items():
+                self._apply_locked(post_id, state, now)
+            self._changed_during_rebuild = {}
+            self._rebuilding = False
+            self.ready = True
+        logger.info("게시글 카운터 구성 완료: %d건, 키 %d개", len(post_rows), len(self._counts))
+
+    def upsert(self, post_id: int, status: str | None, published_at: datetime | None,
+               category_id: int | None, prefix_id: int | None, tag_ids) -> None:
+        state = _PostState(status, published_at, category_id, prefix_id, frozenset(tag_ids))
+        with self._lock:
+            if self._rebuilding:
+                self._changed_during_rebuild[post_id] = state
+            self._apply_locked(post_id, state, _utcnow())
+
+    def remove(self, post_id: int) -> None:
+        with self._lock:
+            if self._rebuilding:
+                self._changed_during_rebuild[post_id] = None
+            self._apply_locked(post_id, None, _utcnow())
+
+    def count(self, status: str | None = None, category_id: int | None = None,
+              tag_id: int | None = None, prefix_id: int | None = None) -> int:
+        """list_posts 필터 조합의 글 수. status=PUBLISHED는 발행 시각 도래 글만."""
+        with self._lock:
+            self._promote_due_locked(_utcnow())
+            return self._counts.get((status or None, category_id, tag_id, prefix_id), 0)
+
+
+post_counters = PostCounters()
@@ -0,0 +1,218 @@
+"""
+게시글 리비전 이력 (post_revisions).
+- 본문이 바뀐 저장마다 1건 기록. SNAPSHOT_INTERVAL건마다 전체 스냅샷(FULL), 그 사이는 직전 스냅샷 대비 편집 연산(DELTA)
+- payload는 zlib 압축 JSON. DELTA는 스냅샷 기준이므로 어떤 리비전이든 행 2개 조회 + 연산 1회 적용으로 복원
+- DELTA가 스냅샷 압축 크기의 일정 비율을 넘으면(대규모 개편) 새 스냅샷으로 기록
+- 리비전 번호는 posts 행 UPDATE 이후 같은 트랜잭션에서 배정 (행 잠금으로 동시 저장 직렬화). 커밋은 호출 측
+"""
+import difflib
+import json
+import re
+import zlib
+
+from sqlalchemy import text
+
+# FULL 스냅샷 이후 최대 DELTA 수
+SNAPSHOT_INTERVAL = 20
+# DELTA 압축 크기가 스냅샷 압축 크기의 이 비율을 넘으면 FULL로 기록
+_DELTA_MAX_RATIO = 0.5
+# 편집 연산 단위: 태그 끝(>)·줄바꿈·JSON 객체 끝(})까지
+_TOKEN_RE = re.compile(r"[^>\n}]*[>\n}]|[^>\n}]+")
+_CONTENT_FIELDS = ("content_html", "content_json")
+
+
+def _pack(obj) -> bytes:
+    return zlib.compress(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6)
+
+
+def _unpack(payload: bytes):
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+
+def make_delta(base: str, target: str) -> list:
+    """base → target 편집 연산: [0, start, end](base 구간 복사) / [1, text](삽입)."""
+    # 공통 접두·접미는 비교 대상에서 제외 (국소 편집이면 비교 구간이 작아짐)
+    prefix = 0
+    limit = min(len(base), len(target))
+    while prefix < limit and base[prefix] == target[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and base[-1 - suffix] == target[-1 - suffix]:
+        suffix += 1
+    ops: list = []
+
+    def _copy(start: int, end: int) -> None:
+        if start >= end:
+            return
+        if ops and ops[-1][0] == 0 and ops[-1][2] == start:
+            ops[-1][2] = end
+        else:
+            ops.append([0, start, end])
+
+    def _insert(value: str) -> None:
+        if not value:
+            return
+        if ops and ops[-1][0] == 1:
+            ops[-1][1] += value
+        else:
+            ops.append([1, value])
+
+    _copy(0, prefix)
+    a_mid = base[prefix:len(base) - suffix]
+    b_mid = target[prefix:len(target) - suffix]
+    a_tokens = _TOKEN_RE.findall(a_mid)
+    b_tokens = _TOKEN_RE.findall(b_mid)
+    a_offsets = [prefix]
+    for tok in a_tokens:
+        a_offsets.append(a_offsets[-1] + len(tok))
+    # autojunk: 반복이 많은 토큰(<p> 등)을 매칭 시작점에서 제외해 대용량 본문에서도 비교 시간이 폭증하지 않게 함
+    matcher = difflib.SequenceMatcher(None, a_tokens, b_tokens)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            _copy(a_offsets[i1], a_offsets[i2])
+        elif tag in ("replace", "insert"):
+            _insert("".join(b_tokens[j1:j2]))
+    _copy(len(base) - suffix, len(base))
+    return ops
+
+
+def apply_delta(base: str, ops: list) -> str:
+    return "".join(base[op[1]:op[2]] if op[0] == 0 else op[1] for op in ops)
+
+
+def _content_bytes(doc: dict) -> int:
+    return sum(len((doc.get(f) or "").encode("utf-8")) for f in _CONTENT_FIELDS)
+
+
+def record_revision(db, post_id: int, title: str, content_html: str | None, content_json: str | None,
+                    content_hash: str | None) -> int | None:
+    """저장된 본문을 새 리비전으로 기록 → rev_no. 직전 리비전과 제목·본문 해시가 같으면 기록하지 않음(None)."""
+    latest = db.execute(
+        text("""
+            SELECT rev_no, kind, base_rev_no, content_hash, title FROM post_revisions
+            WHERE post_id = :pid ORDER BY rev_no DESC LIMIT 1
+        """),
+        {"pid": post_id},
+    ).fetchone()
+    if latest and content_hash and latest[3] == content_hash and latest[4] == title:
+        return None
+    doc = {"content_html": content_html, "content_json": content_json}
+    rev_no = latest[0] + 1 if latest else 1
+    full_payload = _pack(doc)
+    kind, base_rev_no, payload = "FULL", None, full_payload
+    if latest:
+        snapshot_rev = latest[0] if latest[1] == "FULL" else latest[2]
+        if rev_no - snapshot_rev <= SNAPSHOT_INTERVAL:
+            snapshot = _load_payload(db, post_id, snapshot_rev)
+            if snapshot is not None:
+                delta = {
+                    f: None if doc[f] is None else make_delta(snapshot.get(f) or "", doc[f])
+                    for f in _CONTENT_FIELDS
+                }
+                delta_payload = _pack(delta)
+                if len(delta_payload) <= len(full_payload) * _DELTA_MAX_RATIO:
+                    kind, base_rev_no, payload = "DELTA", snapshot_rev, delta_payload
+    db.execute(
+        text("""
+            INSERT INTO post_revisions (post_id, rev_no, base_rev_no, kind, payload, content_hash, title, content_bytes, created_at)
+            VALUES (:pid, :rev_no, :base_rev_no, :kind, :payload, :content_hash, :title, :content_bytes, UTC_TIMESTAMP())
+        """),
+        {
+            "pid": post_id,
+            "rev_no": rev_no,
+            "base_rev_no": base_rev_no,
+            "kind": kind,
+            "payload": payload,
+            "content_hash": content_hash,
+            "title": title,
+            "content_bytes": _content_bytes(doc),
+        },
+    )
+    return rev_no
+
+
+def _load_payload(db, post_id: int, rev_no: int) -> dict | None:
+    row = db.execute(
+        text("SELECT payload FROM post_revisions WHERE post_id = :pid AND rev_no = :rev_no AND kind = 'FULL'"),
+        {"pid": post_id, "rev_no": rev_no},
+    ).fetchone()
+    return _unpack(row[0]) if row else None
+
+
+def load_revision(db, post_id: int, rev_no: int) -> dict | None:
+    """리비전 복원 → {rev_no, title, content_html, content_json, content_hash, created_at}. 없으면 None."""
+    row = db.execute(
+        text("""
+            SELECT rev_no, kind, base_rev_no, payload, title, content_hash, created_at
+            FROM post_revisions WHERE post_id = :pid AND rev_no = :rev_no
+        """),
+        {"pid": post_id, "rev_no": rev_no},
+    ).fetchone()
+    if not row:
+        return None
+    if row[1] == "FULL":
+        doc = _unpack(row[3])
+    else:
+        snapshot = _load_payload(db, post_id, row[2])
+        if snapshot is None:
+            return None
+        delta = _unpack(row[3])
+        doc = {
+            f: None if delta.get(f) is None else apply_delta(snapshot.get(f) or "", delta[f])
+            for f in _CONTENT_FIELDS
+        }
+    return {
+        "rev_no": row[0],
+        "title": row[4],
+        "content_html": doc.get("content_html"),
+        "content_json": doc.get("content_json"),
+        "content_hash": row[5],
+        "created_at": row[6],
+    }
+
+
+def list_revisions(db, post_id: int, limit: int = 50, before: int | None = None) -> list[dict]:
+    """리비전 목록(최신순, payload 제외). before: 이 번호 미만만."""
+    before_sql = " AND rev_no < :before" if before is not None else ""
+    rows = db.execute(
+        text(f"""
+            SELECT rev_no, kind, title, content_bytes, LENGTH(payload), created_at
+            FROM post_revisions WHERE post_id = :pid{before_sql}
+            ORDER BY rev_no DESC LIMIT :limit
+        """),
+        {"pid": post_id, "before": before, "limit": limit},
+    ).fetchall()
+    return [
+        {
+            "rev_no": r[0],
+            "kind": r[1],
+            "title": r[2],
+            "content_bytes": r[3],
+            "stored_bytes": r[4],
+            "created_at": r[5],
+        }
+        for r in rows
+    ]
+
+
+def _diff_lines(content_html: str | None) -> list[str]:
+    # 태그 경계마다 줄을 나눠 한 줄짜리 HTML도 읽을 수 있는 diff로
+    return re.sub(r">\s*<", ">\n<", content_html or "").splitlines()
+
+
+def diff_revisions(old: dict | None, new: dict) -> dict:
+    """두 리비전(old 없으면 빈 문서 기준)의 제목·content_html unified diff."""
+    old = old or {"rev_no": None, "title": "", "content_html": ""}
+    return {
+        "from_rev": old["rev_no"],
+        "to_rev": new["rev_no"],
+        "title": None if old["title"] == new["title"] else {"from": old["title"], "to": new["title"]},
+        "content_html": "\n".join(difflib.unified_diff(
+            _diff_lines(old["content_html"]),
+            _diff_lines(new["content_html"]),
+            fromfile=f"rev {old['rev_no']}" if old["rev_no"] else "empty",
+            tofile=f"rev {new['rev_no']}",
+            lineterm="",
+        )),
+    }
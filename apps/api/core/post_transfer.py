@@ -0,0 +1,408 @@
+"""
+게시글 대량 내보내기/가져오기 (NDJSON, 한 줄 = 글 1건).
+- 내보내기: posts를 서버 측 커서(stream_results)로 순회, 태그·첨부는 배치 단위 IN 조회 → 메모리 일정
+- 가져오기: 줄 단위 파싱 후 청크마다 다중 행 INSERT(executemany) + 청크 단위 커밋
+  slug는 기존 글/파일 내 중복이면 건너뜀, 태그는 이름으로 연결(없으면 생성),
+  카테고리·말머리·썸네일·첨부는 현재 DB에 있는 id만 유지.
+  저장 경로와 같이 본문 파생(이미지 srcset·제목 앵커·요약·목차), content_hash, 본문 참조 자산(post_asset_refs),
+  사전 압축본(post_content_encoded)까지 청크 안에서 기록 → 적재 후 백필 불필요
+  (이미지 파생본이 아직 없는 자산은 생성 시 기존 refresher가 본문을 다시 작성)
+- 파싱·적재는 모두 스레드풀에서 (feed_lines), 이벤트 루프는 줄 나누기만. 한 줄 상한 IMPORT_MAX_LINE_BYTES
+"""
+import json
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from apps.api.core.asset_refs import extract_upload_paths, resolve_assets
+from apps.api.core.compression import encode_stored
+from apps.api.core.content_derive import content_hash, derive_content
+from apps.api.core.database import SessionLocal
+from apps.api.core.image_variants import apply_responsive_images
+from apps.api.core.publish_scheduler import is_live
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 500
+IMPORT_CHUNK_SIZE = 1000
+# 한 줄(글 1건) 최대 크기: 넘으면 해당 줄만 실패 처리하고 다음 줄바꿈까지 버림
+IMPORT_MAX_LINE_BYTES = 8 * 1024 * 1024
+# 요약 응답에 담을 최대 오류 건수
+_MAX_REPORTED_ERRORS = 100
+_STATUSES = ("DRAFT", "PUBLISHED", "PRIVATE", "UNLISTED")
+
+
+def _isoformat_utc(dt: datetime | None) -> str | None:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _parse_datetime(s) -> datetime | None:
+    """ISO 8601 → naive UTC. 형식 오류면 None."""
+    if not s:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(s).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+# ---------------------------------------------------------------------------
+# 내보내기
+# ---------------------------------------------------------------------------
+
+def _export_children(db, post_ids: list[int]) -> tuple[dict, dict]:
+    tags: dict[int, list[str]] = {}
+    attachments: dict[int, list[dict]] = {}
+    rows = db.execute(
+        text("""
+            SELECT pt.post_id, t.name FROM post_tags pt JOIN tags t ON t.id = pt.tag_id
+            WHERE pt.post_id IN :ids ORDER BY pt.post_id, t.id
+        """).bindparams(bindparam("ids", expanding=True)),
+        {"ids": post_ids},
+    ).fetchall()
+    for post_id, name in rows:
+        tags.setdefault(post_id, []).append(name)
+    rows = db.execute(
+        text("""
+            SELECT pa.post_id, pa.asset_id, pa.sort_order, a.file_path
+            FROM post_attachments pa JOIN assets a ON a.id = pa.asset_id
+            WHERE pa.post_id IN :ids ORDER BY pa.post_id, pa.sort_order, pa.asset_id
+        """).bindparams(bindparam("ids", expanding=True)),
+        {"ids": post_ids},
+    ).fetchall()
+    for post_id, asset_id, sort_order, file_path in rows:
+        attachments.setdefault(post_id, []).append(
+            {"asset_id": asset_id, "sort_order": sort_order, "file_path": file_path}
+        )
+    return tags, attachments
+
+
+def iter_export_lines(batch_size: int = EXPORT_BATCH_SIZE):
+    """NDJSON 줄(bytes) 생성기. posts 순회용 커넥션(서버 측 커서)과 태그·첨부 조회용 세션을 분리."""
+    stream_db = SessionLocal()
+    child_db = SessionLocal()
+    try:
+        result = stream_db.connection().execution_options(stream_results=True).execute(
+            text("""
+                SELECT id, title, slug, status, published_at, category_id, prefix_id, thumbnail_asset_id,
+                       content_html, content_json, COALESCE(view_count, 0), created_at, updated_at
+                FROM posts ORDER BY id
+            """)
+        )
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            tags, attachments = _export_children(child_db, [r[0] for r in rows])
+            child_db.rollback()  # 배치마다 읽기 스냅샷을 놓아 undo 누적 방지
+            lines = []
+            for r in rows:
+                lines.append(json.dumps({
+                    "id": r[0],
+                    "title": r[1],
+                    "slug": r[2],
+                    "status": r[3],
+                    "published_at": _isoformat_utc(r[4]),
+                    "category_id": r[5],
+                    "prefix_id": r[6],
+                    "thumbnail_asset_id": r[7],
+                    "content_html": r[8],
+                    "content_json": r[9],
+                    "view_count": int(r[10]),
+                    "created_at": _isoformat_utc(r[11]),
+                    "updated_at": _isoformat_utc(r[12]),
+                    "tags": tags.get(r[0], []),
+                    "attachments": attachments.get(r[0], []),
+                }, ensure_ascii=False))
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+        result.close()
+    finally:
+        child_db.close()
+        stream_db.close()
+
+
+# ---------------------------------------------------------------------------
+# 가져오기
+# ---------------------------------------------------------------------------
+
+def _optional_id(item: dict, key: str) -> int | None:
+    v = item.get(key)
+    if v is None:
+        return None
+    if isinstance(v, bool) or not isinstance(v, int):
+        raise ValueError(f"{key}는 정수여야 합니다.")
+    return v
+
+
+def _normalize_item(item: dict) -> dict:
+    """NDJSON 객체 → INSERT용 값. 형식 오류는 ValueError (해당 줄만 실패 처리)."""
+    slug = str(item.get("slug") or "").strip()
+    if not slug:
+        raise ValueError("slug가 없습니다.")
+    status = item.get("status") or "DRAFT"
+    if status not in _STATUSES:
+        raise ValueError(f"알 수 없는 상태: {status}")
+    try:
+        view_count = int(item.get("view_count") or 0)
+    except (TypeError, ValueError):
+        raise ValueError("view_count는 정수여야 합니다.")
+    tags = item.get("tags") or []
+    attachments = item.get("attachments") or []
+    if not isinstance(tags, list) or not isinstance(attachments, list):
+        raise ValueError("tags/attachments는 배열이어야 합니다.")
+    tag_names = list(dict.fromkeys(str(n).strip()[:50] for n in tags if str(n).strip()))
+    att_pairs = []
+    seen = set()
+    for idx, att in enumerate(attachments):
+        if not isinstance(att, dict):
+            raise ValueError("attachments 항목은 객체여야 합니다.")
+        aid = _optional_id(att, "asset_id")
+        if aid is not None and aid not in seen:
+            seen.add(aid)
+            order = att.get("sort_order")
+            att_pairs.append((aid, order if isinstance(order, int) else idx))
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return {
+        "title": (str(item.get("title") or "").strip() or "제목 없음")[:200],
+        "slug": slug,
+        "status": status,
+        "published_at": _parse_datetime(item.get("published_at")),
+        "category_id": _optional_id(item, "category_id"),
+        "prefix_id": _optional_id(item, "prefix_id"),
+        "thumbnail_asset_id": _optional_id(item, "thumbnail_asset_id"),
+        "content_html": item.get("content_html"),
+        "content_json": item.get("content_json"),
+        "view_count": view_count,
+        "created_at": _parse_datetime(item.get("created_at")) or now,
+        "updated_at": _parse_datetime(item.get("updated_at")) or now,
+        "tags": tag_names,
+        "attachments": att_pairs,
+    }
+
+
+class PostImporter:
+    """NDJSON 줄을 받아 청크 단위로 적재. feed_line() → (청크가 찼으면) flush(), 마지막에 finish()."""
+
+    def __init__(self, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self._pending: list[tuple[int, dict]] = []
+        self._line_no = 0
+        self._seen_slugs: set[str] = set()
+        self._tag_ids: dict[str, int] = {}
+        self.imported = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors: list[dict] = []
+        self.progress: list[dict] = []
+
+    def _error(self, line_no: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < _MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_no, "error": message})
+
+    def feed_lines(self, lines: list[bytes | None]) -> None:
+        """여러 줄 파싱·적재 (동기: 스레드풀에서 호출). 청크가 찰 때마다 flush.
+        None은 IMPORT_MAX_LINE_BYTES를 넘어 읽지 않은 줄 → 실패로 기록."""
+        for line in lines:
+            if line is None:
+                self._line_no += 1
+                self._error(self._line_no, f"줄이 너무 깁니다. (최대 {IMPORT_MAX_LINE_BYTES // (1024 * 1024)}MB)")
+            elif self.feed_line(line):
+                self.flush()
+
+    def feed_line(self, raw: bytes | str) -> bool:
+        """한 줄 파싱 후 대기열에 추가. 청크가 차면 True (호출 측이 flush)."""
+        self._line_no += 1
+        try:
+            line = (raw.decode("utf-8") if isinstance(raw, bytes) else raw).strip()
+            if not line:
+                return False
+            item = json.loads(line)
+        except UnicodeDecodeError as e:
+            self._error(self._line_no, f"UTF-8 인코딩 오류: {e}")
+            return False
+        except ValueError as e:
+            self._error(self._line_no, f"JSON 형식 오류: {e}")
+            return False
+        if not isinstance(item, dict):
+            self._error(self._line_no, "각 줄은 JSON 객체여야 합니다.")
+            return False
+        self._pending.append((self._line_no, item))
+        return len(self._pending) >= self.chunk_size
+
+    def flush(self) -> None:
+        """대기 중인 청크를 한 트랜잭션으로 적재. 실패 시 해당 청크만 롤백하고 오류로 집계."""
+        if not self._pending:
+            return
+        chunk, self._pending = self._pending, []
+        db = SessionLocal()
+        try:
+            imported = self._insert_chunk(db, chunk)
+            db.commit()
+            self.imported += imported
+        except SQLAlchemyError as e:
+            db.rollback()
+            self._tag_ids.clear()  # 롤백된 청크에서 생성한 태그 id는 무효
+            logger.warning("글 가져오기 청크 실패 (줄 %d~%d): %s", chunk[0][0], chunk[-1][0], e)
+            for line_no, _ in chunk:
+                self._error(line_no, "청크 적재 실패로 롤백되었습니다.")
+        finally:
+            db.close()
+        self.progress.append({
+            "lines": self._line_no, "imported": self.imported, "skipped": self.skipped, "failed": self.failed,
+        })
+        logger.info("글 가져오기 진행: %d줄, 적재 %d, 건너뜀 %d, 실패 %d",
+                    self._line_no, self.imported, self.skipped, self.failed)
+
+    def finish(self) -> dict:
+        self.flush()
+        return {
+            "lines": self._line_no,
+            "imported": self.imported,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "errors": self.errors,
+            "progress": self.progress,
+        }
+
+    def _existing_ids(self, db, table: str, ids: set) -> set:
+        if not ids:
+            return set()
+        rows = db.execute(
+            text(f"SELECT id FROM {table} WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)),
+            {"ids": list(ids)},
+        ).fetchall()
+        return {r[0] for r in rows}
+
+    def _resolve_tags(self, db, names: set[str]) -> None:
+        """태그명 → id. 없는 태그는 INSERT IGNORE로 일괄 생성 후 재조회."""
+        missing = [n for n in names if n not in self._tag_ids]
+        if not missing:
+            return
+        db.execute(text("INSERT IGNORE INTO tags (name) VALUES (:name)"), [{"name": n} for n in missing])
+        rows = db.execute(
+            text("SELECT id, name FROM tags WHERE name IN :names").bindparams(bindparam("names", expanding=True)),
+            {"names": missing},
+        ).fetchall()
+        by_lower = {r[1].lower(): r[0] for r in rows}
+        for n in missing:
+            if n.lower() in by_lower:
+                self._tag_ids[n] = by_lower[n.lower()]
+
+    def _insert_chunk(self, db, chunk: list[tuple[int, dict]]) -> int:
+        # 1) 유효성·slug 중복 검사
+        candidates = []
+        for line_no, item in chunk:
+            try:
+                row = _normalize_item(item)
+            except ValueError as e:
+                self._error(line_no, str(e))
+                continue
+            slug = row["slug"]
+            if slug.lower() in self._seen_slugs:
+                self.skipped += 1
+                continue
+            self._seen_slugs.add(slug.lower())
+            candidates.append((line_no, slug, row))
+        if not candidates:
+            return 0
+        existing = db.execute(
+            text("SELECT slug FROM posts WHERE slug IN :slugs").bindparams(bindparam("slugs", expanding=True)),
+            {"slugs": [c[1] for c in candidates]},
+        ).fetchall()
+        existing_slugs = {r[0].lower() for r in existing}
+        fresh = [c for c in candidates if c[1].lower() not in existing_slugs]
+        self.skipped += len(candidates) - len(fresh)
+        if not fresh:
+            return 0
+
+        # 2) 참조 id 확인 (현재 DB에 없는 카테고리·말머리·자산은 NULL/제외)
+        rows = [c[2] for c in fresh]
+        categories = self._existing_ids(db, "categories", {r["category_id"] for r in rows} - {None})
+        prefixes = self._existing_ids(db, "post_prefixes", {r["prefix_id"] for r in rows} - {None})
+        asset_ids = {r["thumbnail_asset_id"] for r in rows} - {None}
+        for r in rows:
+            asset_ids.update(aid for aid, _ in r["attachments"])
+        assets = self._existing_ids(db, "assets", asset_ids)
+
+        # 3) 글 다중 행 INSERT (본문 파생·해시는 저장 API와 같은 규칙)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        post_rows = []
+        for r in rows:
+            r["content_hash"] = content_hash(r["content_html"], r["content_json"])
+            r["content_html"], derived = derive_content(apply_responsive_images(db, r["content_html"]))
+            post_rows.append({
+                **{k: v for k, v in r.items() if k not in ("tags", "attachments")},
+                **derived.columns(),
+                "is_live": is_live(r["status"], r["published_at"], now),
+                "category_id": r["category_id"] if r["category_id"] in categories else None,
+                "prefix_id": r["prefix_id"] if r["prefix_id"] in prefixes else None,
+                "thumbnail_asset_id": r["thumbnail_asset_id"] if r["thumbnail_asset_id"] in assets else None,
+            })
+        db.execute(
+            text("""
+                INSERT INTO posts (title, slug, status, published_at, is_live, category_id, prefix_id, thumbnail_asset_id,
+                                   content_html, content_json, content_hash, excerpt, word_count, char_count,
+                                   reading_minutes, toc_json, view_count, created_at, updated_at)
+                VALUES (:title, :slug, :status, :published_at, :is_live, :category_id, :prefix_id, :thumbnail_asset_id,
+                        :content_html, :content_json, :content_hash, :excerpt, :word_count, :char_count,
+                        :reading_minutes, :toc_json, :view_count, :created_at, :updated_at)
+            """),
+            post_rows,
+        )
+        id_rows = db.execute(
+            text("SELECT id, slug FROM posts WHERE slug IN :slugs").bindparams(bindparam("slugs", expanding=True)),
+            {"slugs": [c[1] for c in fresh]},
+        ).fetchall()
+        id_by_slug = {r[1].lower(): r[0] for r in id_rows}
+
+        # 4) 태그·첨부 다중 행 INSERT
+        self._resolve_tags(db, {n for r in rows for n in r["tags"]})
+        tag_rows, att_rows = [], []
+        for r in rows:
+            post_id = id_by_slug[r["slug"].lower()]
+            tag_ids = {self._tag_ids.get(n) for n in r["tags"]}
+            tag_rows.extend({"pid": post_id, "tid": tid} for tid in tag_ids if tid)
+            att_rows.extend({"pid": post_id, "aid": aid, "ord": order} for aid, order in r["attachments"] if aid in assets)
+        if tag_rows:
+            db.execute(text("INSERT INTO post_tags (post_id, tag_id) VALUES (:pid, :tid)"), tag_rows)
+        if att_rows:
+            db.execute(
+                text("INSERT INTO post_attachments (post_id, asset_id, sort_order) VALUES (:pid, :aid, :ord)"),
+                att_rows,
+            )
+
+        # 5) 본문 참조 자산 (청크 전체 경로를 IN 조회 1회), 사전 압축본
+        paths_by_post = {id_by_slug[r["slug"].lower()]: extract_upload_paths(r["content_html"]) for r in rows}
+        asset_by_path = {fp: aid for aid, fp in resolve_assets(db, set().union(*paths_by_post.values()))}
+        ref_rows = [
+            {"pid": post_id, "aid": asset_by_path[p]}
+            for post_id, paths in paths_by_post.items() for p in paths if p in asset_by_path
+        ]
+        if ref_rows:
+            db.execute(text("INSERT IGNORE INTO post_asset_refs (post_id, asset_id) VALUES (:pid, :aid)"), ref_rows)
+        encoded_rows = []
+        for r in rows:
+            data = (r["content_html"] or "").encode("utf-8")
+            encoded = encode_stored(data)
+            encoded_rows.append({
+                "pid": id_by_slug[r["slug"].lower()], "h": r["content_hash"],
+                "gz": encoded["gzip"], "br": encoded["br"], "n": len(data),
+            })
+        db.execute(
+            text("""
+                INSERT INTO post_content_encoded (post_id, content_hash, html_gzip, html_br, html_bytes, updated_at)
+                VALUES (:pid, :h, :gz, :br, :n, UTC_TIMESTAMP())
+            """),
+            encoded_rows,
+        )
+        return len(fresh)
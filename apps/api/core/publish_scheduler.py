@@ -0,0 +1,167 @@
+"""
+예약 발행 스케줄러.
+- posts.is_live(인덱스)로 공개 여부를 저장해 두고, 공개 쿼리는 published_at 시각 비교 대신 is_live = 1로 필터
+- 발행 예정 시각을 최소 힙으로 보관, 시각 도래 시 is_live = 1로 전환 후 리스너(캐시 무효화 등)에 통지
+- 시각 비교는 모두 앱 서버 시계(UTC) 기준: 글 저장(posts 라우터), 시작 시 보정(reload), 전환이 같은 기준을 사용
+"""
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import bindparam, text
+
+from apps.api.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 시계 변경 등에 대비한 최대 대기 시간, 전환 실패 시 재시도 지연
+_MAX_WAIT_SECONDS = 60
+_RETRY_DELAY = timedelta(seconds=5)
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def is_live(status: str | None, published_at: datetime | None, now: datetime | None = None) -> bool:
+    """공개 여부: PUBLISHED + 발행 시각 도래."""
+    return status == "PUBLISHED" and published_at is not None and published_at <= (now or utcnow())
+
+
+class PublishScheduler:
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap: list[tuple[datetime, int]] = []
+        self._listeners = []
+        self._stop = False
+        self._thread: threading.Thread | None = None
+
+    def add_listener(self, fn) -> None:
+        """fn(post_ids: list[int]) — 글이 공개 전환될 때 스케줄러 스레드에서 호출."""
+        self._listeners.append(fn)
+
+    def _emit(self, post_ids: list[int]) -> None:
+        for fn in self._listeners:
+            try:
+                fn(post_ids)
+            except Exception as e:
+                logger.exception("발행 이벤트 리스너 오류: %s", e)
+
+    def schedule(self, post_id: int, status: str | None, published_at: datetime | None) -> None:
+        """글 저장 후 호출. 발행 시각이 미래인 PUBLISHED 글만 힙에 추가 (이전 예약은 전환 시점에 조건으로 걸러짐)."""
+        if status != "PUBLISHED" or not isinstance(published_at, datetime) or published_at <= utcnow():
+            return
+        with self._cond:
+            heapq.heappush(self._heap, (published_at, post_id))
+            self._cond.notify()
+
+    def reload(self) -> None:
+        """DB 기준 is_live 보정(서버 정지 중 도래한 예약 포함) 후 예약 글 힙 재구성."""
+        now = utcnow()
+        db = SessionLocal()
+        try:
+            due = db.execute(
+                text("""
+                    SELECT id FROM posts
+                    WHERE is_live = 0 AND status = 'PUBLISHED' AND published_at IS NOT NULL AND published_at <= :now
+                """),
+                {"now": now},
+            ).fetchall()
+            went_live = [r[0] for r in due]
+            if went_live:
+                self._mark_live(db, went_live, now)
+            db.execute(
+                text("""
+                    UPDATE posts SET is_live = 0, updated_at = updated_at
+                    WHERE is_live = 1 AND NOT (status = 'PUBLISHED' AND published_at IS NOT NULL AND published_at <= :now)
+                """),
+                {"now": now},
+            )
+            upcoming = db.execute(
+                text("SELECT published_at, id FROM posts WHERE status = 'PUBLISHED' AND published_at > :now"),
+                {"now": now},
+            ).fetchall()
+            db.commit()
+        finally:
+            db.close()
+        heap = [(r[0], r[1]) for r in upcoming]
+        heapq.heapify(heap)
+        with self._cond:
+            self._heap = heap
+            self._cond.notify()
+        logger.info("예약 발행 스케줄 구성: 대기 %d건, 시작 시 공개 전환 %d건", len(heap), len(went_live))
+        if went_live:
+            self._emit(went_live)
+
+    @staticmethod
+    def _mark_live(db, post_ids: list[int], now: datetime) -> int:
+        result = db.execute(
+            text("""
+                UPDATE posts SET is_live = 1, updated_at = updated_at
+                WHERE id IN :ids AND is_live = 0
+                  AND status = 'PUBLISHED' AND published_at IS NOT NULL AND published_at <= :now
+            """).bindparams(bindparam("ids", expanding=True)),
+            {"ids": post_ids, "now": now},
+        )
+        return result.rowcount
+
+    def _publish_due(self, due: list[tuple[datetime, int]], now: datetime) -> None:
+        post_ids = sorted({pid for _, pid in due})
+        db = SessionLocal()
+        try:
+            changed = self._mark_live(db, post_ids, now)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        if changed:
+            logger.info("예약 글 공개 전환: %s", post_ids)
+            self._emit(post_ids)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stop:
+                    now = utcnow()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    timeout = _MAX_WAIT_SECONDS
+                    if self._heap:
+                        timeout = min(timeout, (self._heap[0][0] - now).total_seconds())
+                    self._cond.wait(timeout)
+                if self._stop:
+                    return
+                now = utcnow()
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap))
+            try:
+                self._publish_due(due, now)
+            except Exception as e:
+                logger.warning("예약 글 공개 전환 실패 (재시도 예정): %s", e)
+                with self._cond:
+                    for _, pid in due:
+                        heapq.heappush(self._heap, (now + _RETRY_DELAY, pid))
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self.reload()
+        with self._cond:
+            self._stop = False
+        self._thread = threading.Thread(target=self._run, name="publish-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stop = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+publish_scheduler = PublishScheduler()
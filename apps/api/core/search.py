@@ -0,0 +1,302 @@
+"""
+게시글 전문 검색 (인메모리 역색인).
+- 제목 + content_html 본문 텍스트를 색인. 한글은 음절 bi-gram + 음절 단위(1글자 검색어용), 영문·숫자는 단어 단위(소문자)
+- BM25 랭킹, 모든 검색어 토큰을 포함한 글만 결과 (가장 드문 토큰의 posting부터 교집합)
+- create/update/delete 시 글 단위로 증분 갱신, 서버 시작 시 백그라운드로 전체 색인
+  (색인 중 요청이 갱신·삭제한 글은 전체 색인이 먼저 읽어 둔 행으로 덮어쓰지 않음)
+- 본문 텍스트는 색인에 보관하지 않음: 스니펫은 결과 페이지 글만 DB에서 읽어 생성 (load_snippets)
+"""
+import html
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+
+from sqlalchemy import bindparam, text
+
+from apps.api.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[A-Za-z0-9]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+_SKIP_TAGS = {"script", "style"}
+_BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6",
+    "pre", "blockquote", "table", "tr", "td", "th", "hr", "section", "article",
+}
+
+# BM25 파라미터, 제목 토큰 가중치
+_K1 = 1.2
+_B = 0.75
+_TITLE_WEIGHT = 3
+# 색인할 본문 텍스트 최대 길이
+_MAX_INDEX_CHARS = 50_000
+_SNIPPET_RADIUS = 70
+
+
+class _TextExtractor(HTMLParser):
+    """HTML에서 표시 텍스트만 추출 (script/style 제외, 블록 태그 경계는 공백)."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag in _BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def html_to_text(content_html: str | None) -> str:
+    """content_html → 공백 정규화된 평문."""
+    if not content_html:
+        return ""
+    parser = _TextExtractor()
+    parser.feed(content_html)
+    parser.close()
+    return " ".join("".join(parser.parts).split())
+
+
+def tokenize(s: str | None, unigrams: bool = False) -> list[str]:
+    """한글 연속 구간은 음절 bi-gram(1글자면 그대로), 영문·숫자는 소문자 단어.
+    unigrams=True(색인 시): 2글자 이상 한글 구간의 음절도 추가 → "글" 같은 1글자 검색어가 "블로그글" 안에서도 매칭."""
+    if not s:
+        return []
+    tokens = []
+    for m in _TOKEN_RE.finditer(s):
+        word = m.group(0)
+        if _HANGUL_RE.match(word):
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+                if unigrams:
+                    tokens.extend(word)
+        else:
+            tokens.append(word.lower())
+    return tokens
+
+
+@dataclass
+class _Doc:
+    title: str
+    slug: str
+    status: str
+    published_at: datetime | None
+    category_id: int | None
+    length: int
+    terms: frozenset
+
+
+class SearchIndex:
+    """게시글 역색인. term → {post_id: 가중 tf}."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: dict[str, dict[int, int]] = {}
+        self._docs: dict[int, _Doc] = {}
+        self._total_length = 0
+        # 전체 색인 진행 중 요청 경로에서 갱신·삭제된 post_id (None이면 전체 색인 중 아님)
+        self._touched: set[int] | None = None
+        self.ready = False
+
+    def _remove_locked(self, post_id: int) -> None:
+        doc = self._docs.pop(post_id, None)
+        if doc is None:
+            return
+        self._total_length -= doc.length
+        for term in doc.terms:
+            plist = self._postings.get(term)
+            if plist is None:
+                continue
+            plist.pop(post_id, None)
+            if not plist:
+                del self._postings[term]
+
+    @staticmethod
+    def _build_doc(title: str | None, content_html: str | None, slug: str | None, status: str | None,
+                   published_at: datetime | None, category_id: int | None) -> tuple[_Doc, Counter]:
+        """토큰화 (락 밖에서 호출)."""
+        title = title or ""
+        body = html_to_text(content_html)[:_MAX_INDEX_CHARS]
+        tf = Counter()
+        for term in tokenize(title, unigrams=True):
+            tf[term] += _TITLE_WEIGHT
+        for term in tokenize(body, unigrams=True):
+            tf[term] += 1
+        length = sum(tf.values())
+        doc = _Doc(title, slug or "", status or "", published_at, category_id, length, frozenset(tf))
+        return doc, tf
+
+    def _add_locked(self, post_id: int, doc: _Doc, tf: Counter) -> None:
+        self._remove_locked(post_id)
+        self._docs[post_id] = doc
+        self._total_length += doc.length
+        for term, n in tf.items():
+            self._postings.setdefault(term, {})[post_id] = n
+
+    def upsert(self, post_id: int, title: str | None, content_html: str | None, slug: str | None,
+               status: str | None, published_at: datetime | None, category_id: int | None) -> None:
+        """글 1건 색인(재색인). 토큰화는 락 밖에서 수행."""
+        doc, tf = self._build_doc(title, content_html, slug, status, published_at, category_id)
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(post_id)
+            self._add_locked(post_id, doc, tf)
+
+    def remove(self, post_id: int) -> None:
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(post_id)
+            self._remove_locked(post_id)
+
+    def rebuild(self, batch_size: int = 500) -> None:
+        """DB 전체 글을 id 순 배치로 읽어 색인 재구성.
+        배치를 읽은 뒤 요청 경로에서 갱신·삭제된 글은 건너뜀 (그 시점 색인이 이미 최신, 삭제된 글이 되살아나지 않음)."""
+        with self._lock:
+            self._touched = set()
+        db = SessionLocal()
+        try:
+            last_id = 0
+            count = 0
+            while True:
+                rows = db.execute(
+                    text("""
+                        SELECT id, title, content_html, slug, status, published_at, category_id
+                        FROM posts WHERE id > :last_id ORDER BY id LIMIT :limit
+                    """),
+                    {"last_id": last_id, "limit": batch_size},
+                ).fetchall()
+                if not rows:
+                    break
+                for r in rows:
+                    doc, tf = self._build_doc(r[1], r[2], r[3], r[4], r[5], r[6])
+                    with self._lock:
+                        if r[0] not in self._touched:
+                            self._add_locked(r[0], doc, tf)
+                last_id = rows[-1][0]
+                count += len(rows)
+            self.ready = True
+            logger.info("검색 색인 구성 완료: %d건", count)
+        finally:
+            with self._lock:
+                self._touched = None
+            db.close()
+
+    def rebuild_in_background(self) -> None:
+        def _run():
+            try:
+                self.rebuild()
+            except Exception as e:
+                logger.exception("검색 색인 구성 실패: %s", e)
+
+        threading.Thread(target=_run, name="search-index-build", daemon=True).start()
+
+    def search(self, query: str, include_unpublished: bool = False, offset: int = 0, limit: int = 10):
+        """(총 건수, [(post_id, score, _Doc)]) 반환. 공개 검색은 PUBLISHED + 발행 시각 도래 글만."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return 0, []
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with self._lock:
+            plists = [self._postings.get(t) for t in terms]
+            if any(p is None for p in plists):
+                return 0, []
+            plists.sort(key=len)
+            candidates = set(plists[0])
+            for plist in plists[1:]:
+                candidates.intersection_update(plist)
+                if not candidates:
+                    return 0, []
+            n_docs = len(self._docs)
+            avg_len = (self._total_length / n_docs) if n_docs else 1.0
+            idf = {
+                t: math.log(1 + (n_docs - len(self._postings[t]) + 0.5) / (len(self._postings[t]) + 0.5))
+                for t in terms
+            }
+            scored = []
+            for pid in candidates:
+                doc = self._docs[pid]
+                if not include_unpublished and not (
+                    doc.status == "PUBLISHED" and doc.published_at is not None and doc.published_at <= now
+                ):
+                    continue
+                norm = _K1 * (1 - _B + _B * doc.length / avg_len)
+                score = 0.0
+                for t in terms:
+                    tf = self._postings[t][pid]
+                    score += idf[t] * tf * (_K1 + 1) / (tf + norm)
+                scored.append((pid, score, doc))
+        scored.sort(key=lambda x: (-x[1], -x[0]))
+        return len(scored), scored[offset:offset + limit]
+
+
+def _highlight_patterns(query: str) -> re.Pattern | None:
+    """검색어 단어(공백 기준) 및 그 토큰을 하이라이트할 정규식. 긴 것부터 매칭."""
+    words = {w for w in query.split() if w}
+    words.update(tokenize(query))
+    if not words:
+        return None
+    alts = sorted((re.escape(w) for w in words), key=len, reverse=True)
+    return re.compile("|".join(alts), re.IGNORECASE)
+
+
+def highlight(s: str, query: str) -> str:
+    """HTML 이스케이프 후 매칭 구간을 <mark>로 감쌈."""
+    pattern = _highlight_patterns(query)
+    if not pattern or not s:
+        return html.escape(s or "")
+    out = []
+    pos = 0
+    for m in pattern.finditer(s):
+        out.append(html.escape(s[pos:m.start()]))
+        out.append(f"<mark>{html.escape(m.group(0))}</mark>")
+        pos = m.end()
+    out.append(html.escape(s[pos:]))
+    return "".join(out)
+
+
+def snippet(body: str, query: str) -> str:
+    """첫 매칭 위치 주변 본문 발췌 (하이라이트 포함). 매칭 없으면 본문 앞부분."""
+    pattern = _highlight_patterns(query)
+    m = pattern.search(body) if pattern else None
+    if not m:
+        head = body[:_SNIPPET_RADIUS * 2]
+        return html.escape(head) + ("…" if len(body) > len(head) else "")
+    start = max(0, m.start() - _SNIPPET_RADIUS)
+    end = min(len(body), m.end() + _SNIPPET_RADIUS)
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(body) else ""
+    return prefix + highlight(body[start:end], query) + suffix
+
+
+
+def load_snippets(db, post_ids: list[int], query: str) -> dict[int, str]:
+    """결과 페이지 글들의 본문을 DB에서 읽어 post_id → 스니펫 (본문이 없으면 빠짐)."""
+    if not post_ids:
+        return {}
+    rows = db.execute(
+        text("SELECT id, content_html FROM posts WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)),
+        {"ids": post_ids},
+    ).fetchall()
+    return {r[0]: snippet(html_to_text(r[1])[:_MAX_INDEX_CHARS], query) for r in rows}
+
+
+search_index = SearchIndex()
@@ -0,0 +1,245 @@
+"""
+multipart 업로드 스트리밍 수신.
+- request.stream() 청크를 python-multipart 파서에 바로 넣어, 파일 파트는 임시 파일(UPLOAD_DIR/.incoming)에 청크 단위로 기록
+- Content-Length가 상한을 넘으면 본문을 읽기 전에, 수신 중 누적 크기가 상한을 넘으면 그 즉시 413
+- 수신하면서 SHA-256 계산, 디스크 쓰기·이동은 스레드풀에서 (이벤트 루프 블로킹 없음)
+- 요청당 메모리: 수신 청크 1개 + 파서 상태 (본문 전체를 메모리·스풀 파일에 올리지 않음)
+- 완료 후 호출 측이 move_into_place()로 최종 경로에 원자적 이동 (os.replace, 같은 파일시스템)
+"""
+import hashlib
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+try:
+    from python_multipart.exceptions import MultipartParseError
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ModuleNotFoundError:  # python-multipart < 0.0.13
+    from multipart.exceptions import MultipartParseError
+    from multipart.multipart import MultipartParser, parse_options_header
+
+from apps.api.core.config import UPLOAD_DIR
+
+logger = logging.getLogger(__name__)
+
+INCOMING_DIR = Path(UPLOAD_DIR) / ".incoming"
+# multipart 경계·파트 헤더 등 본문 오버헤드 허용치 (Content-Length 사전 검사용)
+_MULTIPART_OVERHEAD = 64 * 1024
+# 파일이 아닌 폼 필드 최대 크기
+_MAX_FIELD_SIZE = 64 * 1024
+# 이 시간보다 오래된 임시 파일은 중단된 업로드로 보고 정리
+_STALE_SECONDS = 24 * 3600
+
+
+@dataclass
+class StreamedUpload:
+    temp_path: Path
+    filename: str
+    content_type: str
+    size: int
+    sha256: str
+
+
+class _TooLarge(Exception):
+    pass
+
+
+def _disposition(value: bytes) -> tuple[str | None, str | None]:
+    _, options = parse_options_header(value)
+    name = options.get(b"name")
+    filename = options.get(b"filename")
+    return (
+        name.decode("utf-8", "replace") if name is not None else None,
+        filename.decode("utf-8", "replace") if filename is not None else None,
+    )
+
+
+class _UploadReceiver:
+    """파서 콜백(동기)은 메모리에 청크만 모으고, 디스크 기록은 write()마다 스레드풀에서 수행."""
+
+    def __init__(self, field_name: str, max_size: int, validate):
+        self.field_name = field_name
+        self.max_size = max_size
+        self.validate = validate
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        self.pending: list[bytes] = []
+        self.temp_path: Path | None = None
+        self.fh = None
+        self.filename: str | None = None
+        self.content_type = ""
+        self.error: HTTPException | None = None
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._in_file = False
+        self._field_size = 0
+        self._done = False
+
+    # --- python-multipart 콜백 ---
+    def on_part_begin(self) -> None:
+        self._headers = {}
+        self._in_file = False
+        self._field_size = 0
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        name, filename = _disposition(self._headers.get(b"content-disposition", b""))
+        if name != self.field_name or filename is None or self._done:
+            return
+        self.filename = filename
+        self.content_type = self._headers.get(b"content-type", b"").decode("latin-1").strip()
+        try:
+            self.validate(self.filename, self.content_type)
+        except HTTPException as e:
+            self.error = e
+            return
+        self._in_file = True
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if not self._in_file:
+            self._field_size += end - start
+            if self._field_size > _MAX_FIELD_SIZE and self.error is None:
+                self.error = HTTPException(status_code=400, detail="폼 필드가 너무 큽니다.")
+            return
+        chunk = data[start:end]
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            raise _TooLarge()
+        self.hasher.update(chunk)
+        self.pending.append(chunk)
+
+    def on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+            self._done = True
+
+    # --- 디스크 (스레드풀) ---
+    def _flush_pending(self) -> None:
+        if not self.pending:
+            return
+        if self.fh is None:
+            INCOMING_DIR.mkdir(parents=True, exist_ok=True)
+            self.temp_path = INCOMING_DIR / f"{uuid.uuid4().hex}.part"
+            self.fh = open(self.temp_path, "wb")
+        for chunk in self.pending:
+            self.fh.write(chunk)
+        self.pending = []
+
+    def _close(self, keep: bool) -> None:
+        if self.fh is not None:
+            self.fh.close()
+            self.fh = None
+        if not keep and self.temp_path is not None:
+            self.temp_path.unlink(missing_ok=True)
+            self.temp_path = None
+
+    def _finish(self) -> None:
+        if self.fh is None and self._done:
+            # 빈 파일
+            INCOMING_DIR.mkdir(parents=True, exist_ok=True)
+            self.temp_path = INCOMING_DIR / f"{uuid.uuid4().hex}.part"
+            self.temp_path.touch()
+            return
+        self._flush_pending()
+        if self.fh is not None:
+            self.fh.flush()
+            os.fsync(self.fh.fileno())
+        self._close(keep=True)
+
+
+async def receive_upload(request, validate, max_size: int, field_name: str = "file") -> StreamedUpload:
+    """multipart 요청의 field_name 파일 파트를 임시 파일로 스트리밍 수신.
+    validate(filename, content_type): 파트 헤더 수신 직후 호출, HTTPException으로 거부하면 본문 수신 중단."""
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail="multipart/form-data 요청이어야 합니다.")
+    too_large = HTTPException(status_code=413, detail=f"파일 크기는 {max_size // (1024 * 1024)}MB 이하여야 합니다.")
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size + _MULTIPART_OVERHEAD:
+        raise too_large
+
+    receiver = _UploadReceiver(field_name, max_size, validate)
+    parser = MultipartParser(boundary, {
+        "on_part_begin": receiver.on_part_begin,
+        "on_part_data": receiver.on_part_data,
+        "on_part_end": receiver.on_part_end,
+        "on_header_field": receiver.on_header_field,
+        "on_header_value": receiver.on_header_value,
+        "on_header_end": receiver.on_header_end,
+        "on_headers_finished": receiver.on_headers_finished,
+    })
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if receiver.error is not None:
+                raise receiver.error
+            if receiver.pending:
+                await run_in_threadpool(receiver._flush_pending)
+        parser.finalize()
+        if receiver.error is not None:
+            raise receiver.error
+        if not receiver._done:
+            raise HTTPException(status_code=400, detail="업로드할 파일이 없습니다.")
+        await run_in_threadpool(receiver._finish)
+    except _TooLarge:
+        await run_in_threadpool(receiver._close, False)
+        raise too_large
+    except MultipartParseError:
+        await run_in_threadpool(receiver._close, False)
+        raise HTTPException(status_code=400, detail="잘못된 multipart 요청입니다.")
+    except BaseException:
+        # 클라이언트 연결 끊김(ClientDisconnect) 포함
+        await run_in_threadpool(receiver._close, False)
+        raise
+    return StreamedUpload(
+        temp_path=receiver.temp_path,
+        filename=receiver.filename or "",
+        content_type=receiver.content_type,
+        size=receiver.size,
+        sha256=receiver.hasher.hexdigest(),
+    )
+
+
+def move_into_place(upload: StreamedUpload, dest: Path) -> None:
+    """임시 파일 → 최종 경로 원자적 이동 (동기, 스레드풀에서 호출)."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(upload.temp_path, dest)
+
+
+def discard(upload: StreamedUpload) -> None:
+    upload.temp_path.unlink(missing_ok=True)
+
+
+def cleanup_incoming() -> None:
+    """서버 시작 시: 중단된 업로드의 오래된 임시 파일 정리."""
+    if not INCOMING_DIR.is_dir():
+        return
+    cutoff = time.time() - _STALE_SECONDS
+    removed = 0
+    for path in INCOMING_DIR.glob("*.part"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            continue
+    if removed:
+        logger.info("중단된 업로드 임시 파일 %d개 정리", removed)
@@ -0,0 +1,183 @@
+"""
+조회수 write-behind 집계.
+- 읽기 경로(get_post)는 메모리 카운터만 증가시키고 MySQL에 쓰지 않음
+- 주기(VIEW_FLUSH_INTERVAL_SECONDS) 또는 누적 건수(VIEW_FLUSH_MAX_PENDING) 도달 시
+  posts.view_count / daily_stats 를 다중 행 문장으로 일괄 반영
+- 서버 종료 시(main.lifespan) 남은 카운트 flush
+- 글 단건 응답 캐시(posts.get)는 view_count를 담고 있으므로 flush 커밋 후 반영된 글의 캐시만 무효화
+  (views_cache_tag). 쓰는 중인 증가분도 pending_views()에 포함해 응답 조회수가 줄어드는 구간이 없음
+"""
+import logging
+import threading
+from collections import Counter
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from apps.api.core.cache import response_cache
+from apps.api.core.config import (
+    VIEW_FLUSH_INTERVAL_SECONDS,
+    VIEW_FLUSH_MAX_PENDING,
+    get_today_iso,
+)
+from apps.api.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 한 문장에 넣을 최대 행 수 (placeholder 수 제한 대비)
+_FLUSH_CHUNK = 500
+
+
+def views_cache_tag(post_id: int) -> str:
+    """view_count를 담은 응답 캐시 항목에 붙이는 글별 태그 (flush 후 해당 글만 무효화)."""
+    return f"post-views:{post_id}"
+
+
+class ViewCounter:
+    """게시글별·일자별 조회수 증가분을 메모리에 모았다가 일괄 flush."""
+
+    def __init__(self, interval: float = VIEW_FLUSH_INTERVAL_SECONDS, max_pending: int = VIEW_FLUSH_MAX_PENDING):
+        self.interval = interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._post_views: Counter = Counter()
+        self._daily_views: Counter = Counter()
+        # flush 중(DB 쓰기~커밋~캐시 무효화 전)인 글별 증가분
+        self._flushing: Counter = Counter()
+        self._pending = 0
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def record(self, post_id: int) -> None:
+        """조회 1건 기록. 누적 건수가 임계치를 넘으면 백그라운드 flush를 깨움."""
+        with self._lock:
+            self._post_views[post_id] += 1
+            self._daily_views[get_today_iso()] += 1
+            self._pending += 1
+            over = self._pending >= self.max_pending
+        if over:
+            self._wakeup.set()
+
+    def pending_views(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은(또는 반영 중인) 해당 글의 조회수 (응답 view_count 보정용)."""
+        with self._lock:
+            return self._post_views.get(post_id, 0) + self._flushing.get(post_id, 0)
+
+    def _drain(self) -> tuple[Counter, Counter]:
+        with self._lock:
+            posts, daily = self._post_views, self._daily_views
+            self._post_views, self._daily_views = Counter(), Counter()
+            self._flushing = posts
+            self._pending = 0
+        return posts, daily
+
+    def _restore(self, posts: Counter, daily: Counter) -> None:
+        """flush 실패 시 증가분을 다시 합산해 다음 flush에서 재시도."""
+        with self._lock:
+            self._post_views.update(posts)
+            self._daily_views.update(daily)
+            self._flushing = Counter()
+            self._pending += sum(daily.values())
+
+    def _finish(self, posts: Counter) -> None:
+        """커밋 후: 반영된 글의 캐시된 view_count 무효화와 반영 중 증가분 정리를 한 번에 (조회수가 빠지는 순간 없음)."""
+        with self._lock:
+            response_cache.invalidate(*(views_cache_tag(pid) for pid in posts))
+            self._flushing = Counter()
+
+    def flush(self) -> None:
+        """메모리 카운트를 DB에 반영. 실패 시 카운트를 되돌려 유실 방지."""
+        with self._flush_lock:
+            posts, daily = self._drain()
+            if not posts and not daily:
+                return
+            db = SessionLocal()
+            try:
+                _write_daily_stats(db, daily)
+                _write_post_views(db, posts)
+                db.commit()
+                self._finish(posts)
+            except SQLAlchemyError as e:
+                db.rollback()
+                self._restore(posts, daily)
+                logger.warning("조회수 flush 실패 (다음 주기에 재시도): %s", e)
+            finally:
+                db.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.exception("조회수 flush 스레드 오류: %s", e)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="view-counter-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """flush 스레드 종료 후 남은 카운트 최종 반영."""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 5)
+            self._thread = None
+        self.flush()
+
+
+def _write_daily_stats(db, daily: Counter) -> None:
+    """daily_stats: 날짜별 증가분을 다중 행 INSERT ... ON DUPLICATE KEY UPDATE 로 반영."""
+    items = list(daily.items())
+    for start in range(0, len(items), _FLUSH_CHUNK):
+        chunk = items[start:start + _FLUSH_CHUNK]
+        params = {}
+        values = []
+        for i, (dt, n) in enumerate(chunk):
+            values.append(f"(:dt{i}, :n{i}, :n{i})")
+            params[f"dt{i}"] = dt
+            params[f"n{i}"] = n
+        db.execute(
+            text(f"""
+                INSERT INTO daily_stats (date, total_views, visitor_count)
+                VALUES {", ".join(values)}
+                ON DUPLICATE KEY UPDATE
+                    total_views = total_views + VALUES(total_views),
+                    visitor_count = visitor_count + VALUES(visitor_count)
+            """),
+            params,
+        )
+
+
+def _write_post_views(db, posts: Counter) -> None:
+    """posts.view_count: 글별 증가분을 UPDATE ... CASE 한 문장으로 반영.
+    updated_at = updated_at: ON UPDATE CURRENT_TIMESTAMP로 수정일이 조회마다 바뀌지 않도록 유지."""
+    items = list(posts.items())
+    for start in range(0, len(items), _FLUSH_CHUNK):
+        chunk = items[start:start + _FLUSH_CHUNK]
+        params = {}
+        cases = []
+        ids = []
+        for i, (pid, n) in enumerate(chunk):
+            cases.append(f"WHEN :id{i} THEN :n{i}")
+            ids.append(f":id{i}")
+            params[f"id{i}"] = pid
+            params[f"n{i}"] = n
+        db.execute(
+            text(f"""
+                UPDATE posts
+                SET view_count = COALESCE(view_count, 0) + CASE id {" ".join(cases)} ELSE 0 END,
+                    updated_at = updated_at
+                WHERE id IN ({", ".join(ids)})
+            """),
+            params,
+        )
+
+
+view_counter = ViewCounter()
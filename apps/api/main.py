@@ -5,22 +5,51 @@ from pathlib import Path
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
-from starlette.staticfiles import StaticFiles
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from apps.api.core import CORS_ORIGINS, UPLOAD_DIR
+from apps.api.core.autosave import autosave_buffer
+from apps.api.core.compression import CompressionMiddleware
 from apps.api.core.config import NAKED_HOST, REDIRECT_WWW_TO_NAKED, WWW_HOST
 from apps.api.core.db_init import init_on_startup
-from apps.api.routers import api_router
+from apps.api.core.feeds import feed_documents
+from apps.api.core.file_serving import UploadStaticFiles
+from apps.api.core.image_cache import image_render_cache
+from apps.api.core.image_variants import image_variants
+from apps.api.core.post_catalog import post_catalog
+from apps.api.core.post_counters import post_counters
+from apps.api.core.publish_scheduler import publish_scheduler
+from apps.api.core.search import search_index
+from apps.api.core.upload_stream import cleanup_incoming
+from apps.api.core.view_counter import view_counter
+from apps.api.routers import api_router, feeds
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """서버 시작 시 DB 테이블·시드 자동 초기화."""
+    """서버 시작 시 DB 테이블·시드 자동 초기화, 발행 글 카탈로그·검색 색인 구성, 예약 발행 스케줄러 시작, sitemap·피드 구성, 중단된 업로드 임시 파일 정리, 이미지 렌디션 캐시 색인 복원.
+    종료 시 자동 저장·조회수 집계 flush, 이미지 파생본·렌디션 풀·스케줄러 정지."""
     init_on_startup()
-    yield
+    cleanup_incoming()
+    image_render_cache.load()
+    post_catalog.rebuild()
+    post_counters.rebuild()
+    search_index.rebuild_in_background()
+    publish_scheduler.start()
+    # 스케줄러 시작 시 is_live 보정 이후 구성
+    feed_documents.rebuild()
+    view_counter.start()
+    autosave_buffer.start()
+    try:
+        yield
+    finally:
+        autosave_buffer.stop()
+        image_variants.stop()
+        image_render_cache.stop()
+        publish_scheduler.stop()
+        view_counter.stop()
 
 
 app = FastAPI(
@@ -53,13 +82,17 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 응답 압축 (Accept-Encoding: br/gzip). 이미 압축된 응답(글 본문 사전 압축본)은 통과
+app.add_middleware(CompressionMiddleware)
 
 app.include_router(api_router)
+# 사이트 루트: /sitemap.xml, /feed.xml, /atom.xml
+app.include_router(feeds.router)
 
-# 업로드 파일 서빙
+# 업로드 파일 서빙 (배포 시에는 nginx가 같은 볼륨에서 직접 서빙, 이 마운트는 개발·폴백용)
 _upload_dir = Path(UPLOAD_DIR)
 _upload_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/static/uploads", StaticFiles(directory=str(_upload_dir)), name="uploads")
+app.mount("/static/uploads", UploadStaticFiles(directory=str(_upload_dir)), name="uploads")
 
 
 @app.get("/")
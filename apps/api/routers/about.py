@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import text
 
 from apps.api.core import get_db
+from apps.api.core.cache import cache_key, response_cache
 
 router = APIRouter(prefix="/about", tags=["about"])
 
@@ -23,7 +24,11 @@ PORTFOLIO_LINK_KEYS = (
 
 @router.get("/messages")
 def list_about_messages(db=Depends(get_db)):
-    """인사말 메시지 목록 (sort_order 순). 공개."""
+    """인사말 메시지 목록 (sort_order 순). 공개. 응답 캐시 사용."""
+    return response_cache.get_or_set(cache_key("about.messages"), ("about",), lambda: _query_about_messages(db))
+
+
+def _query_about_messages(db):
     rows = db.execute(
         text("SELECT id, title, content, sort_order FROM about_messages ORDER BY sort_order, id")
     ).fetchall()
@@ -35,7 +40,15 @@ def list_about_messages(db=Depends(get_db)):
 
 @router.get("/projects-careers-intro")
 def get_projects_careers_intro(db=Depends(get_db)):
-    """프로젝트/경력 섹션 소개 문구 한 줄 (공개, 최대 20자)."""
+    """프로젝트/경력 섹션 소개 문구 한 줄 (공개, 최대 20자). 응답 캐시 사용."""
+    return response_cache.get_or_set(
+        cache_key("about.projects_careers_intro"),
+        ("about",),
+        lambda: _query_projects_careers_intro(db),
+    )
+
+
+def _query_projects_careers_intro(db):
     row = db.execute(
         text("SELECT value FROM site_settings WHERE `key` = :key"),
         {"key": KEY_PROJECTS_CAREERS_INTRO},
@@ -45,7 +58,15 @@ def get_projects_careers_intro(db=Depends(get_db)):
 
 @router.get("/portfolio-links")
 def get_portfolio_links(db=Depends(get_db)):
-    """포트폴리오 페이지 이력서/포트폴리오 링크·소개 문구 (공개). 키 없어도 에러 없이 빈 문자열 반환."""
+    """포트폴리오 페이지 이력서/포트폴리오 링크·소개 문구 (공개). 키 없어도 에러 없이 빈 문자열 반환. 응답 캐시 사용."""
+    return response_cache.get_or_set(
+        cache_key("about.portfolio_links"),
+        ("about",),
+        lambda: _query_portfolio_links(db),
+    )
+
+
+def _query_portfolio_links(db):
     rows = db.execute(
         text(
             "SELECT `key`, value FROM site_settings WHERE `key` IN "
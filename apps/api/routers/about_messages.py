@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import text
 
 from apps.api.core import get_db
+from apps.api.core.cache import response_cache
 from apps.api.routers.auth import get_current_user
 from apps.api.routers.about import (
     KEY_PROJECTS_CAREERS_INTRO,
@@ -73,6 +74,7 @@ def update_portfolio_links(
             {"key": key, "value": value},
         )
     db.commit()
+    response_cache.invalidate("about")
     return {
         "resume_link": resume_link,
         "portfolio_link": portfolio_link,
@@ -111,6 +113,7 @@ def create_message(body: AboutMessageBody, db=Depends(get_db), user=Depends(get_
         {"title": body.title or "", "content": body.content or "", "sort_order": body.sort_order},
     )
     db.commit()
+    response_cache.invalidate("about")
     return {"message": "created"}
 
 
@@ -126,6 +129,7 @@ def update_projects_careers_intro(body: ProjectsCareersIntroBody, db=Depends(get
         {"key": KEY_PROJECTS_CAREERS_INTRO, "value": value},
     )
     db.commit()
+    response_cache.invalidate("about")
     return {"text": value}
 
 
@@ -146,6 +150,7 @@ def update_message(message_id: int, body: AboutMessageBody, db=Depends(get_db),
         {"id": message_id, "title": body.title or "", "content": body.content or "", "sort_order": body.sort_order},
     )
     db.commit()
+    response_cache.invalidate("about")
     return {"message": "updated"}
 
 
@@ -157,4 +162,5 @@ def delete_message(message_id: int, db=Depends(get_db), user=Depends(get_current
         raise HTTPException(status_code=404, detail="메시지를 찾을 수 없습니다.")
     db.execute(text("DELETE FROM about_messages WHERE id = :id"), {"id": message_id})
     db.commit()
+    response_cache.invalidate("about")
     return {"message": "deleted"}
@@ -1,14 +1,23 @@
 """자산(파일) 업로드 API."""
-import uuid
-from datetime import datetime
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
 from sqlalchemy import text
-from starlette.responses import FileResponse
+from starlette.responses import Response
 
 from apps.api.core import get_db, UPLOAD_DIR
+from apps.api.core import image_render
+from apps.api.core.asset_blobs import find_blob, is_sha256, store_blob
+from apps.api.core.config import IMAGE_RENDER_SIZES
+from apps.api.core.file_serving import IMMUTABLE_CACHE_CONTROL, send_upload_file
+from apps.api.core.image_cache import image_render_cache
+from apps.api.core.image_variants import image_variants
+from apps.api.core.upload_stream import StreamedUpload, discard, receive_upload
+from apps.api.routers.auth import get_current_user
 
 router = APIRouter(prefix="/assets", tags=["assets"])
 
@@ -43,21 +52,18 @@ def _is_image_ext(ext: str) -> bool:
     return ext in ("png", "jpg", "jpeg", "gif", "webp")
 
 
-@router.post("/upload")
-async def upload_file(
-    file: UploadFile = File(...),
-    post_id: str | None = Query(None, description="게시글 ID, 없으면 temp"),
-    folder: str | None = Query(None, description="projects일 때 projects/{subdir}/ 경로 사용"),
-    db=Depends(get_db),
-):
-    """파일 업로드 (이미지 + 문서). multipart/form-data, 필드명 'file'. 허용: png, jpg, jpeg, gif, webp, pdf, ppt, pptx, hwp, hwpx, docx. 최대 25MB. assets 테이블에 저장 후 id 반환."""
-    ext = _get_ext(file.filename or "")
+def _normalize_ext(ext: str) -> str:
+    return "jpg" if ext == "jpeg" else ext
+
+
+def _validate_upload(filename: str, content_type: str) -> None:
+    """파트 헤더 단계 검증 (본문 수신 전). 실패 시 HTTPException."""
+    ext = _get_ext(filename)
     if not ext:
         raise HTTPException(
             status_code=400,
             detail="허용되지 않는 파일 형식입니다. (허용: png, jpg, jpeg, gif, webp, pdf, ppt, pptx, hwp, hwpx, docx)",
         )
-    content_type = file.content_type or ""
     if content_type and content_type not in ALLOWED_TYPES:
         # octet-stream은 확장자로만 허용 (hwp 등)
         if content_type != "application/octet-stream" or ext not in ("hwp", "hwpx"):
@@ -66,46 +72,35 @@ async def upload_file(
                 detail="허용되지 않는 파일 형식입니다.",
             )
 
-    pid = (post_id or "temp").strip() or "temp"
-    name = f"{uuid.uuid4().hex[:12]}.{ext}"
-    if folder == "projects":
-        rel_path = f"images/projects/{pid}/{name}"
-    elif folder == "careers":
-        rel_path = f"images/careers/{pid}/{name}"
-    else:
-        now = datetime.now()
-        year = now.strftime("%Y")
-        month = now.strftime("%m")
-        day = now.strftime("%d")
-        if _is_image_ext(ext):
-            rel_path = f"images/posts/{year}/{month}/{day}/{pid}/{name}"
-        else:
-            rel_path = f"documents/{year}/{month}/{day}/{pid}/{name}"
-    dest = Path(UPLOAD_DIR) / rel_path
-    dest.parent.mkdir(parents=True, exist_ok=True)
-
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=413, detail="파일 크기는 30MB 이하여야 합니다.")
-
-    dest.write_bytes(content)
-
-    url = f"/static/uploads/{rel_path.replace(chr(92), '/')}"
-    original_name = (file.filename or name).strip() or name
-    mime_type = content_type or "application/octet-stream"
-    file_path = rel_path.replace(chr(92), "/")
 
+def _insert_asset(db, original_name: str, mime_type: str, file_path: str, size_bytes: int, content_hash: str) -> dict:
+    """assets 행 등록 (blob 공유, 원본명·MIME은 행마다) 후 업로드 응답 반환."""
+    name = Path(file_path).name
+    original_name = (original_name or "").strip() or name
+    # 같은 내용의 파생본이 이미 있으면 이미지 크기도 공유
+    dims = db.execute(
+        text("""
+            SELECT image_width, image_height FROM assets
+            WHERE content_hash = :content_hash AND image_width IS NOT NULL LIMIT 1
+        """),
+        {"content_hash": content_hash},
+    ).fetchone()
     db.execute(
         text("""
-            INSERT INTO assets (uuid_name, original_name, mime_type, file_path, size_bytes)
-            VALUES (:uuid_name, :original_name, :mime_type, :file_path, :size_bytes)
+            INSERT INTO assets (uuid_name, original_name, mime_type, file_path, size_bytes, content_hash,
+                                image_width, image_height)
+            VALUES (:uuid_name, :original_name, :mime_type, :file_path, :size_bytes, :content_hash,
+                    :image_width, :image_height)
         """),
         {
             "uuid_name": name,
             "original_name": original_name,
-            "mime_type": mime_type,
+            "mime_type": mime_type or "application/octet-stream",
             "file_path": file_path,
-            "size_bytes": len(content),
+            "size_bytes": size_bytes,
+            "content_hash": content_hash,
+            "image_width": dims[0] if dims else None,
+            "image_height": dims[1] if dims else None,
         },
     )
     row = db.execute(text("SELECT LAST_INSERT_ID()")).fetchone()
@@ -114,13 +109,82 @@ async def upload_file(
     if not asset_id:
         row2 = db.execute(text("SELECT id FROM assets ORDER BY id DESC LIMIT 1")).fetchone()
         asset_id = row2[0] if row2 else None
+    if not dims and _is_image_ext(file_path.rsplit(".", 1)[-1].lower()):
+        # 파생본(폭별 리사이즈·포맷 변환)은 프로세스 풀에서 생성, 응답은 기다리지 않음
+        image_variants.schedule(content_hash, file_path)
+
+    url = f"/static/uploads/{file_path}"
+    return {"id": asset_id, "url": url, "original_name": original_name, "sha256": content_hash}
+
+
+def _store_upload(db, upload: StreamedUpload) -> dict:
+    """임시 파일 → 내용 주소 blob (같은 내용이면 기존 파일 재사용) + assets 등록 (동기: 스레드풀에서 호출)."""
+    file_path = store_blob(db, upload, _get_ext(upload.filename))
+    return _insert_asset(db, upload.filename, upload.content_type, file_path, upload.size, upload.sha256)
+
 
-    return {"id": asset_id, "url": url, "original_name": original_name}
+@router.post("/upload")
+async def upload_file(
+    request: Request,
+    post_id: str | None = Query(None, description="게시글 ID (호환용, 저장 경로는 내용 해시로 결정)"),
+    folder: str | None = Query(None, description="projects·careers (호환용, 저장 경로는 내용 해시로 결정)"),
+    db=Depends(get_db),
+):
+    """파일 업로드 (이미지 + 문서). multipart/form-data, 필드명 'file'. 허용: png, jpg, jpeg, gif, webp, pdf, ppt, pptx, hwp, hwpx, docx. 최대 30MB. assets 테이블에 저장 후 id 반환.
+    본문은 청크 단위로 임시 파일에 스트리밍 수신 (상한 초과 시 즉시 413), 이동·DB 등록은 스레드풀에서.
+    파일은 SHA-256 기준 blobs/ 아래 1개만 저장, 같은 내용 재업로드는 assets 행만 추가."""
+    upload = await receive_upload(request, _validate_upload, MAX_FILE_SIZE)
+    try:
+        return await run_in_threadpool(_store_upload, db, upload)
+    except BaseException:
+        await run_in_threadpool(discard, upload)
+        raise
+
+
+class UploadByHashBody(BaseModel):
+    sha256: str
+    filename: str
+    content_type: str | None = None
+
+
+@router.post("/upload/by-hash")
+def upload_by_hash(
+    body: UploadByHashBody,
+    post_id: str | None = Query(None, description="게시글 ID (호환용)"),
+    folder: str | None = Query(None, description="projects·careers (호환용)"),
+    db=Depends(get_db),
+):
+    """업로드 전 해시 확인: 같은 내용의 blob이 있으면 파일 전송 없이 assets 행만 추가해 업로드와 같은 응답 반환.
+    없으면 404, 파일명 확장자가 저장된 blob과 다르면 409 → 클라이언트는 /upload로 파일 전송."""
+    sha256 = body.sha256.strip().lower()
+    if not is_sha256(sha256):
+        raise HTTPException(status_code=400, detail="sha256 형식이 올바르지 않습니다.")
+    content_type = (body.content_type or "").strip()
+    _validate_upload(body.filename, content_type)
+    blob = find_blob(db, sha256)
+    if blob is None:
+        raise HTTPException(status_code=404, detail="같은 내용의 파일이 없습니다.")
+    file_path, size_bytes = blob
+    # 해시만 알면 다른 형식의 blob(예: PDF)을 foo.png·image/png로 등록할 수 있으므로 저장된 확장자와 일치해야 함
+    if _normalize_ext(_get_ext(body.filename)) != _normalize_ext(file_path.rsplit(".", 1)[-1].lower()):
+        raise HTTPException(status_code=409, detail="파일 형식이 저장된 파일과 다릅니다. 파일을 직접 업로드하세요.")
+    return _insert_asset(db, body.filename, content_type, file_path, size_bytes, sha256)
+
+
+@router.head("/blobs/{sha256}")
+def head_blob(sha256: str, db=Depends(get_db)):
+    """같은 내용(SHA-256)의 파일이 저장돼 있는지 확인. 있으면 200 (X-Asset-Size), 없으면 404."""
+    sha256 = sha256.lower()
+    blob = find_blob(db, sha256) if is_sha256(sha256) else None
+    if blob is None:
+        return Response(status_code=404)
+    return Response(status_code=200, headers={"X-Asset-Size": str(blob[1])})
 
 
 @router.get("/{asset_id}/download")
 def download_asset(asset_id: int, db=Depends(get_db)):
-    """자산 파일 다운로드. Content-Disposition: attachment 로 저장 유도."""
+    """자산 파일 다운로드. Content-Disposition: attachment 로 저장 유도.
+    X_ACCEL_REDIRECT=true면 조회만 하고 전송은 nginx (X-Accel-Redirect)."""
     row = db.execute(
         text("SELECT original_name, file_path FROM assets WHERE id = :id"),
         {"id": asset_id},
@@ -137,9 +201,121 @@ def download_asset(asset_id: int, db=Depends(get_db)):
     safe_ascii = original_name.encode("ascii", "replace").decode("ascii") or "download"
     encoded_name = quote(original_name, safe="")
     disposition = f"attachment; filename=\"{safe_ascii}\"; filename*=UTF-8''{encoded_name}"
-    return FileResponse(
-        path=str(full_path),
-        filename=original_name,
+    return send_upload_file(
+        full_path,
         media_type="application/octet-stream",
         headers={"Content-Disposition": disposition},
+        filename=original_name,
     )
+
+
+_RENDER_FITS = ("contain", "cover")
+
+
+def _negotiate_format(accept: str, mime_type: str) -> str:
+    """format=auto: Accept 기준 AVIF → WebP, 아니면 원본 성격에 맞게 PNG(투명 가능)·JPEG."""
+    accept = (accept or "").lower()
+    for fmt in ("avif", "webp"):
+        if image_render.FORMATS[fmt][2] in accept and image_render.can_encode(fmt):
+            return fmt
+    return "png" if mime_type in ("image/png", "image/gif") else "jpeg"
+
+
+def _load_render_source(db, asset_id: int) -> tuple[str, str, str] | None:
+    """자산 id → (원본 전체 경로, 캐시 키용 원본 식별자, MIME). 이미지가 아니거나 파일이 없으면 None."""
+    row = db.execute(
+        text("SELECT file_path, content_hash, mime_type FROM assets WHERE id = :id"),
+        {"id": asset_id},
+    ).fetchone()
+    if not row or not row[0]:
+        return None
+    file_path = row[0].replace("\\", "/")
+    if not _is_image_ext(file_path.rsplit(".", 1)[-1].lower()):
+        return None
+    full_path = Path(UPLOAD_DIR) / file_path
+    try:
+        mtime_ns = full_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    # 해시가 없는 이전 업로드는 경로+수정 시각 (파일이 바뀌면 다른 키)
+    source_key = row[1] or f"{file_path}@{mtime_ns}"
+    return str(full_path), source_key, (row[2] or "").lower()
+
+
+@router.get("/{asset_id}/image")
+async def get_asset_image(
+    asset_id: int,
+    request: Request,
+    w: int | None = Query(None, description="폭(px), IMAGE_RENDER_SIZES 중 하나"),
+    h: int | None = Query(None, description="높이(px), IMAGE_RENDER_SIZES 중 하나"),
+    fit: str = Query("contain", description="contain(비율 유지) | cover(w×h 채우고 잘라냄)"),
+    format: str = Query("auto", description="auto(Accept 협상) | avif | webp | jpeg | png"),
+    db=Depends(get_db),
+):
+    """이미지 자산의 요청 크기·포맷 렌디션. 원본보다 키우지 않음.
+    크기는 허용 목록만 (임의 크기로 캐시를 채우는 요청 차단), 결과는 크기 상한 LRU 디스크 캐시에 저장.
+    같은 렌디션 동시 요청은 변환 1회를 공유, 변환은 전용 프로세스 풀에서.
+    URL은 자산 id·파라미터로 내용이 고정 (원본 교체 없음) → 1년 immutable. 캐시 디렉터리가 UPLOAD_DIR 아래면 X-Accel-Redirect 전송."""
+    if w is None and h is None:
+        raise HTTPException(status_code=400, detail="w 또는 h가 필요합니다.")
+    for value in (w, h):
+        if value is not None and value not in IMAGE_RENDER_SIZES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"허용되지 않는 크기입니다. (허용: {', '.join(str(s) for s in sorted(IMAGE_RENDER_SIZES))})",
+            )
+    if fit not in _RENDER_FITS:
+        raise HTTPException(status_code=400, detail="fit은 contain 또는 cover입니다.")
+    if fit == "cover" and (w is None or h is None):
+        raise HTTPException(status_code=400, detail="fit=cover는 w와 h가 모두 필요합니다.")
+    format = format.lower()
+    if format != "auto" and format not in image_render.FORMATS:
+        raise HTTPException(status_code=400, detail="format은 auto, avif, webp, jpeg, png 중 하나입니다.")
+    if not image_render.AVAILABLE:
+        raise HTTPException(status_code=501, detail="이미지 변환을 사용할 수 없습니다.")
+    if format != "auto" and not image_render.can_encode(format):
+        raise HTTPException(status_code=400, detail=f"{format} 변환을 지원하지 않습니다.")
+
+    source = await run_in_threadpool(_load_render_source, db, asset_id)
+    if source is None:
+        raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+    src_path, source_key, mime_type = source
+    fmt = _negotiate_format(request.headers.get("accept", ""), mime_type) if format == "auto" else format
+    try:
+        path = await image_render_cache.get(src_path, source_key, w, h, fit, fmt)
+    except BrokenProcessPool:
+        raise HTTPException(status_code=503, detail="이미지 변환을 일시적으로 사용할 수 없습니다.")
+    except Exception:
+        # 손상·미지원 원본, 과대 이미지(Pillow 디컴프레션 폭탄 방지) 등
+        raise HTTPException(status_code=415, detail="이미지를 변환할 수 없습니다.")
+
+    headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "ETag": f'"{path.stem}"'}
+    if format == "auto":
+        headers["Vary"] = "Accept"
+    return send_upload_file(path, media_type=image_render.FORMATS[fmt][2], headers=headers)
+
+
+@router.get("/{asset_id}/usages")
+def get_asset_usages(asset_id: int, db=Depends(get_db), user=Depends(get_current_user)):
+    """자산을 사용하는 글 목록 (관리자). 본문 참조(post_asset_refs)·썸네일·첨부를 각각 인덱스 조회로 합침."""
+    row = db.execute(text("SELECT id FROM assets WHERE id = :id"), {"id": asset_id}).fetchone()
+    if not row:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    rows = db.execute(
+        text("""
+            SELECT u.post_id, p.title, u.kind FROM (
+                SELECT post_id, 'content' AS kind FROM post_asset_refs WHERE asset_id = :id
+                UNION ALL
+                SELECT id, 'thumbnail' FROM posts WHERE thumbnail_asset_id = :id
+                UNION ALL
+                SELECT post_id, 'attachment' FROM post_attachments WHERE asset_id = :id
+            ) u
+            JOIN posts p ON p.id = u.post_id
+            ORDER BY u.post_id
+        """),
+        {"id": asset_id},
+    ).fetchall()
+    posts: dict[int, dict] = {}
+    for post_id, title, kind in rows:
+        posts.setdefault(post_id, {"id": post_id, "title": title, "usages": []})["usages"].append(kind)
+    return {"asset_id": asset_id, "posts": list(posts.values())}
@@ -3,13 +3,17 @@ import logging
 import shutil
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel, field_validator
 from sqlalchemy import text
 
 logger = logging.getLogger(__name__)
 
 from apps.api.core import get_db, UPLOAD_DIR
+from apps.api.core.cache import cache_key, response_cache
+from apps.api.core.config import IMAGE_LOGO_WIDTH
+from apps.api.core.http_cache import apply_validators, is_not_modified, make_etag, not_modified_response
+from apps.api.core.image_variants import image_variants, variant_paths
 from apps.api.routers.auth import get_current_user
 
 router = APIRouter(tags=["careers"])
@@ -45,8 +49,38 @@ def _file_path_to_url(fp) -> str | None:
 
 
 @router.get("")
-def list_careers(db=Depends(get_db)):
-    """경력 목록 (sort_order 순). logo URL, career_links, career_highlights, career_tags 포함."""
+def list_careers(request: Request, response: Response, db=Depends(get_db)):
+    """경력 목록 (sort_order 순). logo URL, career_links, career_highlights, career_tags 포함.
+    응답 캐시 사용. 목록 ETag로 304 지원."""
+    etag = response_cache.get_or_set(cache_key("careers.validator"), ("careers", "tags"), lambda: _careers_etag(db))
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    items = response_cache.get_or_set(cache_key("careers.list"), ("careers", "tags"), lambda: _query_careers(db))
+    apply_validators(response, etag)
+    return items
+
+
+def _careers_etag(db) -> str:
+    """목록 validator: 개수·최종 수정일 + 행별 표시 컬럼(sort_order 포함)·링크·한 일·태그(이름) 해시.
+    updated_at은 초 단위라 같은 초 안의 두 수정·순서 변경도 구분하도록 행 내용까지 해시."""
+    row = db.execute(
+        text("""
+            SELECT COUNT(*), MAX(updated_at),
+                   COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', id, updated_at, sort_order, company_name, role, start_date,
+                                                    end_date, description, logo_asset_id))), 0),
+                   (SELECT COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', career_id, id, link_name, link_url, sort_order))), 0)
+                    FROM career_links),
+                   (SELECT COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', career_id, id, content, sort_order))), 0)
+                    FROM career_highlights),
+                   (SELECT COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', ct.career_id, t.id, t.name))), 0)
+                    FROM career_tags ct JOIN tags t ON t.id = ct.tag_id)
+            FROM careers
+        """)
+    ).fetchone()
+    return make_etag("careers.list", *row, image_variants.generation)
+
+
+def _query_careers(db):
     rows = db.execute(
         text("""
             SELECT c.id, c.logo_asset_id, c.company_name, c.role, c.start_date, c.end_date, c.description, c.sort_order,
@@ -56,6 +90,8 @@ def list_careers(db=Depends(get_db)):
             ORDER BY c.sort_order, c.id
         """)
     ).fetchall()
+    # 로고: 표시 폭에 맞는 파생본 (없으면 원본)
+    logos = variant_paths(db, {r[8] for r in rows}, IMAGE_LOGO_WIDTH)
     items = []
     for r in rows:
         cid = r[0]
@@ -83,7 +119,7 @@ def list_careers(db=Depends(get_db)):
             ).fetchall()
         except Exception:
             pass
-        logo_url = _file_path_to_url(r[8])
+        logo_url = _file_path_to_url(logos.get(r[8], r[8]))
         items.append({
             "id": r[0],
             "logo_asset_id": r[1],
@@ -199,6 +235,7 @@ def create_career(body: CareerBody, db=Depends(get_db)):
             if tid:
                 db.execute(text("INSERT INTO career_tags (career_id, tag_id) VALUES (:cid, :tid)"), {"cid": new_id, "tid": tid})
         db.commit()
+        response_cache.invalidate("careers")
         return {"id": new_id}
     except HTTPException:
         db.rollback()
@@ -234,7 +271,8 @@ def update_career(career_id: int, body: CareerBody, db=Depends(get_db)):
         text("""
             UPDATE careers SET
                 logo_asset_id = :logo_asset_id, company_name = :company_name, role = :role,
-                start_date = :start_date, end_date = :end_date, description = :description, sort_order = :sort_order
+                start_date = :start_date, end_date = :end_date, description = :description, sort_order = :sort_order,
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = :id
         """),
         {
@@ -272,6 +310,7 @@ def update_career(career_id: int, body: CareerBody, db=Depends(get_db)):
         if tid:
             db.execute(text("INSERT INTO career_tags (career_id, tag_id) VALUES (:cid, :tid)"), {"cid": career_id, "tid": tid})
     db.commit()
+    response_cache.invalidate("careers")
     return {"id": career_id}
 
 
@@ -289,6 +328,7 @@ def delete_career(career_id: int, db=Depends(get_db)):
         pass
     db.execute(text("DELETE FROM careers WHERE id = :id"), {"id": career_id})
     db.commit()
+    response_cache.invalidate("careers")
     return {"ok": True}
 
 
@@ -299,4 +339,5 @@ def reorder_careers(body: ReorderBody, db=Depends(get_db)):
         if cid:
             db.execute(text("UPDATE careers SET sort_order = :ord WHERE id = :id"), {"ord": idx, "id": cid})
     db.commit()
+    response_cache.invalidate("careers")
     return {"ok": True}
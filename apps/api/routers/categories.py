@@ -5,6 +5,8 @@ from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
 from apps.api.core import get_db
+from apps.api.core.cache import cache_key, response_cache
+from apps.api.core.post_counters import post_counters
 from apps.api.routers.auth import get_current_user
 
 router = APIRouter(tags=["categories"])
@@ -42,7 +44,15 @@ def _row_to_item(r) -> dict:
 
 @router.get("")
 def list_categories(tree: bool = False, db=Depends(get_db)):
-    """카테고리 목록. tree=true면 계층 구조(children)로 반환."""
+    """카테고리 목록. tree=true면 계층 구조(children)로 반환. 응답 캐시 사용."""
+    return response_cache.get_or_set(
+        cache_key("categories.list", tree=tree),
+        ("categories",),
+        lambda: _query_categories(db, tree),
+    )
+
+
+def _query_categories(db, tree: bool):
     rows = db.execute(
         text("""
             SELECT id, parent_id, name, sort_order
@@ -107,6 +117,8 @@ def create_category(
             },
         )
         db.commit()
+        response_cache.invalidate("categories")
+        post_counters.rebuild()
     except OperationalError as e:
         db.rollback()
         msg = str(e.orig) if getattr(e, "orig", None) else str(e)
@@ -185,6 +197,10 @@ def update_category(
         params,
     )
     db.commit()
+    response_cache.invalidate("categories")
+    if "parent_id" in params:
+        # 대/소 계층이 바뀌면 카테고리별 글 수 합산 대상도 바뀜
+        post_counters.rebuild()
     row = db.execute(
         text("SELECT id, parent_id, name, sort_order FROM categories WHERE id = :id"),
         {"id": category_id},
@@ -204,6 +220,8 @@ def delete_category(
         raise HTTPException(status_code=404, detail="카테고리를 찾을 수 없습니다.")
     db.execute(text("DELETE FROM categories WHERE id = :id"), {"id": category_id})
     db.commit()
+    response_cache.invalidate("categories")
+    post_counters.rebuild()
     return None
 
 
@@ -220,4 +238,5 @@ def reorder_categories(
             {"id": item.id, "ord": item.sort_order},
         )
     db.commit()
+    response_cache.invalidate("categories")
     return {"ok": True}
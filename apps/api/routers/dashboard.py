@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import text
 
 from apps.api.core import get_db
+from apps.api.core.cache import response_cache
 from apps.api.core.config import get_today_iso
 from apps.api.routers.auth import get_current_user
 
@@ -76,3 +77,9 @@ def get_recent_activity(db=Depends(get_db), user=Depends(get_current_user)):
         for r in rows
     ]
     return {"recent_posts": recent_posts}
+
+
+@router.get("/cache-stats")
+def get_cache_stats(user=Depends(get_current_user)):
+    """공개 API 응답 캐시 통계 (hits, misses, negative_hits, evictions, invalidations, entries, hit_ratio)."""
+    return response_cache.stats()
@@ -0,0 +1,43 @@
+"""sitemap.xml · RSS/Atom 피드 라우터 (사이트 루트에 마운트, /api 아님)."""
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from apps.api.core.feeds import feed_documents
+from apps.api.core.http_cache import apply_validators, is_not_modified, not_modified_response
+
+router = APIRouter(tags=["feeds"])
+
+
+def _serve(request: Request, name: str, media_type: str):
+    """캐시된 문서 전송. ETag(본문 해시)·Last-Modified(문서 생성 시각)로 조건부 GET 시 304."""
+    doc = feed_documents.get(name)
+    if doc is None:
+        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
+    if is_not_modified(request, doc.etag, doc.last_modified):
+        return not_modified_response(doc.etag, doc.last_modified)
+    response = Response(content=doc.body, media_type=media_type)
+    apply_validators(response, doc.etag, doc.last_modified)
+    return response
+
+
+@router.get("/sitemap.xml")
+def sitemap(request: Request):
+    """공개 글 sitemap. 글이 샤드 크기를 넘으면 sitemap index."""
+    return _serve(request, "sitemap", "application/xml")
+
+
+@router.get("/sitemap-{shard}.xml")
+def sitemap_shard(shard: int, request: Request):
+    """sitemap 샤드 (id 순, 1부터)."""
+    return _serve(request, f"sitemap-{shard}", "application/xml")
+
+
+@router.get("/feed.xml")
+def rss_feed(request: Request):
+    """최신 공개 글 RSS 2.0."""
+    return _serve(request, "feed", "application/rss+xml")
+
+
+@router.get("/atom.xml")
+def atom_feed(request: Request):
+    """최신 공개 글 Atom 1.0."""
+    return _serve(request, "atom", "application/atom+xml")
@@ -4,6 +4,8 @@ from pydantic import BaseModel
 from sqlalchemy import text
 
 from apps.api.core import get_db
+from apps.api.core.cache import response_cache
+from apps.api.core.post_counters import post_counters
 from apps.api.routers.auth import get_current_user
 
 router = APIRouter(tags=["post_prefixes"])
@@ -69,6 +71,7 @@ def create_post_prefix(
         {"name": name},
     )
     db.commit()
+    response_cache.invalidate("post_prefixes")
     row = db.execute(
         text("SELECT id, name, sort_order, created_at FROM post_prefixes WHERE name = :name ORDER BY id DESC LIMIT 1"),
         {"name": name},
@@ -109,6 +112,7 @@ def update_post_prefix(
     name = _validate_name(body.name)
     db.execute(text("UPDATE post_prefixes SET name = :name WHERE id = :id"), {"name": name, "id": prefix_id})
     db.commit()
+    response_cache.invalidate("post_prefixes")
     return {"id": prefix_id, "name": name}
 
 
@@ -127,4 +131,7 @@ def delete_post_prefix(
         raise HTTPException(status_code=404, detail="말머리를 찾을 수 없습니다.")
     db.execute(text("DELETE FROM post_prefixes WHERE id = :id"), {"id": prefix_id})
     db.commit()
+    response_cache.invalidate("post_prefixes")
+    # FK SET NULL로 바뀐 글의 말머리 반영
+    post_counters.rebuild()
     return None
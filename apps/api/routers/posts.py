@@ -1,21 +1,51 @@
 """게시글 API."""
+import base64
+import binascii
+import json
 import logging
+import re
 import shutil
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import text
-from sqlalchemy.exc import OperationalError, ProgrammingError, SQLAlchemyError
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError, SQLAlchemyError
 
 from apps.api.core import get_db, UPLOAD_DIR
-from apps.api.core.config import get_today_iso
-from apps.api.routers.auth import get_optional_user
+from apps.api.core.asset_refs import extract_upload_paths, resolve_assets, sync_post_asset_refs
+from apps.api.core.autosave import autosave_buffer
+from apps.api.core.cache import cache_key, response_cache
+from apps.api.core.compression import encode_stored, negotiate
+from apps.api.core.config import IMAGE_THUMBNAIL_WIDTH
+from apps.api.core.content_derive import content_hash as _content_hash, derive_content
+from apps.api.core.feeds import feed_documents
+from apps.api.core.http_cache import apply_validators, is_not_modified, make_etag, not_modified_response
+from apps.api.core.image_variants import apply_responsive_images, image_variants, variant_paths
+from apps.api.core.post_catalog import post_catalog
+from apps.api.core.post_counters import post_counters
+from apps.api.core.post_revisions import diff_revisions, list_revisions, load_revision, record_revision
+from apps.api.core.post_transfer import IMPORT_MAX_LINE_BYTES, PostImporter, iter_export_lines
+from apps.api.core.publish_scheduler import is_live, publish_scheduler
+from apps.api.core.search import highlight, load_snippets, search_index
+from apps.api.core.view_counter import view_counter, views_cache_tag
+from apps.api.routers.auth import get_current_user, get_optional_user
 
 router = APIRouter(tags=["posts"])
 logger = logging.getLogger(__name__)
 
+# slug UNIQUE 충돌 시 재배정 최대 시도 횟수
+_SLUG_MAX_ATTEMPTS = 5
+_SLUG_SUFFIX_RE = re.compile(r"[0-9]+")
+# 본문 및 본문에서 파생되는 posts 컬럼 (content_derive.DerivedContent.columns() 포함)
+_POST_CONTENT_COLUMNS = (
+    "content_html", "content_json", "content_hash",
+    "excerpt", "word_count", "char_count", "reading_minutes", "toc_json",
+)
+
 
 class PostBody(BaseModel):
     title: str = ""
@@ -31,6 +61,21 @@ class PostBody(BaseModel):
     attachment_asset_ids: list[int] = []
 
 
+class AutosaveField(BaseModel):
+    """ops가 있으면 기준 본문에 [start, end, text] splice를 순서대로 적용 (JS 문자열 인덱스 = UTF-16 코드 단위,
+    오름차순·겹침 없음), 없으면 value로 교체."""
+    value: str | None = None
+    ops: list[tuple[int, int, str]] | None = None
+
+
+class AutosaveBody(BaseModel):
+    """자동 저장 요청. base_hash: 패치 기준 본문 해시 — 글 조회(로그인) 응답의 autosave_base_hash 또는 직전 자동 저장 응답의 content_hash.
+    필드 생략 시 변경 없음."""
+    base_hash: str | None = None
+    content_html: AutosaveField | None = None
+    content_json: AutosaveField | None = None
+
+
 def _relocate_post_temp_asset(asset_id: int | None, post_id: int, db, upload_dir: Path) -> None:
     """images/posts/.../temp/ 에 있는 asset을 .../post_id/ 로 이동하고 assets.file_path 갱신."""
     if not asset_id:
@@ -38,7 +83,11 @@ def _relocate_post_temp_asset(asset_id: int | None, post_id: int, db, upload_dir
     row = db.execute(text("SELECT id, file_path FROM assets WHERE id = :id"), {"id": asset_id}).fetchone()
     if not row:
         return
-    file_path = (row[1] or "").strip().replace("\\", "/")
+    _move_temp_asset(asset_id, row[1], post_id, db, upload_dir)
+
+
+def _move_temp_asset(asset_id: int, file_path: str | None, post_id: int, db, upload_dir: Path) -> None:
+    file_path = (file_path or "").strip().replace("\\", "/")
     if "/temp/" not in file_path:
         return
     src = upload_dir / file_path
@@ -52,43 +101,189 @@ def _relocate_post_temp_asset(asset_id: int | None, post_id: int, db, upload_dir
 
 
 def _relocate_post_content_temp_assets(post_id: int, content_html: str | None, db, upload_dir: Path) -> None:
-    """본문 content_html에 URL로 참조된 images/posts/.../temp/ asset들을 post_id 폴더로 이동."""
-    if not content_html:
+    """본문이 참조하는 자산을 post_asset_refs에 기록하고, 그중 images/posts/.../temp/ 자산만 post_id 폴더로 이동.
+    참조 경로는 본문에서 한 번 추출해 file_path 인덱스로 조회 (전체 temp 자산 스캔 없음)."""
+    assets = resolve_assets(db, extract_upload_paths(content_html))
+    sync_post_asset_refs(db, post_id, {aid for aid, _ in assets})
+    for aid, fp in assets:
+        if fp.replace("\\", "/").startswith("images/posts/"):
+            _move_temp_asset(aid, fp, post_id, db, upload_dir)
+
+
+def _store_encoded_content(db, post_id: int, content_html: str | None, content_hash: str | None) -> None:
+    """저장된 content_html을 gzip/br로 미리 압축해 post_content_encoded에 보관 (본문 API가 요청마다 압축하지 않도록)."""
+    if not content_hash:
         return
-    content_norm = content_html.replace("\\", "/")
-    rows = db.execute(
-        text("SELECT id, file_path FROM assets WHERE file_path LIKE :pat AND file_path LIKE :temp"),
-        {"pat": "images/posts/%", "temp": "%/temp/%"},
-    ).fetchall()
-    for row in rows:
-        aid, fp = row[0], (row[1] or "").strip().replace("\\", "/")
-        url_rel = f"/static/uploads/{fp}"
-        # 본문에 상대 URL 또는 절대 URL(호스트 포함)로 들어있을 수 있음
-        if url_rel in content_norm or fp in content_norm:
-            _relocate_post_temp_asset(aid, post_id, db, upload_dir)
-
-
-def _slug_exists(db, slug: str, exclude_id: int | None = None) -> bool:
-    if exclude_id is not None:
-        r = db.execute(
-            text("SELECT 1 FROM posts WHERE slug = :slug AND id != :id"),
-            {"slug": slug, "id": exclude_id},
-        ).fetchone()
-    else:
-        r = db.execute(text("SELECT 1 FROM posts WHERE slug = :slug"), {"slug": slug}).fetchone()
-    return r is not None
+    data = (content_html or "").encode("utf-8")
+    encoded = encode_stored(data)
+    db.execute(
+        text("""
+            INSERT INTO post_content_encoded (post_id, content_hash, html_gzip, html_br, html_bytes, updated_at)
+            VALUES (:post_id, :content_hash, :html_gzip, :html_br, :html_bytes, UTC_TIMESTAMP())
+            ON DUPLICATE KEY UPDATE
+                content_hash = VALUES(content_hash), html_gzip = VALUES(html_gzip), html_br = VALUES(html_br),
+                html_bytes = VALUES(html_bytes), updated_at = VALUES(updated_at)
+        """),
+        {
+            "post_id": post_id,
+            "content_hash": content_hash,
+            "html_gzip": encoded["gzip"],
+            "html_br": encoded["br"],
+            "html_bytes": len(data),
+        },
+    )
 
 
-def _unique_slug(db, base: str, exclude_id: int | None = None) -> str:
+def _escape_like(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _unique_slug(db, base: str, exclude_id: int | None = None, also_taken: set[str] | None = None) -> str:
+    """base 및 base-<n> 형제 slug를 UNIQUE 인덱스 범위 쿼리 1회로 조회해, 비어 있는 가장 작은 접미사 선택.
+    also_taken: 조회 결과에 더해 사용 중으로 볼 slug (소문자)."""
     slug = base or "untitled"
-    if not _slug_exists(db, slug, exclude_id):
+    rows = db.execute(
+        text("SELECT slug FROM posts WHERE (slug = :slug OR slug LIKE :prefix) AND id != :exclude_id"),
+        {"slug": slug, "prefix": _escape_like(slug) + "-%", "exclude_id": exclude_id or 0},
+    ).fetchall()
+    # 컬럼 collation(utf8mb4_unicode_ci)이 대소문자 무시이므로 비교도 소문자 기준
+    taken = {(r[0] or "").lower() for r in rows} | (also_taken or set())
+    lowered = slug.lower()
+    if lowered not in taken:
         return slug
+    prefix = lowered + "-"
+    used = set()
+    for t in taken:
+        m = _SLUG_SUFFIX_RE.fullmatch(t[len(prefix):]) if t.startswith(prefix) else None
+        if m:
+            used.add(int(m.group(0)))
     n = 1
-    while _slug_exists(db, f"{slug}-{n}", exclude_id):
+    while n in used:
         n += 1
     return f"{slug}-{n}"
 
 
+def _is_slug_conflict(e: IntegrityError) -> bool:
+    args = getattr(e.orig, "args", ())
+    return bool(args) and args[0] == 1062 and "slug" in str(args[1] if len(args) > 1 else "")
+
+
+def _write_with_unique_slug(db, base: str, write, exclude_id: int | None = None) -> str:
+    """slug 배정 후 write(slug) 실행. 동시 저장으로 UNIQUE 충돌 시 savepoint 롤백 후 재배정.
+    REPEATABLE READ 스냅샷에서는 재조회해도 상대 트랜잭션의 slug가 안 보이므로 충돌 slug를 직접 누적."""
+    conflicted: set[str] = set()
+    for attempt in range(_SLUG_MAX_ATTEMPTS):
+        slug = _unique_slug(db, base, exclude_id, conflicted)
+        try:
+            with db.begin_nested():
+                write(slug)
+            return slug
+        except IntegrityError as e:
+            if not _is_slug_conflict(e):
+                raise
+            conflicted.add(slug.lower())
+            logger.info("slug 충돌로 재배정 (%d/%d): %s", attempt + 1, _SLUG_MAX_ATTEMPTS, slug)
+    raise HTTPException(status_code=409, detail="슬러그가 동시에 사용되어 저장하지 못했습니다. 다시 시도하세요.")
+
+
+def _has_temp_paths(*values: str | None) -> bool:
+    return any(v and "/temp/" in v for v in values)
+
+
+def _rewrite_temp_paths(value: str | None, post_id: int) -> str | None:
+    """본문 내 temp 업로드 경로를 게시물 ID 경로로 치환 (저장 전 Python에서 1회, 자산 이동 규칙과 동일)."""
+    if not value or "/temp/" not in value:
+        return value
+    return value.replace("/temp/", f"/{post_id}/")
+
+
+def _derive_content(db, content_html: str | None):
+    """저장할 content_html: 업로드 이미지 <img>를 파생본 srcset·<picture>로 재작성한 뒤 파생값(요약·목차 등) 계산."""
+    return derive_content(apply_responsive_images(db, content_html))
+
+
+def _requested_tags(body: PostBody) -> set[int]:
+    return {tid for tid in body.post_tags or [] if tid}
+
+
+def _requested_attachments(body: PostBody) -> dict[int, int]:
+    """asset_id → sort_order (요청 목록에서의 위치, 중복은 첫 위치)."""
+    attachments: dict[int, int] = {}
+    for idx, aid in enumerate(body.attachment_asset_ids or []):
+        if aid and aid not in attachments:
+            attachments[aid] = idx
+    return attachments
+
+
+def _apply_child_diff(
+    db,
+    post_id: int,
+    old_tags: set[int],
+    new_tags: set[int],
+    old_attachments: dict[int, int],
+    new_attachments: dict[int, int],
+) -> list[int]:
+    """post_tags / post_attachments 차이만 일괄 반영 (DELETE ... IN, 다중 행 INSERT, CASE UPDATE). 새로 붙은 asset id 반환."""
+    removed_tags = old_tags - new_tags
+    added_tags = new_tags - old_tags
+    if removed_tags:
+        db.execute(
+            text("DELETE FROM post_tags WHERE post_id = :pid AND tag_id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"pid": post_id, "ids": sorted(removed_tags)},
+        )
+    if added_tags:
+        db.execute(
+            text("INSERT INTO post_tags (post_id, tag_id) VALUES (:pid, :tid)"),
+            [{"pid": post_id, "tid": tid} for tid in sorted(added_tags)],
+        )
+    removed = old_attachments.keys() - new_attachments.keys()
+    added = [aid for aid in new_attachments if aid not in old_attachments]
+    reordered = {
+        aid: order for aid, order in new_attachments.items()
+        if aid in old_attachments and old_attachments[aid] != order
+    }
+    if removed:
+        db.execute(
+            text("DELETE FROM post_attachments WHERE post_id = :pid AND asset_id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"pid": post_id, "ids": sorted(removed)},
+        )
+    if added:
+        db.execute(
+            text("INSERT INTO post_attachments (post_id, asset_id, sort_order) VALUES (:pid, :aid, :ord)"),
+            [{"pid": post_id, "aid": aid, "ord": new_attachments[aid]} for aid in added],
+        )
+    if reordered:
+        params = {"pid": post_id}
+        cases = []
+        ids = []
+        for i, (aid, order) in enumerate(reordered.items()):
+            cases.append(f"WHEN :aid{i} THEN :ord{i}")
+            ids.append(f":aid{i}")
+            params[f"aid{i}"] = aid
+            params[f"ord{i}"] = order
+        db.execute(
+            text(f"""
+                UPDATE post_attachments SET sort_order = CASE asset_id {" ".join(cases)} ELSE sort_order END
+                WHERE post_id = :pid AND asset_id IN ({", ".join(ids)})
+            """),
+            params,
+        )
+    return added
+
+
+def _same_datetime(a, b) -> bool:
+    """DB DATETIME(초 단위 반올림)과 요청 값 비교: 1초 미만 차이는 같은 값."""
+    if a is None or b is None:
+        return a is None and b is None
+    if not isinstance(a, datetime) or not isinstance(b, datetime):
+        return False
+    return abs((a - b).total_seconds()) < 1
+
+
 def _parse_published_at(s: str | None) -> datetime | None:
     """Parse published_at string to datetime (naive UTC for DB/comparison).
     Frontend sends ISO 8601 with Z; legacy naive input is treated as UTC."""
@@ -123,8 +318,67 @@ def _isoformat_utc(dt: datetime | None) -> str | None:
     return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _sync_post_indexes(db, post_id: int) -> None:
+    """커밋 후 호출: 글 1건의 현재 상태를 인메모리 색인에 반영 (삭제됐으면 제거)."""
+    row = db.execute(
+        text("SELECT id, title, content_html, slug, status, published_at, category_id, prefix_id FROM posts WHERE id = :id"),
+        {"id": post_id},
+    ).fetchone()
+    if not row:
+        search_index.remove(post_id)
+        post_catalog.remove(post_id)
+        post_counters.remove(post_id)
+        feed_documents.refresh([post_id], db)
+        return
+    tag_rows = db.execute(text("SELECT tag_id FROM post_tags WHERE post_id = :id"), {"id": post_id}).fetchall()
+    search_index.upsert(row[0], row[1], row[2], row[3], row[4], row[5], row[6])
+    post_catalog.upsert(row[0], row[4], row[5], row[1])
+    post_counters.upsert(row[0], row[4], row[5], row[6], row[7], [r[0] for r in tag_rows])
+    publish_scheduler.schedule(row[0], row[4], row[5])
+    feed_documents.refresh([post_id], db)
+
+
+def _on_posts_live(post_ids: list[int]) -> None:
+    """예약 글 공개 전환 시 (스케줄러 스레드): 공개 목록·단건 캐시(404 음성 캐시 포함) 무효화, sitemap·피드 반영."""
+    response_cache.invalidate("posts")
+    feed_documents.refresh(post_ids)
+
+
+publish_scheduler.add_listener(_on_posts_live)
+
+
+def _order_key(order_by: str | None) -> str:
+    if order_by in ("oldest", "views"):
+        return order_by
+    return "latest"
+
+
+def _encode_cursor(order_key: str, row_key: list) -> str:
+    """커서 토큰: 정렬 기준 + 마지막 행의 정렬 키 (latest/oldest=(id), views=(view_count, id))."""
+    raw = json.dumps({"o": order_key, "k": row_key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, order_key: str) -> list | None:
+    """빈 문자열이면 첫 페이지(None). 형식 오류·정렬 기준 불일치 시 400."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        key = [int(x) for x in data["k"]]
+        order = data["o"]
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    if order != order_key or len(key) != (2 if order_key == "views" else 1):
+        raise HTTPException(status_code=400, detail="커서의 정렬 기준이 요청과 다릅니다.")
+    return key
+
+
 @router.get("")
 def list_posts(
+    request: Request,
+    response: Response,
     page: int = 1,
     per_page: int = 10,
     category_id: int | None = None,
@@ -133,10 +387,120 @@ def list_posts(
     status: str | None = None,
     q: str | None = None,
     order_by: str | None = None,
+    cursor: str | None = None,
+    include_total: bool | None = None,
+    view: str | None = None,
+    fields: str | None = None,
     db=Depends(get_db),
 ):
-    """글 목록 (페이지네이션)."""
-    offset = (page - 1) * per_page
+    """글 목록 (페이지네이션).
+    cursor 지정 시(첫 페이지는 빈 문자열) OFFSET 대신 정렬 키로 seek 하는 커서 모드. 응답의 next_cursor로 다음 페이지 요청.
+    include_total: 전체 개수 포함 여부 (기본: 오프셋 모드 True, 커서 모드 False).
+    view=card: 목록 카드용 항목 (썸네일 URL·요약·태그 포함). fields=a,b,c: 해당 필드(+id)만 응답.
+    status=PUBLISHED(공개 목록)는 응답 캐시 사용. 목록 단위 ETag로 If-None-Match 시 304."""
+    params = {
+        "page": page,
+        "per_page": per_page,
+        "category_id": category_id,
+        "tag_id": tag_id,
+        "prefix_id": prefix_id,
+        "status": status,
+        "q": q,
+        "order_by": order_by,
+        "cursor": cursor,
+        "include_total": include_total,
+        "fields": _resolve_list_fields(view, fields),
+    }
+    if status == "PUBLISHED":
+        etag = response_cache.get_or_set(
+            cache_key("posts.list.validator", **params),
+            ("posts", "categories", "post_prefixes"),
+            lambda: _post_list_etag(db, params),
+        )
+    else:
+        etag = _post_list_etag(db, params)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    if status == "PUBLISHED":
+        result = response_cache.get_or_set(
+            cache_key("posts.list", **params),
+            ("posts", "categories", "post_prefixes"),
+            lambda: _query_post_list(db, **params),
+        )
+    else:
+        result = _query_post_list(db, **params)
+    apply_validators(response, etag)
+    return result
+
+
+# 목록 필드 → SELECT 식. category/tags는 조립 필드(아래 _query_post_list 참고)
+_LIST_COLUMNS = {
+    "id": "p.id",
+    "title": "p.title",
+    "slug": "p.slug",
+    "status": "p.status",
+    "published_at": "p.published_at",
+    "created_at": "p.created_at",
+    "updated_at": "p.updated_at",
+    "category_id": "p.category_id",
+    "category_name": "c.name",
+    "view_count": "COALESCE(p.view_count, 0)",
+    "excerpt": "p.excerpt",
+    "word_count": "p.word_count",
+    "char_count": "p.char_count",
+    "reading_minutes": "p.reading_minutes",
+    "thumbnail_url": "ta.file_path",
+}
+_LIST_COMPOSED_FIELDS = ("category", "tags")
+_DEFAULT_LIST_FIELDS = (
+    "id", "title", "slug", "status", "published_at", "created_at", "updated_at",
+    "category_id", "category_name", "category", "view_count",
+    "excerpt", "word_count", "char_count", "reading_minutes",
+)
+_CARD_LIST_FIELDS = (
+    "id", "title", "slug", "published_at", "created_at", "category_id", "category_name", "category",
+    "view_count", "excerpt", "reading_minutes", "thumbnail_url", "tags",
+)
+
+
+def _resolve_list_fields(view: str | None, fields: str | None) -> tuple[str, ...]:
+    """view(기본/card)와 fields(쉼표 구분)로 응답 필드 목록 결정. 알 수 없는 값은 400."""
+    if view not in (None, "", "card"):
+        raise HTTPException(status_code=400, detail=f"알 수 없는 view입니다: {view}")
+    if not fields:
+        return _CARD_LIST_FIELDS if view == "card" else _DEFAULT_LIST_FIELDS
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in _LIST_COLUMNS and f not in _LIST_COMPOSED_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 필드입니다: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(["id", *requested]))
+
+
+def _list_post_tags(db, post_ids: list[int]) -> dict[int, list[dict]]:
+    """페이지 글들의 태그를 IN 조회 1회로 묶어서 반환."""
+    if not post_ids:
+        return {}
+    rows = db.execute(
+        text("""
+            SELECT pt.post_id, t.id, t.name FROM post_tags pt JOIN tags t ON t.id = pt.tag_id
+            WHERE pt.post_id IN :ids ORDER BY pt.post_id, t.id
+        """).bindparams(bindparam("ids", expanding=True)),
+        {"ids": post_ids},
+    ).fetchall()
+    tags: dict[int, list[dict]] = {}
+    for post_id, tag_id, name in rows:
+        tags.setdefault(post_id, []).append({"id": tag_id, "name": name})
+    return tags
+
+
+def _post_list_filters(
+    category_id: int | None,
+    tag_id: int | None,
+    prefix_id: int | None,
+    status: str | None,
+    q: str | None,
+) -> tuple[str, dict]:
+    """목록 WHERE 절과 바인드 파라미터."""
     filter_params = {}
     where = []
     if category_id is not None:
@@ -149,7 +513,8 @@ def list_posts(
         where.append("p.status = :status")
         filter_params["status"] = status
         if status == "PUBLISHED":
-            where.append("(p.published_at IS NOT NULL AND p.published_at <= UTC_TIMESTAMP())")
+            # 발행 시각 도래 여부는 예약 발행 스케줄러가 is_live로 유지
+            where.append("p.is_live = 1")
     if tag_id is not None:
         where.append("EXISTS (SELECT 1 FROM post_tags pt WHERE pt.post_id = p.id AND pt.tag_id = :tag_id)")
         filter_params["tag_id"] = tag_id
@@ -160,161 +525,513 @@ def list_posts(
         where.append("p.title LIKE :q")
         filter_params["q"] = f"%{q.strip()}%"
     where_sql = " AND ".join(where) if where else "1=1"
-    count_row = db.execute(
-        text(f"SELECT COUNT(*) FROM posts p WHERE {where_sql}"),
+    return where_sql, filter_params
+
+
+def _post_list_etag(db, params: dict) -> str:
+    """목록 validator: 필터 대상 글의 개수·최종 수정일·(id, updated_at, 제목, 본문 해시, 썸네일, 말머리) 해시 + 카테고리명·말머리명 해시.
+    말머리 삭제(FK SET NULL)는 updated_at을 바꾸지 않으므로 prefix_id도 행 해시에 포함.
+    updated_at은 초 단위라 같은 초 안의 두 저장을 구분하도록 제목·본문 해시도 포함.
+    정렬이 조회수 기준이면 view_count도 포함. 페이지 본문 조회·직렬화 없이 집계 1회."""
+    where_sql, filter_params = _post_list_filters(
+        params["category_id"], params["tag_id"], params["prefix_id"], params["status"], params["q"]
+    )
+    row_sig = "p.id, p.updated_at, p.title, p.content_hash, p.thumbnail_asset_id, p.prefix_id"
+    if params["order_by"] == "views":
+        row_sig += ", p.view_count"
+    row = db.execute(
+        text(f"""
+            SELECT COUNT(*), MAX(p.updated_at),
+                   COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', {row_sig}))), 0),
+                   (SELECT COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', id, name))), 0) FROM categories),
+                   (SELECT COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', id, name))), 0) FROM post_prefixes)
+            FROM posts p
+            WHERE {where_sql}
+        """),
         filter_params,
     ).fetchone()
-    total = count_row[0] or 0
-    if order_by == "oldest":
-        order_sql = "ORDER BY p.id ASC"
-    elif order_by == "views":
-        order_sql = "ORDER BY COALESCE(p.view_count, 0) DESC, p.id DESC"
+    return make_etag("posts.list", sorted(params.items()), *row, image_variants.generation)
+
+
+def _query_post_list(
+    db,
+    page: int,
+    per_page: int,
+    category_id: int | None,
+    tag_id: int | None,
+    prefix_id: int | None,
+    status: str | None,
+    q: str | None,
+    order_by: str | None,
+    cursor: str | None,
+    include_total: bool | None,
+    fields: tuple[str, ...] = _DEFAULT_LIST_FIELDS,
+) -> dict:
+    cursor_mode = cursor is not None
+    if include_total is None:
+        include_total = not cursor_mode
+    where_sql, filter_params = _post_list_filters(category_id, tag_id, prefix_id, status, q)
+    total = None
+    if include_total and not (q and q.strip()) and post_counters.ready:
+        # 공통 필터 조합은 인메모리 카운터로 O(1). 제목 검색(q)은 COUNT(*) 유지
+        total = post_counters.count(status, category_id, tag_id, prefix_id)
+    elif include_total:
+        count_row = db.execute(
+            text(f"SELECT COUNT(*) FROM posts p WHERE {where_sql}"),
+            filter_params,
+        ).fetchone()
+        total = count_row[0] or 0
+    order_key = _order_key(order_by)
+    page_params = {**filter_params}
+    if cursor_mode:
+        # 커서 모드: 인덱스 (id) / (view_count, id) 순서 그대로 seek. view_count는 NULL 없이 유지됨 (db_init 백필).
+        seek_sql = ""
+        after = _decode_cursor(cursor, order_key)
+        if order_key == "oldest":
+            order_sql = "ORDER BY p.id ASC"
+            if after:
+                seek_sql = " AND p.id > :after_id"
+                page_params["after_id"] = after[0]
+        elif order_key == "views":
+            order_sql = "ORDER BY p.view_count DESC, p.id DESC"
+            if after:
+                seek_sql = " AND (p.view_count < :after_vc OR (p.view_count = :after_vc AND p.id < :after_id))"
+                page_params["after_vc"] = after[0]
+                page_params["after_id"] = after[1]
+        else:
+            order_sql = "ORDER BY p.id DESC"
+            if after:
+                seek_sql = " AND p.id < :after_id"
+                page_params["after_id"] = after[0]
+        # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+        limit_sql = "LIMIT :limit"
+        page_params["limit"] = per_page + 1
+        page_where_sql = where_sql + seek_sql
     else:
-        # 공개/일부공개/비공개 구분 없이 글 생성 순서(id)대로 정렬
-        order_sql = "ORDER BY p.id DESC"
+        if order_key == "oldest":
+            order_sql = "ORDER BY p.id ASC"
+        elif order_key == "views":
+            order_sql = "ORDER BY COALESCE(p.view_count, 0) DESC, p.id DESC"
+        else:
+            # 공개/일부공개/비공개 구분 없이 글 생성 순서(id)대로 정렬
+            order_sql = "ORDER BY p.id DESC"
+        limit_sql = "LIMIT :limit OFFSET :offset"
+        page_params["limit"] = per_page
+        page_params["offset"] = (page - 1) * per_page
+        page_where_sql = where_sql
+    # 요청 필드에 필요한 컬럼·조인만 조회 (category는 id+name, 커서 모드 views 정렬은 view_count 필요)
+    columns = {f for f in fields if f in _LIST_COLUMNS}
+    if "category" in fields:
+        columns.update(("category_id", "category_name"))
+    if cursor_mode and order_key == "views":
+        columns.add("view_count")
+    columns.add("id")
+    select_sql = ", ".join(f"{_LIST_COLUMNS[f]} AS {f}" for f in sorted(columns))
+    join_sql = ""
+    if "category_name" in columns:
+        join_sql += " LEFT JOIN categories c ON c.id = p.category_id"
+    if "thumbnail_url" in columns:
+        join_sql += " LEFT JOIN assets ta ON ta.id = p.thumbnail_asset_id"
     rows = db.execute(
         text(f"""
-            SELECT p.id, p.title, p.slug, p.status, p.published_at, p.created_at, p.updated_at,
-                   p.category_id, c.name AS category_name, COALESCE(p.view_count, 0) AS view_count
-            FROM posts p
-            LEFT JOIN categories c ON c.id = p.category_id
-            WHERE {where_sql}
+            SELECT {select_sql}
+            FROM posts p{join_sql}
+            WHERE {page_where_sql}
             {order_sql}
-            LIMIT :limit OFFSET :offset
+            {limit_sql}
         """),
-        {**filter_params, "limit": per_page, "offset": offset},
-    ).fetchall()
+        page_params,
+    ).mappings().fetchall()
+    next_cursor = None
+    if cursor_mode and len(rows) > per_page:
+        rows = rows[:per_page]
+        last = rows[-1]
+        next_cursor = _encode_cursor(
+            order_key, [int(last["view_count"]), last["id"]] if order_key == "views" else [last["id"]]
+        )
+    tags = _list_post_tags(db, [r["id"] for r in rows]) if "tags" in fields else {}
+    # 카드 썸네일: 표시 폭에 맞는 파생본 (없으면 원본)
+    thumbnails = variant_paths(db, {r["thumbnail_url"] for r in rows}, IMAGE_THUMBNAIL_WIDTH) if "thumbnail_url" in fields else {}
     items = []
     for r in rows:
-        items.append({
-            "id": r[0],
-            "title": r[1],
-            "slug": r[2],
-            "status": r[3],
-            "published_at": _isoformat_utc(r[4]),
-            "created_at": _isoformat_utc(r[5]),
-            "updated_at": _isoformat_utc(r[6]),
-            "category_id": r[7],
-            "category_name": r[8],
-            "category": {"id": r[7], "name": r[8]} if r[7] else None,
-            "view_count": int(r[9]) if r[9] is not None else 0,
-        })
+        item = {}
+        for f in fields:
+            if f == "category":
+                item[f] = {"id": r["category_id"], "name": r["category_name"]} if r["category_id"] else None
+            elif f == "tags":
+                item[f] = tags.get(r["id"], [])
+            elif f in ("published_at", "created_at", "updated_at"):
+                item[f] = _isoformat_utc(r[f])
+            elif f == "view_count":
+                item[f] = int(r[f]) if r[f] is not None else 0
+            elif f == "thumbnail_url":
+                path = thumbnails.get(r[f], r[f])
+                item[f] = f"/static/uploads/{path.replace(chr(92), '/')}" if path else None
+            else:
+                item[f] = r[f]
+        items.append(item)
+    if cursor_mode:
+        return {"items": items, "total": total, "next_cursor": next_cursor}
     return {"items": items, "total": total}
 
 
+@router.get("/search")
+def search_posts(
+    q: str = "",
+    page: int = 1,
+    per_page: int = 10,
+    db=Depends(get_db),
+    current_user=Depends(get_optional_user),
+):
+    """제목·본문 전문 검색 (BM25 랭킹). 비로그인 시 공개 글만. title_highlight/snippet은 <mark> 포함 HTML.
+    스니펫은 이 페이지 결과 글만 DB 본문에서 생성."""
+    if not search_index.ready:
+        raise HTTPException(status_code=503, detail="검색 색인을 준비 중입니다. 잠시 후 다시 시도하세요.")
+    page = max(page, 1)
+    per_page = min(max(per_page, 1), 50)
+    total, hits = search_index.search(
+        q,
+        include_unpublished=current_user is not None,
+        offset=(page - 1) * per_page,
+        limit=per_page,
+    )
+    snippets = load_snippets(db, [pid for pid, _, _ in hits], q)
+    items = [
+        {
+            "id": pid,
+            "title": doc.title,
+            "slug": doc.slug,
+            "status": doc.status,
+            "published_at": _isoformat_utc(doc.published_at),
+            "category_id": doc.category_id,
+            "score": round(score, 4),
+            "title_highlight": highlight(doc.title, q),
+            "snippet": snippets.get(pid, ""),
+        }
+        for pid, score, doc in hits
+    ]
+    return {"items": items, "total": total}
+
+
+@router.get("/export")
+def export_posts(current_user=Depends(get_current_user)):
+    """전체 글 NDJSON 내보내기 (관리자). 한 줄 = 글 1건(태그명·첨부 포함), 서버 측 커서로 스트리밍."""
+    return StreamingResponse(
+        iter_export_lines(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="posts.ndjson"'},
+    )
+
+
+@router.post("/import")
+async def import_posts(request: Request, current_user=Depends(get_current_user)):
+    """NDJSON 글 가져오기 (관리자). 요청 본문을 스트림으로 읽으며 청크 단위로 다중 행 INSERT + 커밋.
+    같은 slug가 이미 있으면 건너뜀. 응답: 적재/건너뜀/실패 건수, 오류 줄, 청크별 진행 내역.
+    이벤트 루프에서는 줄 나누기만, JSON 파싱·검증·본문 파생·적재는 모은 줄 단위로 스레드풀에서.
+    IMPORT_MAX_LINE_BYTES를 넘는 줄은 실패 처리하고 다음 줄부터 계속."""
+    importer = PostImporter()
+    buf = b""
+    batch: list[bytes | None] = []  # None: 상한 초과로 실패 처리할 줄 (순서 유지)
+    batch_bytes = 0
+    skipping = False  # 상한 초과 줄의 나머지를 다음 줄바꿈까지 버리는 중
+    async for part in request.stream():
+        buf += part
+        *lines, buf = buf.split(b"\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+                continue
+            batch.append(line if len(line) <= IMPORT_MAX_LINE_BYTES else None)
+            batch_bytes += min(len(line), IMPORT_MAX_LINE_BYTES)
+        if len(buf) > IMPORT_MAX_LINE_BYTES:
+            if not skipping:
+                batch.append(None)
+            buf, skipping = b"", True
+        if len(batch) >= importer.chunk_size or batch_bytes >= IMPORT_MAX_LINE_BYTES:
+            await run_in_threadpool(importer.feed_lines, batch)
+            batch, batch_bytes = [], 0
+    if buf and not skipping:
+        batch.append(buf)
+    await run_in_threadpool(importer.feed_lines, batch)
+    summary = await run_in_threadpool(importer.finish)
+    if summary["imported"]:
+        await run_in_threadpool(_refresh_after_import)
+    return summary
+
+
+def _refresh_after_import() -> None:
+    """대량 적재 후 인메모리 색인·카운터·응답 캐시 재구성."""
+    response_cache.invalidate("posts", "tags")
+    post_catalog.rebuild()
+    post_counters.rebuild()
+    publish_scheduler.reload()
+    feed_documents.rebuild()
+    search_index.rebuild_in_background()
+
+
 @router.get("/{post_id}/neighbors")
-def get_post_neighbors(post_id: int, db=Depends(get_db)):
-    """이전/다음 글 (published_at 기준, PUBLISHED만). prev=이전에 쓴 글(오래된), next=다음에 쓴 글(최신)."""
-    cur = db.execute(
-        text("""
-            SELECT id, published_at FROM posts
-            WHERE id = :id AND status = 'PUBLISHED'
-            AND published_at IS NOT NULL AND published_at <= UTC_TIMESTAMP()
-        """),
-        {"id": post_id},
-    ).fetchone()
+def get_post_neighbors(post_id: int):
+    """이전/다음 글 (published_at 기준, PUBLISHED만). prev=이전에 쓴 글(오래된), next=다음에 쓴 글(최신).
+    인메모리 발행 글 카탈로그에서 bisect로 조회 (DB 조회 없음)."""
+    found = post_catalog.neighbors(post_id)
+    if found is None:
+        raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
+    older, newer = found
+    return {"prev": older, "next": newer}
+
+
+@router.get("/{post_id}/page")
+def get_post_page(
+    post_id: int,
+    request: Request,
+    response: Response,
+    content: bool = True,
+    db=Depends(get_db),
+    current_user=Depends(get_optional_user),
+):
+    """글 상세 페이지 모델: 글(태그·첨부 포함) + 이전/다음 글을 한 응답으로.
+    글은 get_post와 같은 경로(캐시 히트 시 DB 조회 없음), 이전/다음 글은 인메모리 카탈로그.
+    content=false면 본문(content_html/json) 제외 — 메타만 필요할 때. 상세 화면은 본문 포함 1회 호출
+    (요청을 /content와 나누면 왕복·ETag 검증이 두 배, 나누는 쪽이 측정상 유리할 때만 사용)."""
+    found = post_catalog.neighbors(post_id)
+    older, newer = found if found is not None else (None, None)
+    post = _serve_post(post_id, request, response, db, current_user, extra_etag=(older, newer), content=content)
+    if isinstance(post, Response):
+        return post
+    return {"post": post, "prev": older, "next": newer}
+
+
+def _revision_or_404(db, post_id: int, rev_no: int) -> dict:
+    revision = load_revision(db, post_id, rev_no)
+    if not revision:
+        raise HTTPException(status_code=404, detail="리비전을 찾을 수 없습니다.")
+    return revision
+
+
+@router.get("/{post_id}/revisions")
+def get_post_revisions(
+    post_id: int,
+    limit: int = 50,
+    before: int | None = None,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """글 리비전 목록 (최신순). before: 이 번호 미만 (다음 페이지)."""
+    limit = max(1, min(limit, 200))
+    items = list_revisions(db, post_id, limit, before)
+    for item in items:
+        item["created_at"] = _isoformat_utc(item["created_at"])
+    return {"items": items, "next_before": items[-1]["rev_no"] if len(items) == limit else None}
+
+
+@router.get("/{post_id}/revisions/{rev_no}")
+def get_post_revision(post_id: int, rev_no: int, db=Depends(get_db), current_user=Depends(get_current_user)):
+    """리비전 본문 복원 (스냅샷 + 델타 1회 적용)."""
+    revision = _revision_or_404(db, post_id, rev_no)
+    revision["created_at"] = _isoformat_utc(revision["created_at"])
+    return revision
+
+
+@router.get("/{post_id}/revisions/{rev_no}/diff")
+def get_post_revision_diff(
+    post_id: int,
+    rev_no: int,
+    against: int | None = None,
+    db=Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """리비전 diff (제목·content_html unified diff). against 생략 시 직전 리비전 기준."""
+    new = _revision_or_404(db, post_id, rev_no)
+    base_no = against if against is not None else rev_no - 1
+    old = _revision_or_404(db, post_id, base_no) if base_no >= 1 else None
+    return diff_revisions(old, new)
+
+
+@router.post("/{post_id}/revisions/{rev_no}/restore")
+def restore_post_revision(post_id: int, rev_no: int, db=Depends(get_db), current_user=Depends(get_current_user)):
+    """리비전의 제목·본문으로 글을 되돌림. 복원 결과도 새 리비전으로 기록 (이력은 지우지 않음)."""
+    revision = _revision_or_404(db, post_id, rev_no)
+    cur = db.execute(text("SELECT id FROM posts WHERE id = :id"), {"id": post_id}).fetchone()
     if not cur:
         raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
-    pub_at = cur[1]
-    # 목록에서 위 = 더 최신 글 (published_at, id) > current → 응답에서는 next
-    prev_row = db.execute(
-        text("""
-            SELECT p.id, p.title FROM posts p
-            WHERE p.status = 'PUBLISHED' AND p.published_at IS NOT NULL AND p.published_at <= UTC_TIMESTAMP() AND p.id != :id
-            AND (COALESCE(p.published_at, '1970-01-01') > COALESCE(:pub_at, '1970-01-01')
-                 OR (COALESCE(p.published_at, '1970-01-01') = COALESCE(:pub_at, '1970-01-01') AND p.id > :id))
-            ORDER BY COALESCE(p.published_at, '1970-01-01') ASC, p.id ASC
-            LIMIT 1
+    content_html, derived = _derive_content(db, revision["content_html"])
+    content_hash = _content_hash(revision["content_html"], revision["content_json"])
+    db.execute(
+        text(f"""
+            UPDATE posts SET title = :title, {', '.join(f'{c} = :{c}' for c in _POST_CONTENT_COLUMNS)},
+                   updated_at = UTC_TIMESTAMP()
+            WHERE id = :id
         """),
-        {"id": post_id, "pub_at": pub_at},
-    ).fetchone()
-    # 목록에서 아래 = 더 오래된 글 → 응답에서는 prev
-    next_row = db.execute(
+        {
+            "id": post_id,
+            "title": revision["title"],
+            "content_html": content_html,
+            "content_json": revision["content_json"],
+            "content_hash": content_hash,
+            **derived.columns(),
+        },
+    )
+    _relocate_post_content_temp_assets(post_id, content_html, db, Path(UPLOAD_DIR))
+    new_rev = record_revision(db, post_id, revision["title"], content_html, revision["content_json"], content_hash)
+    _store_encoded_content(db, post_id, content_html, content_hash)
+    db.commit()
+    autosave_buffer.discard(post_id)
+    response_cache.invalidate("posts")
+    _sync_post_indexes(db, post_id)
+    return {"id": post_id, "restored_from": rev_no, "rev_no": new_rev}
+
+
+@router.get("/{post_id}/content")
+def get_post_content(
+    post_id: int,
+    request: Request,
+    db=Depends(get_db),
+    current_user=Depends(get_optional_user),
+):
+    """글 본문 HTML. 저장 시 미리 압축해 둔 gzip/br 바이트를 Accept-Encoding에 맞춰 그대로 전송 (요청마다 압축 없음).
+    사전 압축본이 없거나 본문과 어긋나면(가져오기 글 등) 원문을 보내고 압축은 미들웨어가 수행."""
+    row = db.execute(
         text("""
-            SELECT p.id, p.title FROM posts p
-            WHERE p.status = 'PUBLISHED' AND p.published_at IS NOT NULL AND p.published_at <= UTC_TIMESTAMP() AND p.id != :id
-            AND (COALESCE(p.published_at, '1970-01-01') < COALESCE(:pub_at, '1970-01-01')
-                 OR (COALESCE(p.published_at, '1970-01-01') = COALESCE(:pub_at, '1970-01-01') AND p.id < :id))
-            ORDER BY COALESCE(p.published_at, '1970-01-01') DESC, p.id DESC
-            LIMIT 1
+            SELECT p.updated_at, p.is_live, p.content_hash, e.content_hash, e.html_br IS NOT NULL
+            FROM posts p LEFT JOIN post_content_encoded e ON e.post_id = p.id
+            WHERE p.id = :id
         """),
-        {"id": post_id, "pub_at": pub_at},
+        {"id": post_id},
     ).fetchone()
-    return {
-        "prev": {"id": next_row[0], "title": next_row[1]} if next_row else None,  # 이전에 쓴 글(오래된)
-        "next": {"id": prev_row[0], "title": prev_row[1]} if prev_row else None,  # 다음에 쓴 글(최신)
+    if not row or (current_user is None and not row[1]):
+        raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
+    accept_encoding = request.headers.get("accept-encoding")
+    stored = row[2] is not None and row[2] == row[3]
+    encoding = negotiate(accept_encoding, ("br", "gzip") if row[4] else ("gzip",)) if stored else None
+    etag = make_etag("post-content", post_id, row[0], row[2], encoding or negotiate(accept_encoding), image_variants.generation)
+    headers = {
+        "Vary": "Accept-Encoding",
+        # API 도메인에서 직접 열려도 스크립트 실행 안 되도록
+        "Content-Security-Policy": "default-src 'none'; img-src * data:; style-src 'unsafe-inline'; sandbox",
+        "X-Content-Type-Options": "nosniff",
     }
+    if is_not_modified(request, etag, row[0]):
+        not_modified = not_modified_response(etag, row[0])
+        not_modified.headers["Vary"] = "Accept-Encoding"
+        return not_modified
+    body = None
+    if encoding:
+        column = "html_br" if encoding == "br" else "html_gzip"
+        body = db.execute(
+            text(f"SELECT {column} FROM post_content_encoded WHERE post_id = :id AND content_hash = :content_hash"),
+            {"id": post_id, "content_hash": row[2]},
+        ).scalar()
+    if body is not None:
+        headers["Content-Encoding"] = encoding
+    else:
+        html = db.execute(text("SELECT content_html FROM posts WHERE id = :id"), {"id": post_id}).scalar()
+        body = (html or "").encode("utf-8")
+    response = Response(content=body, media_type="text/html", headers=headers)
+    apply_validators(response, etag, row[0])
+    return response
 
 
 @router.get("/{post_id}")
-def get_post(post_id: int, db=Depends(get_db), current_user=Depends(get_optional_user)):
-    """글 단건 조회. 비로그인 시 PUBLISHED만, 로그인 시 전체."""
+def get_post(
+    post_id: int,
+    request: Request,
+    response: Response,
+    content: bool = True,
+    db=Depends(get_db),
+    current_user=Depends(get_optional_user),
+):
+    """글 단건 조회. 비로그인 시 PUBLISHED만(응답 캐시 사용), 로그인 시 전체.
+    ETag/Last-Modified 부착, If-None-Match·If-Modified-Since 일치 시 PK 조회 1회로 304. content=false면 본문 제외."""
+    return _serve_post(post_id, request, response, db, current_user, content=content)
+
+
+def _serve_post(post_id: int, request: Request, response: Response, db, current_user, extra_etag=None, content=True):
+    """get_post / get_post_page 공통: validator 확인 → 304 또는 글 dict. extra_etag는 ETag에 함께 반영할 값.
+    content=False면 본문 컬럼을 뺀 표현 (ETag도 구분)."""
+    public = current_user is None
+    if public:
+        etag, last_modified = response_cache.get_or_set(
+            cache_key("posts.validator", post_id=post_id),
+            ("posts", "categories", "post_prefixes"),
+            lambda: _post_validator(db, post_id, public=True),
+        )
+        # 퍼블릭 조회 시 daily_stats 집계 및 해당 글 view_count 증가 (비로그인 + PUBLISHED만, 304 포함).
+        # 읽기 경로에서는 DB에 쓰지 않고 view_counter가 모아서 주기적으로 일괄 반영.
+        view_counter.record(post_id)
+    else:
+        etag, last_modified = _post_validator(db, post_id, public=False)
+    if extra_etag is not None:
+        etag = make_etag(etag, extra_etag)
+    if not content:
+        etag = make_etag(etag, "meta")
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    if public:
+        payload = response_cache.get_or_set(
+            cache_key("posts.get", post_id=post_id),
+            ("posts", "categories", "post_prefixes", views_cache_tag(post_id)),
+            lambda: _load_post(db, post_id, public=True),
+        )
+    else:
+        payload = _load_post(db, post_id, public=False)
+    apply_validators(response, etag, last_modified)
+    if not content:
+        payload = {k: v for k, v in payload.items() if k not in ("content_html", "content_json", "autosave_base_hash")}
+    return {**payload, "view_count": payload["view_count"] + view_counter.pending_views(post_id)}
+
+
+def _post_validator(db, post_id: int, public: bool):
+    """글 단건 validator (ETag, updated_at). 본문 LONGTEXT 없이 PK 조회 1회.
+    ETag: updated_at·상태·발행일·카테고리/말머리명·태그·첨부(경로 포함)·제목·슬러그·썸네일·본문 해시. view_count는 제외.
+    updated_at은 초 단위 → 같은 초 안의 두 저장(자동 저장 반영 직후 PUT 등)도 제목·본문 해시로 구분."""
     row = db.execute(
         text("""
+            SELECT p.updated_at, p.status, p.published_at,
+                   p.is_live,
+                   c.name, pp.name,
+                   (SELECT GROUP_CONCAT(CONCAT(t.id, ':', t.name) ORDER BY t.id SEPARATOR ',')
+                    FROM post_tags pt JOIN tags t ON t.id = pt.tag_id WHERE pt.post_id = p.id),
+                   (SELECT GROUP_CONCAT(CONCAT(a.id, ':', pa.sort_order, ':', a.file_path) ORDER BY pa.sort_order, pa.asset_id SEPARATOR ',')
+                    FROM post_attachments pa JOIN assets a ON a.id = pa.asset_id WHERE pa.post_id = p.id),
+                   p.title, p.slug, p.thumbnail_asset_id, p.content_hash
+            FROM posts p
+            LEFT JOIN categories c ON c.id = p.category_id
+            LEFT JOIN post_prefixes pp ON pp.id = p.prefix_id
+            WHERE p.id = :id
+        """),
+        {"id": post_id},
+    ).fetchone()
+    if not row or (public and not row[3]):
+        raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
+    updated_at = row[0]
+    return make_etag("post", post_id, *row, image_variants.generation), updated_at
+
+
+def _load_post(db, post_id: int, public: bool) -> dict:
+    """글 단건 응답 dict. public=True면 발행된(is_live) 글만, 아니면 404.
+    발행 여부는 본문 조회 WHERE에 포함, 태그·첨부는 UNION ALL 1회로 조회 (총 2쿼리).
+    public=False(편집용)면 저장된 본문 해시 autosave_base_hash 포함 (자동 저장 패치 기준)."""
+    live_sql = " AND p.is_live = 1" if public else ""
+    row = db.execute(
+        text(f"""
             SELECT p.id, p.title, p.slug, p.status, p.published_at, p.category_id, p.prefix_id, p.thumbnail_asset_id,
                    p.content_html, p.content_json, p.created_at, p.updated_at,
-                   c.name AS category_name, pp.name AS prefix_name, COALESCE(p.view_count, 0) AS view_count
+                   c.name AS category_name, pp.name AS prefix_name, COALESCE(p.view_count, 0) AS view_count,
+                   p.excerpt, p.word_count, p.char_count, p.reading_minutes, p.toc_json
             FROM posts p
             LEFT JOIN categories c ON c.id = p.category_id
             LEFT JOIN post_prefixes pp ON pp.id = p.prefix_id
-            WHERE p.id = :id
+            WHERE p.id = :id{live_sql}
         """),
         {"id": post_id},
     ).fetchone()
     if not row:
         raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
     (pid, title, slug, status, published_at, category_id, prefix_id, thumbnail_asset_id,
-     content_html, content_json, created_at, updated_at, category_name, prefix_name, view_count) = row
-    if not current_user and status != "PUBLISHED":
-        raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
-    if not current_user and status == "PUBLISHED":
-        ok = db.execute(
-            text("SELECT 1 FROM posts WHERE id = :id AND published_at IS NOT NULL AND published_at <= UTC_TIMESTAMP()"),
-            {"id": post_id},
-        ).fetchone()
-        if not ok:
-            raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
+     content_html, content_json, created_at, updated_at, category_name, prefix_name, view_count,
+     excerpt, word_count, char_count, reading_minutes, toc_json) = row
 
-    # 퍼블릭 조회 시 daily_stats 집계 및 해당 글 view_count 증가 (비로그인 + PUBLISHED만). 실패해도 글 조회는 정상 반환.
-    if current_user is None and status == "PUBLISHED":
-        try:
-            today = get_today_iso()
-            db.execute(
-                text("""
-                    INSERT INTO daily_stats (date, total_views, visitor_count)
-                    VALUES (:dt, 1, 1)
-                    ON DUPLICATE KEY UPDATE
-                        total_views = total_views + 1,
-                        visitor_count = visitor_count + 1
-                """),
-                {"dt": today},
-            )
-            db.execute(
-                text("UPDATE posts SET view_count = COALESCE(view_count, 0) + 1 WHERE id = :id"),
-                {"id": post_id},
-            )
-            db.commit()
-        except (OperationalError, ProgrammingError, SQLAlchemyError) as e:
-            logger.warning("daily_stats/view_count 갱신 실패: %s", e)
-
-    tag_rows = db.execute(
-        text("SELECT t.id, t.name FROM post_tags pt JOIN tags t ON t.id = pt.tag_id WHERE pt.post_id = :id"),
-        {"id": post_id},
-    ).fetchall()
-    try:
-        att_rows = db.execute(
-            text("""
-                SELECT a.id, a.original_name, a.file_path, a.size_bytes
-                FROM post_attachments pa
-                JOIN assets a ON a.id = pa.asset_id
-                WHERE pa.post_id = :id
-                ORDER BY pa.sort_order, pa.asset_id
-            """),
-            {"id": post_id},
-        ).fetchall()
-    except (OperationalError, ProgrammingError, SQLAlchemyError):
-        # post_attachments 테이블 없음/조회 실패 시 빈 목록으로 응답 유지 (500 방지)
-        att_rows = []
+    tag_rows, att_rows = _load_post_children(db, post_id)
     attachments = []
     for a in att_rows:
         url = f"/static/uploads/{a[2].replace(chr(92), '/')}" if a[2] else None
@@ -340,16 +1057,51 @@ def get_post(post_id: int, db=Depends(get_db), current_user=Depends(get_optional
         "updated_at": _isoformat_utc(updated_at),
         "category_name": category_name,
         "view_count": int(view_count) if view_count is not None else 0,
+        "excerpt": excerpt,
+        "word_count": word_count,
+        "char_count": char_count,
+        "reading_minutes": reading_minutes,
+        "toc": json.loads(toc_json) if toc_json else [],
         "post_tags": [r[0] for r in tag_rows],
         "tags": [{"id": r[0], "name": r[1]} for r in tag_rows],
         "attachments": attachments,
+        **({} if public else {"autosave_base_hash": _content_hash(content_html, content_json)}),
     }
 
 
+def _load_post_children(db, post_id: int) -> tuple[list, list]:
+    """태그 (id, name) 목록, 첨부 (id, original_name, file_path, size_bytes) 목록을 한 번에 조회."""
+    try:
+        rows = db.execute(
+            text("""
+                SELECT 0 AS kind, t.id, t.name, NULL AS file_path, NULL AS size_bytes, 0 AS sort_order
+                FROM post_tags pt JOIN tags t ON t.id = pt.tag_id
+                WHERE pt.post_id = :id
+                UNION ALL
+                SELECT 1, a.id, a.original_name, a.file_path, a.size_bytes, pa.sort_order
+                FROM post_attachments pa JOIN assets a ON a.id = pa.asset_id
+                WHERE pa.post_id = :id
+                ORDER BY kind, sort_order, id
+            """),
+            {"id": post_id},
+        ).fetchall()
+    except (OperationalError, ProgrammingError, SQLAlchemyError):
+        # post_attachments 테이블 없음/조회 실패 시 태그만 조회해 응답 유지 (500 방지)
+        db.rollback()
+        tag_rows = db.execute(
+            text("SELECT t.id, t.name FROM post_tags pt JOIN tags t ON t.id = pt.tag_id WHERE pt.post_id = :id"),
+            {"id": post_id},
+        ).fetchall()
+        return [tuple(r) for r in tag_rows], []
+    tags = [(r[1], r[2]) for r in rows if r[0] == 0]
+    attachments = [(r[1], r[2], r[3], r[4]) for r in rows if r[0] == 1]
+    return tags, attachments
+
+
 @router.post("")
 def create_post(body: PostBody, db=Depends(get_db)):
-    """글 생성."""
-    slug = _unique_slug(db, (body.slug or "").strip() or "untitled")
+    """글 생성. 본문에 temp 경로가 있으면 본문 없이 행을 먼저 넣어 id를 확보한 뒤,
+    경로를 치환한 본문을 한 번만 기록 (LONGTEXT 재작성 없음)."""
     published = body.published_at if body.published_at else None
     parsed = _parse_published_at(published) if published else None
     if published and parsed and _published_at_in_past(parsed):
@@ -358,65 +1110,88 @@ def create_post(body: PostBody, db=Depends(get_db)):
             detail="발행일은 현재 시각 이전으로 설정할 수 없습니다.",
         )
     store_published = parsed if parsed else (published if published else None)
-    db.execute(
-        text("""
-            INSERT INTO posts (title, slug, status, published_at, category_id, prefix_id, thumbnail_asset_id, content_html, content_json, created_at, updated_at)
-            VALUES (:title, :slug, :status, :published_at, :category_id, :prefix_id, :thumbnail_asset_id, :content_html, :content_json, UTC_TIMESTAMP(), UTC_TIMESTAMP())
-        """),
-        {
-            "title": (body.title or "제목 없음").strip(),
-            "slug": slug,
-            "status": body.status or "DRAFT",
-            "published_at": store_published,
-            "category_id": body.category_id,
-            "prefix_id": body.prefix_id,
-            "thumbnail_asset_id": body.thumbnail_asset_id,
-            "content_html": body.content_html,
-            "content_json": body.content_json,
-        },
-    )
+    content_hash = _content_hash(body.content_html, body.content_json)
+    # temp 경로가 있으면 id 확보 후 본문 기록, 없으면 INSERT 한 번에 본문 포함
+    reserve_id = _has_temp_paths(body.content_html, body.content_json)
+
+    def _content_columns(post_id: int | None) -> dict:
+        content_html = body.content_html
+        content_json = body.content_json
+        if post_id is not None:
+            content_html = _rewrite_temp_paths(content_html, post_id)
+            content_json = _rewrite_temp_paths(content_json, post_id)
+        content_html, derived = _derive_content(db, content_html)
+        return {
+            "content_html": content_html,
+            "content_json": content_json,
+            "content_hash": content_hash,
+            **derived.columns(),
+        }
+
+    content = None if reserve_id else _content_columns(None)
+    title = (body.title or "제목 없음").strip()
+
+    def _insert(slug: str) -> None:
+        db.execute(
+            text("""
+                INSERT INTO posts (title, slug, status, published_at, is_live, category_id, prefix_id, thumbnail_asset_id, content_html, content_json,
+                                   content_hash, excerpt, word_count, char_count, reading_minutes, toc_json, created_at, updated_at)
+                VALUES (:title, :slug, :status, :published_at, :is_live, :category_id, :prefix_id, :thumbnail_asset_id, :content_html, :content_json,
+                        :content_hash, :excerpt, :word_count, :char_count, :reading_minutes, :toc_json, UTC_TIMESTAMP(), UTC_TIMESTAMP())
+            """),
+            {
+                "title": title,
+                "slug": slug,
+                "status": body.status or "DRAFT",
+                "published_at": store_published,
+                "is_live": is_live(body.status or "DRAFT", parsed),
+                "category_id": body.category_id,
+                "prefix_id": body.prefix_id,
+                "thumbnail_asset_id": body.thumbnail_asset_id,
+                **(content or dict.fromkeys(_POST_CONTENT_COLUMNS)),
+            },
+        )
+
+    slug = _write_with_unique_slug(db, (body.slug or "").strip() or "untitled", _insert)
     new_id_row = db.execute(text("SELECT LAST_INSERT_ID()")).fetchone()
     new_id = new_id_row[0] if new_id_row else None
-    if new_id and body.post_tags:
-        for tid in body.post_tags:
-            if not tid:
-                continue
-            db.execute(
-                text("INSERT INTO post_tags (post_id, tag_id) VALUES (:pid, :tid)"),
-                {"pid": new_id, "tid": tid},
-            )
-    if new_id and body.attachment_asset_ids:
-        for idx, aid in enumerate(body.attachment_asset_ids):
-            if not aid:
-                continue
-            db.execute(
-                text("INSERT INTO post_attachments (post_id, asset_id, sort_order) VALUES (:pid, :aid, :ord)"),
-                {"pid": new_id, "aid": aid, "ord": idx},
-            )
+    if new_id and reserve_id:
+        content = _content_columns(new_id)
+        db.execute(
+            text(f"UPDATE posts SET {', '.join(f'{c} = :{c}' for c in _POST_CONTENT_COLUMNS)} WHERE id = :id"),
+            {"id": new_id, **content},
+        )
     if new_id:
+        record_revision(db, new_id, title, content["content_html"], content["content_json"], content_hash)
+        _store_encoded_content(db, new_id, content["content_html"], content_hash)
+        _apply_child_diff(db, new_id, set(), _requested_tags(body), {}, _requested_attachments(body))
         upload_dir = Path(UPLOAD_DIR)
         _relocate_post_temp_asset(body.thumbnail_asset_id, new_id, db, upload_dir)
         for aid in body.attachment_asset_ids or []:
             if aid:
                 _relocate_post_temp_asset(aid, new_id, db, upload_dir)
         _relocate_post_content_temp_assets(new_id, body.content_html, db, upload_dir)
-        # 본문 내 이미지 URL도 temp → 게시물ID로 갱신
-        db.execute(
-            text("UPDATE posts SET content_html = REPLACE(content_html, '/temp/', :pid_slash), content_json = REPLACE(COALESCE(content_json, ''), '/temp/', :pid_slash) WHERE id = :id"),
-            {"pid_slash": f"/{new_id}/", "id": new_id},
-        )
     db.commit()
+    response_cache.invalidate("posts")
+    if new_id:
+        _sync_post_indexes(db, new_id)
     return {"id": new_id, "slug": slug}
 
 
 @router.put("/{post_id}")
 def update_post(post_id: int, body: PostBody, db=Depends(get_db)):
-    """글 수정."""
-    cur = db.execute(text("SELECT id, published_at FROM posts WHERE id = :id"), {"id": post_id}).fetchone()
+    """글 수정. 바뀐 컬럼만 UPDATE, 태그·첨부는 차이만 반영. 본문 해시가 같으면 본문 재작성·파생·temp 처리 생략.
+    아무것도 바뀌지 않았으면 쓰기 없이 반환 (updated_at 유지)."""
+    cur = db.execute(
+        text("""
+            SELECT id, published_at, title, slug, status, is_live, category_id, prefix_id, thumbnail_asset_id, content_hash
+            FROM posts WHERE id = :id
+        """),
+        {"id": post_id},
+    ).fetchone()
     if not cur:
         raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
     existing_published_at = cur[1]  # datetime or None from DB
-    slug = _unique_slug(db, (body.slug or "").strip() or "untitled", exclude_id=post_id)
     published = body.published_at if body.published_at else None
     parsed = _parse_published_at(published) if published else None
     if published and parsed and _published_at_in_past(parsed):
@@ -432,57 +1207,212 @@ def update_post(post_id: int, body: PostBody, db=Depends(get_db)):
                 detail="발행일은 현재 시각 이전으로 설정할 수 없습니다.",
             )
     store_published = parsed if parsed else (published if published else None)
-    db.execute(
+    status = body.status or "DRAFT"
+
+    # 스칼라 컬럼: 현재 값과 다른 것만 SET
+    changes = {}
+    title = (body.title or "제목 없음").strip()
+    if title != cur[2]:
+        changes["title"] = title
+    if not _same_datetime(store_published, existing_published_at):
+        changes["published_at"] = store_published
+    if status != cur[4]:
+        changes["status"] = status
+    live = is_live(status, parsed)
+    if live != bool(cur[5]):
+        changes["is_live"] = live
+    for column, value, current in (
+        ("category_id", body.category_id, cur[6]),
+        ("prefix_id", body.prefix_id, cur[7]),
+        ("thumbnail_asset_id", body.thumbnail_asset_id, cur[8]),
+    ):
+        if value != current:
+            changes[column] = value
+    content_hash = _content_hash(body.content_html, body.content_json)
+    # 자동 저장은 temp 경로를 그대로 두므로, temp 경로가 남은 본문은 해시가 같아도 치환·자산 이동 수행
+    content_changed = content_hash != cur[9] or _has_temp_paths(body.content_html, body.content_json)
+    if content_changed:
+        # temp 업로드 경로는 저장 전에 치환해 본문을 한 번만 기록
+        content_html, derived = _derive_content(db, _rewrite_temp_paths(body.content_html, post_id))
+        changes.update({
+            "content_html": content_html,
+            "content_json": _rewrite_temp_paths(body.content_json, post_id),
+            "content_hash": content_hash,
+            **derived.columns(),
+        })
+
+    # 태그·첨부: 현재 집합을 한 번에 읽어 차이 계산
+    child_rows = db.execute(
         text("""
-            UPDATE posts SET title = :title, slug = :slug, status = :status, published_at = :published_at,
-                   category_id = :category_id, prefix_id = :prefix_id, thumbnail_asset_id = :thumbnail_asset_id,
-                   content_html = :content_html, content_json = :content_json, updated_at = UTC_TIMESTAMP()
-            WHERE id = :id
+            SELECT 0, tag_id, 0 FROM post_tags WHERE post_id = :id
+            UNION ALL
+            SELECT 1, asset_id, sort_order FROM post_attachments WHERE post_id = :id
+        """),
+        {"id": post_id},
+    ).fetchall()
+    old_tags = {r[1] for r in child_rows if r[0] == 0}
+    old_attachments = {r[1]: r[2] for r in child_rows if r[0] == 1}
+    new_tags = _requested_tags(body)
+    new_attachments = _requested_attachments(body)
+
+    requested_slug = (body.slug or "").strip() or "untitled"
+    # 요청 slug가 이미 접미사가 붙은 현재 slug로 배정될 경우(예: foo → foo-1)도 변경 없음으로 판단
+    slug_changed = requested_slug != cur[3] and _unique_slug(db, requested_slug, post_id) != cur[3]
+    if not changes and not slug_changed and old_tags == new_tags and old_attachments == new_attachments:
+        autosave_buffer.reset(post_id, body.content_html, body.content_json, content_hash)
+        return {"id": post_id, "slug": cur[3]}
+
+    def _update(slug: str | None) -> None:
+        params = {"id": post_id, **changes}
+        assignments = [f"{column} = :{column}" for column in changes]
+        if slug is not None:
+            assignments.append("slug = :slug")
+            params["slug"] = slug
+        # 태그·첨부만 바뀐 경우에도 수정 시각은 갱신 (ETag·목록 validator 반영)
+        assignments.append("updated_at = UTC_TIMESTAMP()")
+        db.execute(text(f"UPDATE posts SET {', '.join(assignments)} WHERE id = :id"), params)
+
+    if slug_changed:
+        slug = _write_with_unique_slug(db, requested_slug, _update, exclude_id=post_id)
+    else:
+        slug = cur[3]
+        _update(None)
+    added_attachments = _apply_child_diff(db, post_id, old_tags, new_tags, old_attachments, new_attachments)
+    upload_dir = Path(UPLOAD_DIR)
+    if "thumbnail_asset_id" in changes:
+        _relocate_post_temp_asset(body.thumbnail_asset_id, post_id, db, upload_dir)
+    for aid in added_attachments:
+        _relocate_post_temp_asset(aid, post_id, db, upload_dir)
+    if content_changed:
+        _relocate_post_content_temp_assets(post_id, body.content_html, db, upload_dir)
+        record_revision(db, post_id, title, changes["content_html"], changes["content_json"], content_hash)
+        _store_encoded_content(db, post_id, changes["content_html"], content_hash)
+    db.commit()
+    autosave_buffer.reset(post_id, body.content_html, body.content_json, content_hash)
+    response_cache.invalidate("posts")
+    _sync_post_indexes(db, post_id)
+    return {"id": post_id, "slug": slug}
+
+
+def _apply_autosave_field(base: str | None, field: AutosaveField) -> str | None:
+    if field.ops is None:
+        return field.value
+    units = (base or "").encode("utf-16-le", "surrogatepass")
+    length = len(units) // 2
+    parts = []
+    pos = 0
+    for start, end, value in field.ops:
+        if start < pos or end < start or end > length:
+            raise HTTPException(status_code=400, detail="잘못된 패치 범위입니다.")
+        parts.append(units[pos * 2:start * 2])
+        parts.append(value.encode("utf-16-le", "surrogatepass"))
+        pos = end
+    parts.append(units[pos * 2:])
+    result = b"".join(parts).decode("utf-16-le", "surrogatepass")
+    try:
+        result.encode("utf-8")
+    except UnicodeEncodeError:
+        # 서로게이트 쌍 중간을 자른 패치
+        raise HTTPException(status_code=400, detail="잘못된 패치 범위입니다.")
+    return result
+
+
+@router.patch("/{post_id}/autosave")
+def autosave_post(post_id: int, body: AutosaveBody, db=Depends(get_db), current_user=Depends(get_current_user)):
+    """자동 저장. 기준 본문(base_hash)에 대한 패치만 받아 메모리에 합치고, 연속 요청은 모아서 본문 컬럼만 지연 반영.
+    기준이 서버 본문과 다르면 409 → 클라이언트는 두 필드를 value로 보내 재동기화. 태그·첨부·temp 자산 이동은 전체 저장(PUT)에서."""
+    fields = (body.content_html, body.content_json)
+    with autosave_buffer.editing(post_id) as session:
+        if session is not None and body.base_hash and session.content_hash == body.base_hash:
+            base_html, base_json, stored_hash = session.content_html, session.content_json, session.stored_hash
+        else:
+            row = db.execute(
+                text("SELECT content_html, content_json, content_hash FROM posts WHERE id = :id"), {"id": post_id}
+            ).fetchone()
+            if not row:
+                raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
+            base_html, base_json, stored_hash = row[0], row[1], row[2]
+            resync = all(f is not None and f.ops is None for f in fields)
+            # 기준: 저장된 본문 그대로(파생·경로 치환 후)의 해시 = 글 조회 응답의 autosave_base_hash.
+            # posts.content_hash는 저장 요청 본문 기준이라 파생으로 본문이 바뀐 글에서는 맞지 않음
+            verified = bool(body.base_hash) and _content_hash(base_html, base_json) == body.base_hash
+            if not resync and not verified:
+                raise HTTPException(status_code=409, detail="기준 본문이 서버와 다릅니다. 전체 본문으로 다시 저장하세요.")
+        content_html = base_html if body.content_html is None else _apply_autosave_field(base_html, body.content_html)
+        content_json = base_json if body.content_json is None else _apply_autosave_field(base_json, body.content_json)
+        content_hash = _content_hash(content_html, content_json)
+        autosave_buffer.stage(post_id, content_html, content_json, content_hash, stored_hash)
+    return {"id": post_id, "content_hash": content_hash}
+
+
+def _write_autosave(db, post_id: int, session) -> bool:
+    """자동 저장 반영 (autosave_buffer flush 스레드): 본문·파생 컬럼만 UPDATE, 본문 참조 자산·리비전 기록.
+    마지막으로 알고 있는 content_hash가 그대로일 때만 반영 (그 사이 전체 저장이 있었으면 False)."""
+    content_html, derived = _derive_content(db, session.content_html)
+    result = db.execute(
+        text(f"""
+            UPDATE posts SET {', '.join(f'{c} = :{c}' for c in _POST_CONTENT_COLUMNS)}, updated_at = UTC_TIMESTAMP()
+            WHERE id = :id AND content_hash <=> :stored_hash
         """),
         {
             "id": post_id,
-            "title": (body.title or "제목 없음").strip(),
-            "slug": slug,
-            "status": body.status or "DRAFT",
-            "published_at": store_published,
-            "category_id": body.category_id,
-            "prefix_id": body.prefix_id,
-            "thumbnail_asset_id": body.thumbnail_asset_id,
-            "content_html": body.content_html,
-            "content_json": body.content_json,
+            "stored_hash": session.stored_hash,
+            "content_html": content_html,
+            "content_json": session.content_json,
+            "content_hash": session.content_hash,
+            **derived.columns(),
         },
     )
-    db.execute(text("DELETE FROM post_tags WHERE post_id = :id"), {"id": post_id})
-    if body.post_tags:
-        for tid in body.post_tags:
-            if not tid:
-                continue
-            db.execute(
-                text("INSERT INTO post_tags (post_id, tag_id) VALUES (:pid, :tid)"),
-                {"pid": post_id, "tid": tid},
-            )
-    db.execute(text("DELETE FROM post_attachments WHERE post_id = :id"), {"id": post_id})
-    if body.attachment_asset_ids:
-        for idx, aid in enumerate(body.attachment_asset_ids):
-            if not aid:
-                continue
-            db.execute(
-                text("INSERT INTO post_attachments (post_id, asset_id, sort_order) VALUES (:pid, :aid, :ord)"),
-                {"pid": post_id, "aid": aid, "ord": idx},
-            )
-    upload_dir = Path(UPLOAD_DIR)
-    _relocate_post_temp_asset(body.thumbnail_asset_id, post_id, db, upload_dir)
-    for aid in body.attachment_asset_ids or []:
-        if aid:
-            _relocate_post_temp_asset(aid, post_id, db, upload_dir)
-    _relocate_post_content_temp_assets(post_id, body.content_html, db, upload_dir)
-    # 본문 내 이미지 URL도 temp → 게시물ID로 갱신
-    db.execute(
-        text("UPDATE posts SET content_html = REPLACE(content_html, '/temp/', :pid_slash), content_json = REPLACE(COALESCE(content_json, ''), '/temp/', :pid_slash) WHERE id = :id"),
-        {"pid_slash": f"/{post_id}/", "id": post_id},
-    )
+    if not result.rowcount:
+        db.rollback()
+        return False
+    title = db.execute(text("SELECT title FROM posts WHERE id = :id"), {"id": post_id}).scalar()
+    sync_post_asset_refs(db, post_id, {aid for aid, _ in resolve_assets(db, extract_upload_paths(content_html))})
+    record_revision(db, post_id, title, content_html, session.content_json, session.content_hash)
+    _store_encoded_content(db, post_id, content_html, session.content_hash)
     db.commit()
-    return {"id": post_id, "slug": slug}
+    response_cache.invalidate("posts")
+    _sync_post_indexes(db, post_id)
+    return True
+
+
+autosave_buffer.set_writer(_write_autosave)
+
+
+def _refresh_post_images(db, content_hash: str) -> None:
+    """이미지 파생본 기록 후 (image_variants 기록 스레드): 이 내용의 자산을 참조하는 글 본문 <img>만 다시 작성.
+    본문 내용 변경이 아니므로 updated_at·리비전 유지, 그 사이 저장이 있었으면(content_hash 변경) 건너뜀."""
+    rows = db.execute(
+        text("""
+            SELECT DISTINCT p.id, p.content_html, p.content_hash
+            FROM post_asset_refs r
+            JOIN assets a ON a.id = r.asset_id
+            JOIN posts p ON p.id = r.post_id
+            WHERE a.content_hash = :h
+        """),
+        {"h": content_hash},
+    ).fetchall()
+    changed = False
+    for post_id, content_html, stored_hash in rows:
+        new_html = apply_responsive_images(db, content_html)
+        if new_html == content_html:
+            continue
+        result = db.execute(
+            text("""
+                UPDATE posts SET content_html = :content_html, updated_at = updated_at
+                WHERE id = :id AND content_hash <=> :stored_hash
+            """),
+            {"id": post_id, "content_html": new_html, "stored_hash": stored_hash},
+        )
+        if result.rowcount:
+            _store_encoded_content(db, post_id, new_html, stored_hash)
+            changed = True
+    db.commit()
+    if changed:
+        response_cache.invalidate("posts")
+
+
+image_variants.set_refresher(_refresh_post_images)
 
 
 @router.delete("/{post_id}")
@@ -493,4 +1423,7 @@ def delete_post(post_id: int, db=Depends(get_db)):
         raise HTTPException(status_code=404, detail="글을 찾을 수 없습니다.")
     db.execute(text("DELETE FROM posts WHERE id = :id"), {"id": post_id})
     db.commit()
+    autosave_buffer.discard(post_id)
+    response_cache.invalidate("posts")
+    _sync_post_indexes(db, post_id)
     return None
@@ -4,11 +4,15 @@ import shutil
 import traceback
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel, field_validator
 from sqlalchemy import text
 
 from apps.api.core import get_db, UPLOAD_DIR
+from apps.api.core.cache import cache_key, response_cache
+from apps.api.core.config import IMAGE_LOGO_WIDTH, IMAGE_THUMBNAIL_WIDTH
+from apps.api.core.http_cache import apply_validators, is_not_modified, make_etag, not_modified_response
+from apps.api.core.image_variants import image_variants, variant_paths
 from apps.api.routers.auth import get_current_user
 
 router = APIRouter(tags=["projects"])
@@ -73,8 +77,36 @@ def _file_path_to_url(fp) -> str | None:
 
 
 @router.get("")
-def list_projects(db=Depends(get_db)):
-    """프로젝트 목록 (sort_order 순). 링크·태그·썸네일 URL 포함."""
+def list_projects(request: Request, response: Response, db=Depends(get_db)):
+    """프로젝트 목록 (sort_order 순). 링크·태그·썸네일 URL 포함. 응답 캐시 사용. 목록 ETag로 304 지원."""
+    etag = response_cache.get_or_set(cache_key("projects.validator"), ("projects",), lambda: _projects_etag(db))
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    items = response_cache.get_or_set(cache_key("projects.list"), ("projects",), lambda: _query_projects(db))
+    apply_validators(response, etag)
+    return items
+
+
+def _projects_etag(db) -> str:
+    """목록 validator: 개수·최종 수정일 + 행별 표시 컬럼(sort_order 포함)·링크·태그 라벨 해시.
+    updated_at은 초 단위라 같은 초 안의 두 수정·순서 변경도 구분하도록 행 내용까지 해시."""
+    row = db.execute(
+        text("""
+            SELECT COUNT(*), MAX(updated_at),
+                   COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', id, updated_at, sort_order, title, description, start_date,
+                                                    end_date, notion_url, website_url, detail_bullets, is_pinned,
+                                                    thumbnail_asset_id, logo_asset_id))), 0),
+                   (SELECT COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', project_id, id, link_name, link_url, sort_order))), 0)
+                    FROM project_links),
+                   (SELECT COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', project_id, sort_order, name))), 0)
+                    FROM project_tag_labels)
+            FROM projects
+        """)
+    ).fetchone()
+    return make_etag("projects.list", *row, image_variants.generation)
+
+
+def _query_projects(db):
     try:
         rows = db.execute(
             text("""
@@ -102,6 +134,9 @@ def list_projects(db=Depends(get_db)):
             )
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
+    # 썸네일·로고: 표시 폭에 맞는 파생본 (없으면 원본)
+    thumbs = variant_paths(db, {r[12] for r in rows}, IMAGE_THUMBNAIL_WIDTH)
+    logos = variant_paths(db, {r[13] for r in rows if len(r) > 13}, IMAGE_LOGO_WIDTH)
     items = []
     for r in rows:
         pid = r[0]
@@ -117,8 +152,8 @@ def list_projects(db=Depends(get_db)):
         except Exception:
             tag_rows = []
         tag_list = [{"name": x[0]} for x in tag_rows]
-        thumb_path = _file_path_to_url(r[12])
-        logo_path = _file_path_to_url(r[13]) if len(r) > 13 else None
+        thumb_path = _file_path_to_url(thumbs.get(r[12], r[12]))
+        logo_path = _file_path_to_url(logos.get(r[13], r[13])) if len(r) > 13 else None
         raw_bullets = r[9] if len(r) > 9 else None
         try:
             detail_bullets = json.loads(raw_bullets) if raw_bullets else []
@@ -257,6 +292,7 @@ def _create_project_impl(body: ProjectBody, db):
                     {"pid": new_id, "ord": index, "name": name},
                 )
         db.commit()
+        response_cache.invalidate("projects")
         return {"id": new_id}
     except HTTPException:
         db.rollback()
@@ -293,7 +329,8 @@ def update_project(project_id: int, body: ProjectBody, db=Depends(get_db)):
                 start_date = :start_date, end_date = :end_date,
                 thumbnail_asset_id = :thumbnail_asset_id, intro_image_asset_id = NULL,
                 logo_asset_id = :logo_asset_id, sort_order = :sort_order, notion_url = :notion_url,
-                website_url = :website_url, detail_bullets = :detail_bullets, is_pinned = :is_pinned
+                website_url = :website_url, detail_bullets = :detail_bullets, is_pinned = :is_pinned,
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = :id
         """),
         {
@@ -333,6 +370,7 @@ def update_project(project_id: int, body: ProjectBody, db=Depends(get_db)):
     _relocate_temp_asset(body.thumbnail_asset_id, project_id, db, upload_dir)
     _relocate_temp_asset(body.logo_asset_id, project_id, db, upload_dir)
     db.commit()
+    response_cache.invalidate("projects")
     return {"id": project_id}
 
 
@@ -349,6 +387,7 @@ def delete_project(project_id: int, db=Depends(get_db)):
         pass
     db.execute(text("DELETE FROM projects WHERE id = :id"), {"id": project_id})
     db.commit()
+    response_cache.invalidate("projects")
     return {"ok": True}
 
 
@@ -359,4 +398,5 @@ def reorder_projects(body: ReorderBody, db=Depends(get_db)):
         if pid:
             db.execute(text("UPDATE projects SET sort_order = :ord WHERE id = :id"), {"ord": idx, "id": pid})
     db.commit()
+    response_cache.invalidate("projects")
     return {"ok": True}
@@ -4,6 +4,7 @@ from pydantic import BaseModel
 from sqlalchemy import text
 
 from apps.api.core import get_db
+from apps.api.core.cache import cache_key, response_cache
 
 router = APIRouter(tags=["tags"])
 
@@ -14,7 +15,15 @@ class CreateTagRequest(BaseModel):
 
 @router.get("")
 def list_tags(used_in_posts: bool = False, db=Depends(get_db)):
-    """태그 목록. used_in_posts=True 시 PUBLISHED 포스트에 사용된 태그만, post_count 포함."""
+    """태그 목록. used_in_posts=True 시 PUBLISHED 포스트에 사용된 태그만, post_count 포함. 응답 캐시 사용."""
+    return response_cache.get_or_set(
+        cache_key("tags.list", used_in_posts=used_in_posts),
+        ("tags", "posts"),
+        lambda: _query_tags(db, used_in_posts),
+    )
+
+
+def _query_tags(db, used_in_posts: bool):
     if used_in_posts:
         rows = db.execute(
             text("""
@@ -48,6 +57,7 @@ def create_tag(body: CreateTagRequest, db=Depends(get_db)):
         {"name": name},
     )
     db.commit()
+    response_cache.invalidate("tags")
     new_row = db.execute(
         text("SELECT id, name FROM tags WHERE name = :name"),
         {"name": name},
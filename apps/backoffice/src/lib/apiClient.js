@@ -158,5 +158,28 @@ const apiClient = {
   },
 };
 
-export { getAccessToken, API_BASE, isDev, UPLOAD_URL };
+/**
+ * 업로드 전 해시 확인: 파일 SHA-256을 먼저 보내 같은 내용이 서버에 있으면 전송 없이 자산 등록.
+ * 등록되면 업로드 응답과 같은 형태({ id, url, original_name, sha256 }), 아니면 null → 호출부가 UPLOAD_URL로 전송.
+ * query: UPLOAD_URL과 같은 쿼리 문자열 ('?post_id=...' 등)
+ */
+async function uploadByHash(file, query = '') {
+  if (!window.crypto?.subtle || !file) return null;
+  try {
+    const digest = await window.crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+    const sha256 = Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('');
+    const res = await fetch(`${UPLOAD_URL}/by-hash${query}`, {
+      method: 'POST',
+      headers: getAuthHeaders(),
+      body: JSON.stringify({ sha256, filename: file.name || 'image.jpg', content_type: file.type || null }),
+      credentials: 'include',
+    });
+    if (!res.ok) return null;
+    return await res.json();
+  } catch (_) {
+    return null;
+  }
+}
+
+export { getAccessToken, API_BASE, isDev, UPLOAD_URL, uploadByHash };
 export default apiClient;
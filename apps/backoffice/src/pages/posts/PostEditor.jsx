@@ -19,7 +19,7 @@ import {
   DialogContentText,
   DialogActions,
 } from '@mui/material';
-import apiClient, { getAccessToken, API_BASE, UPLOAD_URL } from '../../lib/apiClient';
+import apiClient, { getAccessToken, API_BASE, UPLOAD_URL, uploadByHash } from '../../lib/apiClient';
 
 const ATTACH_ACCEPT = '.png,.jpg,.jpeg,.pdf,.ppt,.pptx,.hwp,.hwpx,.docx';
 const ATTACH_EXT_SET = new Set(['png', 'jpg', 'jpeg', 'pdf', 'ppt', 'pptx', 'hwp', 'hwpx', 'docx']);
@@ -195,11 +195,17 @@ export default function PostEditor({ isEdit = false, postId = null }) {
     }
   }, [isEdit, postId, loadPost]);
 
-  const handleEditorImageUpload = (blobInfo, progress) =>
-    new Promise((resolve, reject) => {
-      const file = blobInfo.blob();
+  const handleEditorImageUpload = async (blobInfo, progress) => {
+    const file = blobInfo.blob();
+    const pid = isEdit && postId ? String(postId) : 'temp';
+    const reused = await uploadByHash(file, `?post_id=${encodeURIComponent(pid)}`);
+    const reusedUrl = reused?.url ?? reused?.file_path;
+    if (reusedUrl) {
+      progress(100);
+      return toImageSrc(reusedUrl);
+    }
+    return new Promise((resolve, reject) => {
       const token = getAccessToken();
-      const pid = isEdit && postId ? String(postId) : 'temp';
       const fd = new FormData();
       fd.append('file', file, file.name || 'image.jpg');
 
@@ -233,6 +239,7 @@ export default function PostEditor({ isEdit = false, postId = null }) {
 
       xhr.send(fd);
     });
+  };
 
   const handleTitleChange = (e) => setForm((f) => ({ ...f, title: e.target.value }));
 
@@ -266,19 +273,22 @@ export default function PostEditor({ isEdit = false, postId = null }) {
     for (const file of files) {
       if (!file.type?.startsWith('image/')) continue;
       try {
-        const fd = new FormData();
-        fd.append('file', file, file.name || 'image.jpg');
-        const res = await fetch(`${UPLOAD_URL}?post_id=${encodeURIComponent(pid)}`, {
-          method: 'POST',
-          headers: token ? { Authorization: `Bearer ${token}` } : {},
-          body: fd,
-          credentials: 'include',
-        });
-        if (!res.ok) {
-          const body = await res.json().catch(() => ({}));
-          throw new Error(body?.detail || '이미지 업로드에 실패했습니다.');
+        let data = await uploadByHash(file, `?post_id=${encodeURIComponent(pid)}`);
+        if (!data) {
+          const fd = new FormData();
+          fd.append('file', file, file.name || 'image.jpg');
+          const res = await fetch(`${UPLOAD_URL}?post_id=${encodeURIComponent(pid)}`, {
+            method: 'POST',
+            headers: token ? { Authorization: `Bearer ${token}` } : {},
+            body: fd,
+            credentials: 'include',
+          });
+          if (!res.ok) {
+            const body = await res.json().catch(() => ({}));
+            throw new Error(body?.detail || '이미지 업로드에 실패했습니다.');
+          }
+          data = await res.json();
         }
-        const data = await res.json();
         const url = data.url ?? data.file_path ?? data.file_url;
         if (url) {
           const src = toImageSrc(url);
@@ -309,19 +319,22 @@ export default function PostEditor({ isEdit = false, postId = null }) {
           setSaveError(`파일 크기는 10MB 이하여야 합니다: ${file.name}`);
           continue;
         }
-        const formData = new FormData();
-        formData.append('file', file);
-        const response = await fetch(UPLOAD_URL, {
-          method: 'POST',
-          headers: token ? { Authorization: `Bearer ${token}` } : {},
-          body: formData,
-          credentials: 'include',
-        });
-        if (!response.ok) {
-          const errBody = await response.json().catch(() => ({}));
-          throw new Error(errBody.detail || '업로드에 실패했습니다.');
+        let result = await uploadByHash(file);
+        if (!result) {
+          const formData = new FormData();
+          formData.append('file', file);
+          const response = await fetch(UPLOAD_URL, {
+            method: 'POST',
+            headers: token ? { Authorization: `Bearer ${token}` } : {},
+            body: formData,
+            credentials: 'include',
+          });
+          if (!response.ok) {
+            const errBody = await response.json().catch(() => ({}));
+            throw new Error(errBody.detail || '업로드에 실패했습니다.');
+          }
+          result = await response.json();
         }
-        const result = await response.json();
         const id = result?.id != null ? Number(result.id) : null;
         const original_name = result?.original_name || file.name;
         if (id && id > 0) {
@@ -10,7 +10,7 @@ import {
   IconButton,
 } from '@mui/material';
 import { Delete as DeleteIcon, ArrowUpward, ArrowDownward } from '@mui/icons-material';
-import apiClient, { getAccessToken, API_BASE, UPLOAD_URL } from '../../lib/apiClient';
+import apiClient, { getAccessToken, API_BASE, UPLOAD_URL, uploadByHash } from '../../lib/apiClient';
 
 const TITLE_MAX = 20;
 const DESC_MAX = 30;
@@ -119,10 +119,13 @@ export default function ProjectForm({ isEdit = false, projectId = null }) {
   }, [isEdit, projectId, loadProject]);
 
   const uploadAsset = async (file, kind) => {
+    const query = `?folder=projects&post_id=${encodeURIComponent(projectIdOrTemp)}`;
+    const reused = await uploadByHash(file, query);
+    if (reused?.id != null) return Number(reused.id);
     const token = getAccessToken();
     const fd = new FormData();
     fd.append('file', file, file.name || 'image.jpg');
-    const url = `${UPLOAD_URL}?folder=projects&post_id=${encodeURIComponent(projectIdOrTemp)}`;
+    const url = `${UPLOAD_URL}${query}`;
     const res = await fetch(url, {
       method: 'POST',
       headers: token ? { Authorization: `Bearer ${token}` } : {},
@@ -49,7 +49,11 @@ async function cachedGet(path, ttl = DEFAULT_TTL) {
   return promise;
 }
 
-export async function fetchPosts({ page = 1, per_page = 5, category_id, tag_id, q } = {}) {
+/**
+ * 공개 글 목록.
+ * @param {{ view?: 'card', fields?: string[] }} opts - view='card'면 썸네일 URL·요약·태그 포함, fields로 응답 필드 제한
+ */
+export async function fetchPosts({ page = 1, per_page = 5, category_id, tag_id, q, view, fields } = {}) {
   const params = new URLSearchParams();
   params.set('page', String(page));
   params.set('per_page', String(per_page));
@@ -57,6 +61,8 @@ export async function fetchPosts({ page = 1, per_page = 5, category_id, tag_id,
   if (category_id != null && category_id !== '') params.set('category_id', String(category_id));
   if (tag_id != null && tag_id !== '') params.set('tag_id', String(tag_id));
   if (q && q.trim()) params.set('q', q.trim());
+  if (view) params.set('view', view);
+  if (fields && fields.length) params.set('fields', fields.join(','));
   return request(`/api/posts?${params}`);
 }
 
@@ -76,6 +82,15 @@ export async function fetchPostNeighbors(postId) {
   return request(`/api/posts/${postId}/neighbors`);
 }
 
+/**
+ * 글 상세 페이지 모델 (글 + 태그·첨부 + 이전/다음 글)을 한 번에. { post, prev, next }
+ * @param {{ content?: boolean }} opts - content=false면 본문 제외 (메타만 필요할 때)
+ */
+export async function fetchPostPage(postId, { content = true } = {}) {
+  const q = content ? '' : '?content=false';
+  return request(`/api/posts/${postId}/page${q}`);
+}
+
 /** 소개 페이지 메시지 목록 (sort_order 순). */
 export async function fetchAboutMessages() {
   return cachedGet('/api/about/messages');
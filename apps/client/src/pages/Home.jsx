@@ -3,10 +3,12 @@ import { Link, useSearchParams, useLocation } from 'react-router-dom';
 import { ChevronLeft, ChevronRight, ChevronsLeft, ChevronsRight } from 'lucide-react';
 import Card from '../components/Card';
 import SharedLayout from '../components/SharedLayout';
-import { fetchPosts, fetchCategories, fetchTags } from '../api';
+import { fetchPosts, fetchCategories, fetchTags, getStaticUrl } from '../api';
 import { formatDate } from '../../../../shared/utils/date';
 
 const PER_PAGE = 5;
+// 목록 카드가 그리는 필드만 요청 (view=card)
+const LIST_CARD_FIELDS = ['title', 'published_at', 'created_at', 'category_id', 'category_name', 'excerpt', 'thumbnail_url'];
 
 function useIsMobile() {
   const [isMobile, setIsMobile] = useState(() => typeof window !== 'undefined' && window.innerWidth < 768);
@@ -64,6 +66,8 @@ export default function Home() {
         category_id: categoryId || undefined,
         tag_id: tagId || undefined,
         q: q || undefined,
+        view: 'card',
+        fields: LIST_CARD_FIELDS,
       }),
     ])
       .then(([categoriesData, postsRes]) => {
@@ -139,10 +143,10 @@ export default function Home() {
                       <Card
                         listMode
                         title={post.title}
-                        summary={post.summary && String(post.summary).trim() !== String(post.title || '').trim() ? post.summary : ''}
+                        summary={post.excerpt && String(post.excerpt).trim() !== String(post.title || '').trim() ? post.excerpt : ''}
                         meta={meta}
                         categories={categories}
-                        thumbnail={post.thumbnail}
+                        thumbnail={post.thumbnail_url ? getStaticUrl(post.thumbnail_url) : undefined}
                         className="group-hover/card:-translate-y-0.5 group-hover/card:shadow-md"
                       />
                     </Link>
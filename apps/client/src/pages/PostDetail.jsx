@@ -3,7 +3,7 @@ import { Link, useParams } from 'react-router-dom';
 import { Paperclip, Download } from 'lucide-react';
 import SharedLayout from '../components/SharedLayout';
 // import AdBanner from '../components/AdBanner';
-import { fetchPost, fetchPostNeighbors, fetchCategories, getStaticUrl } from '../api';
+import { fetchPostPage, fetchCategories, getStaticUrl } from '../api';
 import { processContentHtml } from '../utils/imageUtils';
 import { useTheme } from '../ThemeContext';
 import { VITE_UTTERANCES_REPO } from '../config';
@@ -34,7 +34,7 @@ export default function PostDetail() {
   const [categories, setCategories] = useState([]);
   const bodyRef = useRef(null);
 
-  // 포스트 상세 + 이전/다음글 + 카테고리 병렬 로드
+  // 포스트 상세(본문·이전/다음글 포함, /page 한 번) + 카테고리 병렬 로드
   useEffect(() => {
     if (!postId) return;
     let cancelled = false;
@@ -42,14 +42,13 @@ export default function PostDetail() {
     setError(null);
     const pid = Number(postId);
     Promise.all([
-      fetchPost(pid),
-      fetchPostNeighbors(pid),
+      fetchPostPage(pid),
       fetchCategories({ tree: true }).catch(() => []),
     ])
-      .then(([postData, neighborsData, categoriesData]) => {
+      .then(([pageData, categoriesData]) => {
         if (cancelled) return;
-        setPost(postData);
-        setNeighbors({ prev: neighborsData?.prev ?? null, next: neighborsData?.next ?? null });
+        setPost(pageData.post);
+        setNeighbors({ prev: pageData.prev ?? null, next: pageData.next ?? null });
         setCategories(Array.isArray(categoriesData) ? categoriesData : []);
       })
       .catch((err) => {
@@ -0,0 +1,159 @@
+"""
+기존 업로드 이미지의 파생본(폭별 리사이즈 + AVIF/WebP/JPEG) 생성과 글 본문 <img> srcset 재작성 백필.
+사용: python scripts/backfill_image_variants.py [--all] [--workers N] [--skip-posts]
+  1) 이미지 자산 중 크기 미기록(image_width IS NULL)만 처리 (--all: 전부 재생성, 폭·포맷 설정 변경 시)
+     content_hash가 없는 이전 업로드는 파일 SHA-256을 계산해 채움 (파일 위치는 그대로)
+     같은 내용은 1회만 생성, 프로세스 풀에서 Pillow 변환
+  2) 글 본문 재작성 (apply_responsive_images) + 사전 압축본 갱신, updated_at 유지
+환경변수: .env (MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE, MYSQL_PORT), UPLOAD_DIR, IMAGE_VARIANT_*
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from sqlalchemy import text
+
+    from apps.api.core import image_render
+    from apps.api.core.compression import encode_stored
+    from apps.api.core.config import IMAGE_VARIANT_FORMATS, IMAGE_VARIANT_WIDTHS, UPLOAD_DIR
+    from apps.api.core.database import SessionLocal
+    from apps.api.core.image_variants import IMAGE_EXTENSIONS, apply_responsive_images, record_variants, variant_dir
+except ImportError:
+    print("pip install -r requirements.txt 후 실행하세요.")
+    sys.exit(1)
+
+_HASH_CHUNK = 1024 * 1024
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _pending_images(db, redo_all: bool) -> dict[str, str]:
+    """처리할 이미지 {content_hash: file_path}. content_hash가 없는 자산은 계산해 기록."""
+    where_pending = "" if redo_all else " AND image_width IS NULL"
+    rows = db.execute(text(f"SELECT id, file_path, content_hash FROM assets WHERE 1 = 1{where_pending}")).fetchall()
+    pending: dict[str, str] = {}
+    hashed = 0
+    for asset_id, file_path, content_hash in rows:
+        file_path = (file_path or "").replace("\\", "/")
+        if file_path.rsplit(".", 1)[-1].lower() not in IMAGE_EXTENSIONS:
+            continue
+        full_path = Path(UPLOAD_DIR) / file_path
+        if not full_path.is_file():
+            continue
+        if not content_hash:
+            content_hash = _file_sha256(full_path)
+            db.execute(
+                text("UPDATE assets SET content_hash = :h WHERE id = :id"),
+                {"h": content_hash, "id": asset_id},
+            )
+            hashed += 1
+        pending.setdefault(content_hash, file_path)
+    db.commit()
+    print(f"이미지 {len(pending)}개 (해시 새로 계산 {hashed}건)")
+    return pending
+
+
+def _render_all(db, pending: dict[str, str], workers: int) -> None:
+    started = time.monotonic()
+    done = failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                image_render.render_variants,
+                str(Path(UPLOAD_DIR) / file_path),
+                str(Path(UPLOAD_DIR) / variant_dir(content_hash)),
+                IMAGE_VARIANT_WIDTHS,
+                IMAGE_VARIANT_FORMATS,
+            ): content_hash
+            for content_hash, file_path in pending.items()
+        }
+        for future in as_completed(futures):
+            content_hash = futures[future]
+            try:
+                record_variants(db, content_hash, future.result())
+                db.commit()
+                done += 1
+            except Exception as e:
+                db.rollback()
+                failed += 1
+                print(f"  실패 {pending[content_hash]}: {e}")
+            if (done + failed) % 50 == 0:
+                print(f"  {done + failed}/{len(futures)} ({time.monotonic() - started:.1f}s)")
+    print(f"파생본 생성 완료: {done}건, 실패 {failed}건, {time.monotonic() - started:.1f}s")
+
+
+def _rewrite_posts(db, batch_size: int) -> None:
+    started = time.monotonic()
+    last_id = 0
+    changed = 0
+    while True:
+        rows = db.execute(
+            text("SELECT id, content_html, content_hash FROM posts WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {"last_id": last_id, "limit": batch_size},
+        ).fetchall()
+        if not rows:
+            break
+        for post_id, content_html, content_hash in rows:
+            new_html = apply_responsive_images(db, content_html)
+            if new_html == content_html:
+                continue
+            # updated_at 유지: 본문 내용 변경이 아닌 이미지 속성 보강
+            db.execute(
+                text("UPDATE posts SET content_html = :html, updated_at = updated_at WHERE id = :id"),
+                {"html": new_html, "id": post_id},
+            )
+            if content_hash:
+                data = (new_html or "").encode("utf-8")
+                encoded = encode_stored(data)
+                db.execute(
+                    text("""
+                        UPDATE post_content_encoded SET html_gzip = :gz, html_br = :br, html_bytes = :n
+                        WHERE post_id = :id AND content_hash = :h
+                    """),
+                    {"gz": encoded["gzip"], "br": encoded["br"], "n": len(data), "id": post_id, "h": content_hash},
+                )
+            changed += 1
+        db.commit()
+        last_id = rows[-1][0]
+    print(f"글 본문 재작성: {changed}건, {time.monotonic() - started:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="이미지 파생본·본문 srcset 백필")
+    parser.add_argument("--all", action="store_true", help="크기가 기록된 이미지도 파생본 재생성")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--skip-posts", action="store_true", help="글 본문 재작성 생략")
+    args = parser.parse_args()
+
+    if not image_render.AVAILABLE:
+        print("Pillow가 없습니다: pip install -r requirements.txt 후 실행하세요.")
+        sys.exit(1)
+    db = SessionLocal()
+    try:
+        pending = _pending_images(db, args.all)
+        if pending:
+            _render_all(db, pending, args.workers)
+        if not args.skip_posts:
+            _rewrite_posts(db, args.batch_size)
+    finally:
+        db.close()
+    print("API 서버를 재시작하거나 응답 캐시 TTL 경과 후 목록 썸네일에 반영됩니다.")
+
+
+if __name__ == "__main__":
+    main()
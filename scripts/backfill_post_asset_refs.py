@@ -0,0 +1,63 @@
+"""
+기존 글의 본문 자산 참조(post_asset_refs) 백필.
+사용: python scripts/backfill_post_asset_refs.py [--batch-size 500]
+id 순 배치로 content_html을 읽어 /static/uploads/ 경로를 추출하고, 배치 단위로 assets 조회·참조 갱신 후 커밋.
+글 저장 시에는 API가 참조를 갱신하므로, 도입 이전 글·대량 가져오기 글에만 필요합니다.
+환경변수: .env (MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE, MYSQL_PORT)
+"""
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from sqlalchemy import text
+
+    from apps.api.core.asset_refs import extract_upload_paths, resolve_assets, sync_post_asset_refs
+    from apps.api.core.database import SessionLocal
+except ImportError:
+    print("pip install -r requirements.txt 후 실행하세요.")
+    sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="post_asset_refs 백필")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    started = time.monotonic()
+    done = 0
+    refs = 0
+    last_id = 0
+    try:
+        while True:
+            rows = db.execute(
+                text("SELECT id, content_html FROM posts WHERE id > :last_id ORDER BY id LIMIT :limit"),
+                {"last_id": last_id, "limit": args.batch_size},
+            ).fetchall()
+            if not rows:
+                break
+            paths_by_post = {r[0]: extract_upload_paths(r[1]) for r in rows}
+            id_by_path = {
+                fp.replace("\\", "/"): aid
+                for aid, fp in resolve_assets(db, set().union(*paths_by_post.values()))
+            }
+            for post_id, paths in paths_by_post.items():
+                asset_ids = {id_by_path[p] for p in paths if p in id_by_path}
+                sync_post_asset_refs(db, post_id, asset_ids)
+                refs += len(asset_ids)
+            db.commit()
+            last_id = rows[-1][0]
+            done += len(rows)
+            print(f"  {done}건 처리 (참조 {refs}개, 마지막 id={last_id}, {time.monotonic() - started:.1f}s)")
+    finally:
+        db.close()
+    print(f"완료: 글 {done}건, 참조 {refs}개, {time.monotonic() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+기존 글의 본문 파생값(요약·단어/글자 수·읽기 시간·목차, 제목 앵커 id) 백필.
+사용: python scripts/backfill_post_derived.py [--all] [--batch-size 200] [--workers N]
+  기본: 파생값이 비어 있는 글(reading_minutes IS NULL)만 처리
+  --all: 전체 글 재계산 (파생 규칙 변경 시)
+id 순 배치로 읽어 프로세스 풀에서 HTML 파싱, 배치마다 executemany UPDATE + 커밋.
+본문이 바뀐 글(제목 앵커 id 추가)은 content_hash를 다시 계산하고 사전 압축본(post_content_encoded)도 갱신
+  → 본문 API가 이전 압축본을 보내지 않고, 본문·글 ETag도 바뀜 (updated_at은 유지)
+환경변수: .env (MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE, MYSQL_PORT)
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from sqlalchemy import text
+
+    from apps.api.core.content_derive import derive_content
+    from apps.api.core.database import SessionLocal
+    from apps.api.routers.posts import _content_hash, _store_encoded_content
+except ImportError:
+    print("pip install -r requirements.txt 후 실행하세요.")
+    sys.exit(1)
+
+
+def _derive_row(row: tuple) -> dict:
+    post_id, content_html, content_json, content_hash = row
+    new_html, derived = derive_content(content_html)
+    if new_html != content_html or not content_hash:
+        content_hash = _content_hash(new_html, content_json)
+    return {"id": post_id, "content_html": new_html, "content_hash": content_hash, **derived.columns()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="posts 본문 파생값 백필")
+    parser.add_argument("--all", action="store_true", help="파생값이 있는 글도 재계산")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    where_pending = "" if args.all else " AND reading_minutes IS NULL"
+    db = SessionLocal()
+    started = time.monotonic()
+    done = 0
+    last_id = 0
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            while True:
+                rows = db.execute(
+                    text(f"""
+                        SELECT id, content_html, content_json, content_hash FROM posts
+                        WHERE id > :last_id{where_pending}
+                        ORDER BY id LIMIT :limit
+                    """),
+                    {"last_id": last_id, "limit": args.batch_size},
+                ).fetchall()
+                if not rows:
+                    break
+                chunksize = max(1, len(rows) // (args.workers * 4))
+                updates = list(pool.map(_derive_row, [tuple(r) for r in rows], chunksize=chunksize))
+                # updated_at 유지: 본문 내용 변경이 아닌 파생값 보강 (캐시 검증은 바뀐 content_hash로)
+                db.execute(
+                    text("""
+                        UPDATE posts SET content_html = :content_html, content_hash = :content_hash, excerpt = :excerpt,
+                               word_count = :word_count, char_count = :char_count, reading_minutes = :reading_minutes,
+                               toc_json = :toc_json, updated_at = updated_at
+                        WHERE id = :id
+                    """),
+                    updates,
+                )
+                old_hashes = {r[0]: r[3] for r in rows}
+                for u in updates:
+                    if u["content_hash"] != old_hashes[u["id"]]:
+                        _store_encoded_content(db, u["id"], u["content_html"], u["content_hash"])
+                db.commit()
+                last_id = rows[-1][0]
+                done += len(rows)
+                print(f"  {done}건 처리 (마지막 id={last_id}, {time.monotonic() - started:.1f}s)")
+    finally:
+        db.close()
+    print(f"완료: {done}건, {time.monotonic() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+글 저장 1회당 쓰기 증폭 측정 (대용량 본문 회귀 벤치마크).
+사용: python scripts/bench_post_write_amplification.py [--sizes 100,1000,4000] [--images 20] [--repeat 3] [--legacy]
+  --sizes: 본문 HTML 크기(KB) 목록
+  --images: 본문에 넣을 temp 이미지 URL 개수 (생성 시 경로 치환 대상)
+  --legacy: 이전 방식(저장 후 REPLACE UPDATE로 본문 재기록) 비용도 함께 측정
+posts 라우터의 create_post/update_post를 직접 호출하고, 저장 전후 MySQL 전역 카운터 차이를 본문 크기로 나눠 출력.
+  redo: Innodb_os_log_written, data: Innodb_data_written, binlog: 현재 binlog 위치 이동량(비활성 시 -)
+전역 카운터이므로 다른 부하가 없는 개발 DB에서 실행. 생성한 글(slug bench-wa-*)은 종료 시 삭제.
+환경변수: .env (MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE, MYSQL_PORT)
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from sqlalchemy import text
+
+    from apps.api.core.database import SessionLocal
+    from apps.api.routers.posts import PostBody, create_post, delete_post, update_post
+except ImportError:
+    print("pip install -r requirements.txt 후 실행하세요.")
+    sys.exit(1)
+
+_STATUS_VARS = ("Innodb_os_log_written", "Innodb_data_written")
+
+
+def _binlog_pos(db) -> int | None:
+    for stmt in ("SHOW BINARY LOG STATUS", "SHOW MASTER STATUS"):
+        try:
+            row = db.execute(text(stmt)).fetchone()
+        except Exception:
+            db.rollback()
+            continue
+        return int(row[1]) if row else None
+    return None
+
+
+def _snapshot(db) -> dict:
+    rows = db.execute(
+        text("SHOW GLOBAL STATUS WHERE Variable_name IN ('Innodb_os_log_written', 'Innodb_data_written')")
+    ).fetchall()
+    snap = {r[0]: int(r[1]) for r in rows}
+    snap["binlog"] = _binlog_pos(db)
+    return snap
+
+
+def _delta(before: dict, after: dict) -> dict:
+    out = {k: after.get(k, 0) - before.get(k, 0) for k in _STATUS_VARS}
+    if before["binlog"] is not None and after["binlog"] is not None and after["binlog"] >= before["binlog"]:
+        out["binlog"] = after["binlog"] - before["binlog"]
+    else:
+        out["binlog"] = None
+    return out
+
+
+def _measure(fn) -> tuple[dict, float]:
+    db = SessionLocal()
+    try:
+        before = _snapshot(db)
+        db.commit()
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        after = _snapshot(db)
+        db.commit()
+    finally:
+        db.close()
+    return _delta(before, after), elapsed
+
+
+def _make_html(size_kb: int, images: int, marker: str) -> str:
+    para = f"<p>{marker} 쓰기 증폭 측정용 문단입니다. The quick brown fox jumps over the lazy dog.</p>\n"
+    img = '<p><img src="/static/uploads/images/posts/2024/01/01/temp/bench-{}.png" alt=""></p>\n'
+    parts = ["<h2>벤치마크</h2>\n"]
+    target = size_kb * 1024
+    size = len(parts[0].encode())
+    n = 0
+    while size < target:
+        chunk = img.format(n // 50) if images and n % 50 == 0 and n // 50 < images else para
+        parts.append(chunk)
+        size += len(chunk.encode())
+        n += 1
+    return "".join(parts)
+
+
+def _fmt(delta: dict, payload: int) -> str:
+    cols = []
+    for key, label in (("Innodb_os_log_written", "redo"), ("Innodb_data_written", "data"), ("binlog", "binlog")):
+        value = delta[key]
+        if value is None:
+            cols.append(f"{label} -")
+        else:
+            cols.append(f"{label} {value / 1024:,.0f}KB (x{value / payload:.2f})")
+    return ", ".join(cols)
+
+
+def _call(fn, *args, **kwargs):
+    db = SessionLocal()
+    try:
+        return fn(*args, db=db, **kwargs)
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="글 저장 쓰기 증폭 벤치마크")
+    parser.add_argument("--sizes", default="100,1000,4000", help="본문 크기(KB), 쉼표 구분")
+    parser.add_argument("--images", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy", action="store_true", help="저장 후 REPLACE UPDATE 재기록 비용도 측정")
+    args = parser.parse_args()
+
+    created: list[int] = []
+    try:
+        for size_kb in [int(s) for s in args.sizes.split(",") if s.strip()]:
+            print(f"[본문 {size_kb}KB, temp 이미지 {args.images}개]")
+            for i in range(args.repeat):
+                html = _make_html(size_kb, args.images, uuid.uuid4().hex)
+                payload = len(html.encode())
+                body = PostBody(title=f"bench {size_kb}KB", slug=f"bench-wa-{uuid.uuid4().hex[:12]}", content_html=html)
+                result: dict = {}
+                delta, elapsed = _measure(lambda: result.update(_call(create_post, body)))
+                post_id = result["id"]
+                created.append(post_id)
+                print(f"  #{i + 1} 생성       {elapsed * 1000:7.1f}ms  {_fmt(delta, payload)}")
+
+                # 본문 변경 저장 (temp 경로 포함)
+                edited_html = html + f"<p>{uuid.uuid4().hex}</p>\n"
+                edited = body.model_copy(update={"slug": result["slug"], "content_html": edited_html})
+                delta, elapsed = _measure(lambda: _call(update_post, post_id, edited))
+                print(f"  #{i + 1} 수정       {elapsed * 1000:7.1f}ms  {_fmt(delta, payload)}")
+
+                # 변경 없는 저장 (본문 해시 동일 → 쓰기 없음 기대)
+                delta, elapsed = _measure(lambda: _call(update_post, post_id, edited))
+                print(f"  #{i + 1} 변경 없음  {elapsed * 1000:7.1f}ms  {_fmt(delta, payload)}")
+
+                if args.legacy:
+                    # 이전 방식 재현: temp 경로가 남은 본문을 저장한 뒤 REPLACE UPDATE로 본문 전체를 다시 기록
+                    db = SessionLocal()
+                    try:
+                        db.execute(
+                            text("UPDATE posts SET content_html = :html WHERE id = :id"),
+                            {"html": edited_html, "id": post_id},
+                        )
+                        db.commit()
+                    finally:
+                        db.close()
+
+                    def _legacy_replace():
+                        db = SessionLocal()
+                        try:
+                            db.execute(
+                                text("UPDATE posts SET content_html = REPLACE(content_html, '/temp/', :pid_slash), content_json = REPLACE(COALESCE(content_json, ''), '/temp/', :pid_slash) WHERE id = :id"),
+                                {"pid_slash": f"/{post_id}/", "id": post_id},
+                            )
+                            db.commit()
+                        finally:
+                            db.close()
+
+                    delta, elapsed = _measure(_legacy_replace)
+                    print(f"  #{i + 1} 이전 REPLACE 추가분 {elapsed * 1000:7.1f}ms  {_fmt(delta, payload)}")
+    finally:
+        for post_id in created:
+            try:
+                _call(delete_post, post_id)
+            except Exception as e:
+                print(f"  정리 실패 id={post_id}: {e}")
+
+
+if __name__ == "__main__":
+    main()
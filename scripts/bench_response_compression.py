@@ -0,0 +1,113 @@
+"""
+응답 압축 벤치마크: 요청당 CPU 시간과 전송 바이트 비교.
+사용: python scripts/bench_response_compression.py [--post-id N | --size-kb 500] [--repeat 50] [--url http://localhost:1217]
+  본문 원본: --post-id면 DB의 posts.content_html, 아니면 --size-kb 크기의 합성 HTML
+  방식별 요청당 CPU(process_time)·바이트 출력
+    identity      무압축 전송
+    gzip/br 동적  요청마다 압축 (CompressionMiddleware 수준)
+    gzip/br 사전  저장 시 1회 압축한 바이트 전송 (post_content_encoded, 요청당 압축 없음)
+  --url: 실행 중인 API의 /api/posts/{id}/content, /api/posts/{id}를 Accept-Encoding별로 호출해 실제 전송 바이트·응답 시간 측정
+환경변수(--post-id 사용 시): .env (MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE, MYSQL_PORT)
+"""
+import argparse
+import os
+import sys
+import time
+import urllib.request
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from apps.api.core.compression import SUPPORTED_ENCODINGS, encode, encode_stored
+except ImportError:
+    print("pip install -r requirements.txt 후 실행하세요.")
+    sys.exit(1)
+
+
+def _load_html(post_id: int | None, size_kb: int) -> str:
+    if post_id is not None:
+        from sqlalchemy import text
+
+        from apps.api.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            html = db.execute(text("SELECT content_html FROM posts WHERE id = :id"), {"id": post_id}).scalar()
+        finally:
+            db.close()
+        if html is None:
+            print(f"글 id={post_id} 없음")
+            sys.exit(1)
+        return html
+    para = "<p>응답 압축 벤치마크용 문단입니다. The quick brown fox jumps over the lazy dog. {}</p>\n"
+    parts = ["<h2>벤치마크</h2>\n"]
+    i = 0
+    while sum(len(p) for p in parts) < size_kb * 1024:
+        parts.append(para.format(i))
+        i += 1
+    return "".join(parts)
+
+
+def _cpu_per_call(fn, repeat: int) -> float:
+    started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - started) / repeat
+
+
+def _local(html: str, repeat: int) -> None:
+    data = html.encode("utf-8")
+    stored_started = time.process_time()
+    stored = encode_stored(data)
+    stored_cpu = time.process_time() - stored_started
+    print(f"[로컬] 원본 {len(data):,} bytes, 반복 {repeat}회 (저장 시 1회 압축 CPU {stored_cpu * 1000:.1f}ms)")
+    print(f"  {'방식':<14}{'CPU/요청':>12}{'전송 bytes':>14}{'비율':>8}")
+    rows = [("identity", _cpu_per_call(lambda: bytes(data), repeat), len(data))]
+    for encoding in SUPPORTED_ENCODINGS:
+        out = encode(data, encoding)
+        rows.append((f"{encoding} 동적", _cpu_per_call(lambda: encode(data, encoding), repeat), len(out)))
+    for encoding in SUPPORTED_ENCODINGS:
+        blob = stored[encoding]
+        if blob is not None:
+            # 사전 압축: 요청 시에는 저장된 바이트를 그대로 전송 (복사 비용만)
+            rows.append((f"{encoding} 사전", _cpu_per_call(lambda: bytes(blob), repeat), len(blob)))
+    for name, cpu, size in rows:
+        print(f"  {name:<14}{cpu * 1000:>10.3f}ms{size:>14,}{size / len(data):>8.1%}")
+
+
+def _remote(base_url: str, post_id: int, repeat: int) -> None:
+    print(f"[서버] {base_url} 글 id={post_id}, 반복 {repeat}회")
+    print(f"  {'경로':<28}{'Accept-Encoding':<18}{'응답':>10}{'bytes':>12}{'평균 ms':>10}")
+    for path in (f"/api/posts/{post_id}/content", f"/api/posts/{post_id}"):
+        for accept in ("identity", "gzip", "br, gzip"):
+            size = 0
+            encoding = "-"
+            started = time.perf_counter()
+            for _ in range(repeat):
+                req = urllib.request.Request(base_url.rstrip("/") + path, headers={"Accept-Encoding": accept})
+                with urllib.request.urlopen(req) as res:
+                    body = res.read()
+                    size = len(body)
+                    encoding = res.headers.get("Content-Encoding") or "identity"
+            elapsed = (time.perf_counter() - started) / repeat
+            print(f"  {path:<28}{accept:<18}{encoding:>10}{size:>12,}{elapsed * 1000:>10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="응답 압축 벤치마크")
+    parser.add_argument("--post-id", type=int, default=None)
+    parser.add_argument("--size-kb", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--url", default=None, help="API 기준 URL (예: http://localhost:1217)")
+    args = parser.parse_args()
+
+    if args.url and args.post_id is None:
+        parser.error("--url 사용 시 --post-id 필요")
+    _local(_load_html(args.post_id, args.size_kb), args.repeat)
+    if args.url:
+        _remote(args.url, args.post_id, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
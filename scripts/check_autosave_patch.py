@@ -0,0 +1,89 @@
+"""
+자동 저장 패치 회귀 확인: 글 조회 응답으로 만든 첫 패치가 재동기화(409) 없이 적용되는지.
+사용: python scripts/check_autosave_patch.py
+  1) 제목(h2)이 있는 글 생성 → 저장 본문은 앵커 id가 붙어 요청 본문과 다름
+  2) 편집용 조회 응답(content_html, autosave_base_hash)으로 splice 패치 → 409가 아니어야 함
+  3) 응답 content_hash로 이어서 패치, 강제 flush 후 DB 본문에 두 패치가 모두 반영됐는지 확인
+posts 라우터 함수를 직접 호출. 생성한 글(slug check-autosave-*)은 종료 시 삭제. 실패 시 종료 코드 1.
+환경변수: .env (MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE, MYSQL_PORT)
+"""
+import os
+import sys
+import uuid
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from fastapi import HTTPException
+
+    from apps.api.core.autosave import autosave_buffer
+    from apps.api.core.database import SessionLocal
+    from apps.api.routers.posts import (
+        AutosaveBody,
+        AutosaveField,
+        PostBody,
+        _load_post,
+        autosave_post,
+        create_post,
+        delete_post,
+    )
+except ImportError:
+    print("pip install -r requirements.txt 후 실행하세요.")
+    sys.exit(1)
+
+
+def _utf16_len(s: str) -> int:
+    """JS 문자열 길이 (패치 인덱스 단위)."""
+    return len(s.encode("utf-16-le")) // 2
+
+
+def _append_patch(base_hash: str, html: str, addition: str) -> AutosaveBody:
+    end = _utf16_len(html)
+    return AutosaveBody(base_hash=base_hash, content_html=AutosaveField(ops=[(end, end, addition)]))
+
+
+def main() -> None:
+    db = SessionLocal()
+    post_id = None
+    try:
+        body = PostBody(
+            title="autosave check",
+            slug=f"check-autosave-{uuid.uuid4().hex[:12]}",
+            content_html="<h2>소개</h2>\n<p>자동 저장 확인용 본문입니다.</p>\n",
+        )
+        post_id = create_post(body, db=db)["id"]
+        loaded = _load_post(db, post_id, public=False)
+        if loaded["content_html"] == body.content_html:
+            print("주의: 저장 본문이 요청 본문과 같아 파생 차이를 확인하지 못함")
+
+        first, second = "<p>첫 패치</p>\n", "<p>둘째 패치</p>\n"
+        try:
+            result = autosave_post(
+                post_id, _append_patch(loaded["autosave_base_hash"], loaded["content_html"], first),
+                db=db, current_user=None,
+            )
+            result = autosave_post(
+                post_id, _append_patch(result["content_hash"], loaded["content_html"] + first, second),
+                db=db, current_user=None,
+            )
+        except HTTPException as e:
+            print(f"실패: 조회 응답 기준 패치가 거부됨 ({e.status_code} {e.detail})")
+            sys.exit(1)
+
+        autosave_buffer.flush(force=True)
+        db.rollback()  # 다른 세션이 반영한 본문을 새 트랜잭션에서 읽도록
+        saved = _load_post(db, post_id, public=False)["content_html"]
+        if first not in saved or second not in saved:
+            print("실패: 자동 저장 본문이 DB에 반영되지 않음")
+            sys.exit(1)
+        print("통과: 조회 응답 기준 패치 2회 적용·반영")
+    finally:
+        if post_id is not None:
+            autosave_buffer.discard(post_id)
+            delete_post(post_id, db=db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()